@@ -0,0 +1,34 @@
+import argparse
+import random
+import time
+from benchmarks.bench_test_report import make_report
+from test_report_generator.compare import compare_runs
+from test_report_generator.report import render_report
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark comparing two test report runs")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = make_report(args.rows, seed=0)
+    current = make_report(args.rows, seed=1)
+    # Drop some tickets and add new ones so every category is exercised
+    rng = random.Random(2)
+    current.test_results = current.test_results[args.rows // 50:] + [(f"NEW-{n}", "Bug", rng.choice(["Passed", "Fail"]), "High") for n in range(args.rows // 50)]
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        comparison = compare_runs(baseline.test_results, current.test_results, "baseline")
+        timings.append(time.perf_counter() - start)
+    print(f"compare_runs: {args.rows} rows, new failures {len(comparison.new_failures)}, fixes {len(comparison.fixes)}, "
+          f"flips {len(comparison.flips)}, unchanged {comparison.unchanged}, best {min(timings) * 1000:.1f} ms")
+
+    current.comparison = comparison
+    start = time.perf_counter()
+    render_report(current)
+    print(f"render_report with comparison: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
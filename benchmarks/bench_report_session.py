@@ -0,0 +1,32 @@
+import argparse
+import os
+import tempfile
+import time
+from benchmarks.bench_test_report import make_report
+from test_report_generator.session import save_session, load_session
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark saving and restoring a test report session")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    report = make_report(args.rows)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "session.json.gz")
+        save_timings = []
+        load_timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            save_session(report, path)
+            save_timings.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            restored = load_session(path)
+            load_timings.append(time.perf_counter() - start)
+        size = os.path.getsize(path)
+    assert restored.test_results == report.test_results
+    print(f"save_session: {args.rows} rows, {size / 1e6:.2f} MB, best {min(save_timings) * 1000:.1f} ms")
+    print(f"load_session: {args.rows} rows, best {min(load_timings) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
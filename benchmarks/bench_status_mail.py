@@ -0,0 +1,176 @@
+import argparse
+import base64
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import config_schema
+from config_schema import DEFAULT_CONFIG, load_tasks_file, save_tasks_file
+from daily_status_render import STATUS_COLORS, render_email_body, render_signature, append_signature
+from status_export import build_status_report, export_report
+from test_report_generator.report import render_report
+from benchmarks.bench_test_report import make_report
+
+DEFAULT_SIZES = "10,1000,100000"
+# Slower than this fraction over the baseline counts as a regression
+DEFAULT_TOLERANCE = 0.2
+# Differences below these are treated as noise, so sub-millisecond cases do not flap
+NOISE_FLOOR = {"best_ms": 1.0, "alloc_peak_mb": 0.5, "peak_rss_mb": 5.0}
+
+MAIN_PROJECTS = [f"Project {n}" for n in range(8)]
+SUB_PROJECTS = [f"Module {n}" for n in range(12)]
+TASK_TYPES = ["Normal", "Dev", "Bugfix", "Test"]
+LABELS = {"Urgent": "#FF0000", "Review": "#1E88E5", "Blocked": "#8E24AA"}
+
+def make_tasks(count, seed=0):
+    # Same shape as Json/tasks.json
+    rng = random.Random(seed)
+    tasks = []
+    for n in range(count):
+        task = {
+            "main_project": rng.choice(MAIN_PROJECTS),
+            "sub_project": rng.choice(SUB_PROJECTS),
+            "task": f"Task {n} for KSD-{1000 + n}, see https://example.com/browse/KSD-{1000 + n}",
+            "status": rng.choice(list(STATUS_COLORS)),
+            "task_type": rng.choice(TASK_TYPES)
+        }
+        if rng.random() < 0.3:
+            task["label"] = rng.choice(list(LABELS))
+        if rng.random() < 0.2:
+            task["comment"] = f"Follow-up {n}"
+        tasks.append(task)
+    return tasks
+
+def make_config():
+    return dict(DEFAULT_CONFIG, labels=LABELS, signature={"name": "Bench User", "mobile": "+1 555 0100", "email": "bench@example.com"},
+                email={"to": "team@example.com", "cc": "", "recipient": "Team"})
+
+def case_load_tasks(tasks, config, temp_dir):
+    path = os.path.join(temp_dir, "tasks.json")
+    save_tasks_file(path, tasks)
+
+    def run():
+        # Drop the schema cache entry so every run parses the file
+        config_schema._file_cache.pop(path, None)
+        return load_tasks_file(path)
+    return run
+
+def case_email_body(tasks, config, temp_dir):
+    return lambda: render_email_body(tasks, config)
+
+def case_signature(tasks, config, temp_dir):
+    logo_path = os.path.join(temp_dir, "logo.png")
+    with open(logo_path, "wb") as f:
+        f.write(os.urandom(64 * 1024))
+
+    def run():
+        with open(logo_path, "rb") as f:
+            return render_signature(config["signature"], base64.b64encode(f.read()).decode("utf-8"))
+    return run
+
+def case_export_text(tasks, config, temp_dir):
+    path = os.path.join(temp_dir, "status.txt")
+    return lambda: export_report(build_status_report(tasks, config), "text", path)
+
+def case_copy_html(tasks, config, temp_dir):
+    return lambda: append_signature(render_email_body(tasks, config), render_signature(config["signature"]))
+
+def case_test_report(tasks, config, temp_dir):
+    report = make_report(len(tasks))
+    return lambda: render_report(report)
+
+# name -> factory(tasks, config, temp_dir) returning the function to time; named after the EODLogic / report methods they stand for
+CASES = {
+    "load_tasks": case_load_tasks,
+    "generate_email_body": case_email_body,
+    "generate_signature": case_signature,
+    "export_text": case_export_text,
+    "generate_copy_html": case_copy_html,
+    "generate_report": case_test_report
+}
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_case(name, size, repeat):
+    # Runs in a fresh worker process so the peak RSS belongs to this case only
+    tasks = make_tasks(size)
+    config = make_config()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        run = CASES[name](tasks, config, temp_dir)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        run()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {"case": name, "size": size, "best_ms": min(timings) * 1000, "alloc_peak_mb": peak / 1e6, "peak_rss_mb": peak_rss_mb()}
+
+def result_key(result):
+    return f"{result['case']}/{result['size']}"
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if previous is None:
+            continue
+        for metric, floor in NOISE_FLOOR.items():
+            if result[metric] > previous[metric] * (1 + tolerance) and result[metric] - previous[metric] > floor:
+                regressions.append(f"{result_key(result)} {metric}: {previous[metric]:.2f} -> {result[metric]:.2f}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the status mail pipeline on synthetic task sets")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma separated task counts, e.g. 10,1000,1000000")
+    parser.add_argument("--cases", default=",".join(CASES), help="comma separated subset of " + ", ".join(CASES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", help="JSON file with earlier results to compare against")
+    parser.add_argument("--save-baseline", help="write these results to a JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    cases = [name for name in args.cases.split(",") if name]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=1, max_tasks_per_child=1) as executor:
+        for size in sizes:
+            # Keep the biggest sets from taking minutes per case
+            repeat = args.repeat if size <= 100000 else 1
+            for name in cases:
+                result = executor.submit(run_case, name, size, repeat).result()
+                results.append(result)
+                print(f"{name:<20} {size:>8} tasks  best {result['best_ms']:10.1f} ms  "
+                      f"alloc peak {result['alloc_peak_mb']:8.1f} MB  peak RSS {result['peak_rss_mb']:8.1f} MB", flush=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({result_key(result): result for result in results}, f, indent=4)
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import argparse
+import io
+import random
+import time
+from test_report_generator.report import TestReport, render_report, write_report
+
+TYPES = ["Bug", "Change Request", "Feature"]
+STATUSES = ["Passed", "Fail", "Blocked"]
+PRIORITIES = ["High", "Medium", "Low"]
+
+def make_report(rows, seed=0):
+    rng = random.Random(seed)
+    results = [(f"KSD-{1000 + n}", rng.choice(TYPES), rng.choice(STATUSES), rng.choice(PRIORITIES)) for n in range(rows)]
+    issues = [f"Issue {n}" for n in range(rows // 100)]
+    return TestReport(title="Nightly Regression", project_name="Benchmark", test_results=results, issues=issues,
+                      notes="Synthetic run", recommendations="None", conclusion="Done")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the test report renderer")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    report = make_report(args.rows)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        html_content = render_report(report)
+        timings.append(time.perf_counter() - start)
+    print(f"render_report: {args.rows} rows, {len(html_content) / 1e6:.1f} MB, best {min(timings) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    write_report(report, io.StringIO())
+    print(f"write_report (streamed): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import copy
+import json
+import os
+import re
+from recipients import recipients_from_config, build_recipients
+
+# Configuration File Paths
+DEFAULT_CONFIG_FILE = "config.json"
+DEFAULT_TASKS_FILE = "tasks.json"
+
+# Set the default persistent directory to STATUS MAIL FORMATTER/Json subdirectory
+DEFAULT_PERSISTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Json")
+DEFAULT_PERSISTENT_CONFIG_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, DEFAULT_CONFIG_FILE)
+DEFAULT_PERSISTENT_TASKS_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, DEFAULT_TASKS_FILE)
+
+# Default Configuration
+DEFAULT_CONFIG = {
+    "config_file_path": DEFAULT_PERSISTENT_CONFIG_PATH,
+    "tasks_file_path": DEFAULT_PERSISTENT_TASKS_PATH,
+    "logo_path": "",
+    "main_projects": {},
+    "task_types": ["Dev", "Bugfix", "Test"],
+    "labels": {},
+    "signature": {"name": "", "mobile": "", "email": ""},
+    "email": {"to": "", "cc": "", "recipient": "Team"},
+    "notification_time": "18:00",
+    "theme": "dark_default",
+    # main project -> {"to": ..., "cc": ...}; projects without an entry use "email"
+    "distribution_lists": {},
+    # Sources for "Harvest Activity": repositories are {"path", "main_project", "sub_project"}, jira_export is a
+    # CSV or JSON export, and jira_projects maps a Jira project key (e.g. "KSD") to {"main_project", "sub_project"}
+    "harvest": {"repositories": [], "jira_export": "", "jira_base_url": "", "jira_projects": {}}
+}
+
+# Bump these and append a step below whenever the file layout changes
+CONFIG_SCHEMA_VERSION = 3
+TASKS_SCHEMA_VERSION = 1
+
+HEX_COLOR_RE = re.compile(r"#[0-9A-Fa-f]{6}")
+TIME_RE = re.compile(r"([01]\d|2[0-3]):[0-5]\d")
+
+def is_hex_color(value):
+    return HEX_COLOR_RE.fullmatch(value) is not None
+
+def is_time(value):
+    return TIME_RE.fullmatch(value) is not None
+
+# (path, check, message) in the order SettingsWidget reports them
+CONFIG_VALIDATORS = [
+    (("notification_time",), is_time, "Notification time must be in HH:MM (24-hour) format (e.g., 18:00)."),
+    (("logo_path",), bool, "Logo path is required."),
+    (("signature", "name"), bool, "Signature name is required."),
+    (("signature", "email"), bool, "Signature email is required."),
+    (("email", "to"), bool, "To email addresses are required.")
+]
+
+def validate_config(config):
+    errors = []
+    for path, check, message in CONFIG_VALIDATORS:
+        value = config
+        for key in path:
+            value = value.get(key, "") if isinstance(value, dict) else ""
+        if not check(value):
+            errors.append(message)
+    for label, color in config.get("labels", {}).items():
+        if not is_hex_color(color):
+            errors.append(f"Label '{label}' must use a hex color (e.g., #FF0000).")
+    for entry in recipients_from_config(config).invalid:
+        errors.append(f"'{entry}' is not a valid email address.")
+    for project, entry in config.get("distribution_lists", {}).items():
+        for address in build_recipients(entry.get("to", ""), entry.get("cc", "")).invalid:
+            errors.append(f"'{address}' in the {project} distribution list is not a valid email address.")
+    return errors
+
+TASK_FIELDS = frozenset(("main_project", "sub_project", "task", "status", "task_type", "label", "comment"))
+
+class TaskValidator:
+    # Built once per batch; projects, statuses, task types and labels become sets so each task is
+    # checked with constant-time lookups however large the configuration is
+    def __init__(self, config, statuses):
+        self.sub_projects = {project: frozenset(subs) for project, subs in config["main_projects"].items()}
+        self.statuses = frozenset(statuses)
+        self.task_types = frozenset(("Normal", *config["task_types"]))
+        self.labels = frozenset(config["labels"])
+
+    def validate(self, task):
+        # Returns an error message, or None for a task the form could have produced
+        if not isinstance(task, dict):
+            return "Task must be an object."
+        unknown = task.keys() - TASK_FIELDS
+        if unknown:
+            return f"Unknown task fields: {', '.join(sorted(unknown))}."
+        # Tasks may come from another process, so types are checked before any set lookup
+        for field in sorted(TASK_FIELDS):
+            if field in task and not isinstance(task[field], str):
+                return f"Task field '{field}' must be a string."
+        if not task.get("task", "").strip():
+            return "Task text is required."
+        sub_projects = self.sub_projects.get(task.get("main_project"))
+        if sub_projects is None:
+            return f"Unknown main project '{task.get('main_project')}'."
+        if task.get("sub_project") not in sub_projects:
+            return f"Unknown sub project '{task.get('sub_project')}' for {task['main_project']}."
+        if task.get("status", "Completed") not in self.statuses:
+            return f"Unknown status '{task.get('status')}'."
+        if task.get("task_type", "Normal") not in self.task_types:
+            return f"Unknown task type '{task.get('task_type')}'."
+        if task.get("label"):
+            if task["label"] not in self.labels:
+                return f"Unknown label '{task['label']}'."
+            if not task.get("comment"):
+                return "Comment is required when a label is selected."
+        return None
+
+def normalize_task(task):
+    # Same shape add_task() writes: defaults filled in, empty label/comment left out
+    normalized = {
+        "main_project": task["main_project"],
+        "sub_project": task["sub_project"],
+        "task": str(task["task"]).strip(),
+        "status": task.get("status") or "Completed",
+        "task_type": task.get("task_type") or "Normal"
+    }
+    for key in ("label", "comment"):
+        if task.get(key):
+            normalized[key] = str(task[key]).strip()
+    return normalized
+
+def _config_v1(config):
+    # Files written before versioning could miss top-level keys or signature/email fields
+    for key, value in DEFAULT_CONFIG.items():
+        if key not in config:
+            config[key] = copy.deepcopy(value)
+    for section in ("signature", "email"):
+        if not isinstance(config[section], dict):
+            config[section] = {}
+        for subkey, value in DEFAULT_CONFIG[section].items():
+            config[section].setdefault(subkey, value)
+    return config
+
+def _config_v2(config):
+    config.setdefault("distribution_lists", {})
+    return config
+
+def _config_v3(config):
+    config.setdefault("harvest", copy.deepcopy(DEFAULT_CONFIG["harvest"]))
+    return config
+
+def _tasks_v1(tasks):
+    for task in tasks:
+        if task.get("status") == "Pending":
+            task["status"] = "In Progress"
+        if "task_type" not in task:
+            task["task_type"] = "Normal"
+    return tasks
+
+# Ordered (target_version, step); each step runs once, when a file older than its version is read
+CONFIG_MIGRATIONS = [(1, _config_v1), (2, _config_v2), (3, _config_v3)]
+TASKS_MIGRATIONS = [(1, _tasks_v1)]
+
+def run_migrations(data, version, migrations):
+    for target, step in migrations:
+        if version < target:
+            data = step(data)
+            version = target
+    return data, version
+
+def migrate_config(config):
+    version = config.get("schema_version", 0)
+    if version >= CONFIG_SCHEMA_VERSION:
+        return config, False
+    config, version = run_migrations(config, version, CONFIG_MIGRATIONS)
+    config["schema_version"] = version
+    return config, True
+
+def migrate_tasks(data):
+    # The tasks file used to be a bare list; it is now {"schema_version": n, "tasks": [...]}
+    if isinstance(data, list):
+        tasks, version = data, 0
+    else:
+        tasks, version = data.get("tasks", []), data.get("schema_version", 0)
+    if version >= TASKS_SCHEMA_VERSION:
+        return tasks, False
+    tasks, _ = run_migrations(tasks, version, TASKS_MIGRATIONS)
+    return tasks, True
+
+# path -> ((mtime_ns, size), data); a file is parsed and migrated again only when it changes on disk
+_file_cache = {}
+
+def _file_key(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def _write_json(path, payload, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, indent=4)
+    os.replace(temp_path, path)
+    _file_cache[path] = (_file_key(path), copy.deepcopy(data))
+
+def _load_cached(path, migrate, envelope, write_back=True):
+    key = _file_key(path)
+    cached = _file_cache.get(path)
+    if cached and cached[0] == key:
+        return copy.deepcopy(cached[1])
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    data, changed = migrate(data)
+    if changed and write_back:
+        # Written back so the next start finds the file already at the current version
+        _write_json(path, envelope(data), data)
+    else:
+        _file_cache[path] = (key, copy.deepcopy(data))
+    return data
+
+def load_config_file(path):
+    config = _load_cached(path, migrate_config, lambda config: config)
+    return config if isinstance(config, dict) else {}
+
+def save_config_file(path, config):
+    config = dict(config, schema_version=CONFIG_SCHEMA_VERSION)
+    _write_json(path, config, config)
+
+def tasks_envelope(tasks):
+    return {"schema_version": TASKS_SCHEMA_VERSION, "tasks": tasks}
+
+def load_tasks_file(path, write_back=True):
+    # write_back=False migrates in memory only, for files that are just being read (e.g. exported)
+    return _load_cached(path, migrate_tasks, tasks_envelope, write_back)
+
+def save_tasks_file(path, tasks):
+    _write_json(path, tasks_envelope(tasks), tasks)
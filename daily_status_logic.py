@@ -1,50 +1,45 @@
-import json
 import os
 import webbrowser
-import tempfile
 from datetime import date
 import base64
 import logging
 import subprocess
-import urllib.parse
+from collections import deque
 import win32com.client
-from PySide6.QtWidgets import (QApplication, QMessageBox, QDialog, QSystemTrayIcon, QMenu, QFileDialog, QVBoxLayout)
+from PySide6.QtWidgets import (QApplication, QMessageBox, QDialog, QSystemTrayIcon, QMenu, QFileDialog, QVBoxLayout,
+                               QInputDialog, QProgressDialog)
 from PySide6.QtCore import Qt, QTimer, QDateTime
 from PySide6.QtGui import QCloseEvent, QIcon
 import win32clipboard
+from preview_server import get_preview_server, shutdown_preview_server
+from daily_status_render import (STATUS_COLORS, render_email_body, render_audience_mails, append_signature,
+                                 render_signature)
+from settings_store import get_settings_store, flush_settings_store
+from config_schema import (DEFAULT_CONFIG, DEFAULT_PERSISTENT_DIR, load_config_file,
+                           load_tasks_file, save_tasks_file, TaskValidator, normalize_task)
+from recipients import recipients_from_config, project_audiences
+from status_export import EXPORT_FORMATS, build_status_report, export_report, format_for_path, batch_export
+from render_cache import RenderCacheValidator, load_render_cache, save_render_cache
+from tracing import span, traced
+from timing_panel import TimingPanel
+from sampling_profiler import get_profiler
+from job_runner import JobRunner
+from live_reload import FileReloader, content_hash, changed_indices
+from harvesters import harvest
+from harvest_dialog import HarvestDialog
+from jira_cache import JIRA_CACHE_PATH, get_jira_resolver, task_jira_keys
 
-# Configuration File Paths
-DEFAULT_CONFIG_FILE = "config.json"
-DEFAULT_TASKS_FILE = "tasks.json"
-
-# Set the default persistent directory to STATUS MAIL FORMATTER/Json subdirectory
-DEFAULT_PERSISTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Json")
 if not os.path.exists(DEFAULT_PERSISTENT_DIR):
     os.makedirs(DEFAULT_PERSISTENT_DIR)
 
-DEFAULT_PERSISTENT_CONFIG_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, DEFAULT_CONFIG_FILE)
-DEFAULT_PERSISTENT_TASKS_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, DEFAULT_TASKS_FILE)
-
-# Default Configuration
-DEFAULT_CONFIG = {
-    "config_file_path": DEFAULT_PERSISTENT_CONFIG_PATH,
-    "tasks_file_path": DEFAULT_PERSISTENT_TASKS_PATH,
-    "logo_path": "",
-    "main_projects": {},
-    "task_types": ["Dev", "Bugfix", "Test"],
-    "labels": {},
-    "signature": {"name": "", "mobile": "", "email": ""},
-    "email": {"to": "", "cc": "", "recipient": "Team"},
-    "notification_time": "18:00",
-    "theme": "dark_default"
-}
-
-# Define STATUS_COLORS for the email format
-STATUS_COLORS = {
-    "Completed": "#5e8f59",
-    "In Progress": "#c06530",
-    "To Be Done": "#029de6",
-    "Blocked": "#ff0000"
+# File dialog filter per export format, see status_export.EXPORT_FORMATS
+EXPORT_FILTERS = {
+    "markdown": "Markdown Files (*.md)",
+    "pdf": "PDF Files (*.pdf)",
+    "docx": "Word Documents (*.docx)",
+    "json": "JSON Files (*.json)",
+    "html": "HTML Files (*.html)",
+    "text": "Text Files (*.txt)"
 }
 
 # Setup logging
@@ -52,38 +47,7 @@ logging.basicConfig(filename='notification.log', level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 # Utility Functions
-def load_config(config_path, default_path):
-    config_path = get_config_or_tasks_path(DEFAULT_CONFIG_FILE, config_path, default_path)
-    if not os.path.exists(config_path):
-        logging.info(f"No config file found at {config_path}, using default config")
-        return DEFAULT_CONFIG.copy(), config_path
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        for key, value in DEFAULT_CONFIG.items():
-            if key not in config:
-                config[key] = value
-        for subkey in DEFAULT_CONFIG["signature"]:
-            if subkey not in config["signature"]:
-                config["signature"][subkey] = DEFAULT_CONFIG["signature"][subkey]
-        for subkey in DEFAULT_CONFIG["email"]:
-            if subkey not in config["email"]:
-                config["email"][subkey] = DEFAULT_CONFIG["email"][subkey]
-        logging.info(f"Loaded config: email={config['email']}, cc={config['email']['cc']}")
-        return config, config_path
-    except Exception as e:
-        logging.error(f"Error loading config: {e}")
-        print(f"Error loading config: {e}")
-        return DEFAULT_CONFIG.copy(), config_path
-
-def save_config(config, config_path):
-    try:
-        os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
-    except Exception as e:
-        QMessageBox.critical(None, "Save Config Error", f"Failed to save configuration:\n{e}")
-
+@traced("encode_image_base64")
 def encode_image_base64(image_path):
     try:
         with open(image_path, "rb") as f:
@@ -94,9 +58,7 @@ def encode_image_base64(image_path):
 
 def preview_email_html(html_content):
     try:
-        with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html', encoding='utf-8') as f:
-            f.write(html_content)
-            webbrowser.open('file://' + os.path.realpath(f.name))
+        get_preview_server().show("mail", html_content)
     except Exception as e:
         QMessageBox.critical(None, "Preview Error", f"Failed to preview email:\n{e}")
 
@@ -116,6 +78,7 @@ def get_config_or_tasks_path(filename, user_specified_path, default_path):
             pass
         return default_path
 
+@traced("set_clipboard_html")
 def set_clipboard_html(html_content):
     html_bytes = html_content.encode('utf-8')
     html_length = len(html_bytes)
@@ -143,10 +106,37 @@ class EODLogic:
     def __init__(self, ui, parent=None):
         self.ui = ui
         self.parent = parent
-        self.config, self.config_path = load_config(DEFAULT_PERSISTENT_CONFIG_PATH, DEFAULT_PERSISTENT_CONFIG_PATH)
+        # Loaded once per process and shared with the Test Report Generator tab
+        self.settings = get_settings_store()
+        self.settings.register_defaults(DEFAULT_CONFIG)
+        # A config moved in the settings dialog is found through the file at the default path
+        moved_path = self.settings.get("config_file_path")
+        if moved_path and moved_path != self.settings.path and os.path.exists(moved_path):
+            self.settings.set_path(moved_path, load=True)
+        self.config = self.settings.values
+        self.config_path = self.settings.path
+        self.recipients = recipients_from_config(self.config)
         self.tasks = []
+        # Bumped on every task list change, so a late cache validation never overwrites edits
+        self.task_list_version = 0
+        self.restored_version = 0
+        self.render_cache_validator = None
         self.editing_index = None
         self.html_copied = False
+        self.timing_panel = None
+        # Jira key -> issue title, resolved in the background; rendering only reads this dict
+        self.jira_titles = {}
+        self.jira_requested = set()
+        self.jira_dump_path = None
+        # Blocking work (file I/O, rendering) runs here; results come back to the handlers below
+        self.jobs = JobRunner(parent=self.parent)
+        # Hash of the tasks last known to match the file, and of the tasks this instance wrote recently;
+        # together they tell our own writes, outside changes and conflicting local edits apart
+        self.synced_tasks_hash = content_hash([])
+        self.written_hashes = deque(maxlen=16)
+        self.reloader = FileReloader(self.jobs, self.parent)
+        self.reloader.changed.connect(self.on_file_changed)
+        self.reloader.failed.connect(lambda path, error: logging.error(f"Failed to reload {path}: {error}"))
 
         # Initialize system tray for notifications
         self.tray_icon = QSystemTrayIcon(self.parent)
@@ -154,10 +144,19 @@ class EODLogic:
         tray_menu = QMenu()
         show_action = tray_menu.addAction("Show Window")
         show_action.triggered.connect(self.parent.show)
+        timings_action = tray_menu.addAction("Timings")
+        timings_action.triggered.connect(self.show_timing_panel)
+        self.profile_action = tray_menu.addAction("Start Profiling")
+        self.profile_action.triggered.connect(self.toggle_profiling)
         exit_action = tray_menu.addAction("Exit")
         exit_action.triggered.connect(lambda: QApplication.quit())
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
+        QApplication.instance().aboutToQuit.connect(shutdown_preview_server)
+        QApplication.instance().aboutToQuit.connect(flush_settings_store)
+        QApplication.instance().aboutToQuit.connect(self.stop_render_cache_validator)
+        QApplication.instance().aboutToQuit.connect(get_profiler().stop)
+        QApplication.instance().aboutToQuit.connect(self.jobs.shutdown)
 
         # Setup timer for notifications
         self.notification_timer = QTimer(self.parent)
@@ -167,6 +166,10 @@ class EODLogic:
         # Connect UI signals
         self.connect_signals()
         self.update_config_widgets()
+        if not self.restore_render_cache():
+            self.update_preview_document()
+        self.watch_files()
+        self.refresh_jira_titles()
 
     def connect_signals(self):
         self.ui.settings_button.clicked.connect(self.show_settings_dialog)
@@ -174,6 +177,12 @@ class EODLogic:
         self.ui.sub_project.currentTextChanged.connect(self.validate_mandatory_fields)
         self.ui.task_entry.textChanged.connect(self.validate_mandatory_fields)
         self.ui.task_type.currentTextChanged.connect(self.validate_mandatory_fields)
+        self.ui.task_entry.textChanged.connect(self.update_draft_preview)
+        self.ui.comment_entry.textChanged.connect(self.update_draft_preview)
+        self.ui.label_combo.currentTextChanged.connect(self.update_draft_preview)
+        self.ui.task_type.currentTextChanged.connect(self.update_draft_preview)
+        self.ui.sub_project.currentTextChanged.connect(self.update_draft_preview)
+        self.ui.status_options.selection_changed.connect(self.update_draft_preview)
         self.ui.add_task_btn.clicked.connect(self.add_task)
         self.ui.move_up_button.clicked.connect(self.move_task_up)
         self.ui.move_down_button.clicked.connect(self.move_task_down)
@@ -182,11 +191,16 @@ class EODLogic:
         self.ui.clear_all_button.clicked.connect(self.clear_all_tasks)
         self.ui.save_tasks_button.clicked.connect(self.save_tasks)
         self.ui.load_tasks_button.clicked.connect(self.load_tasks)
+        self.ui.harvest_button.clicked.connect(self.harvest_activity)
         self.ui.export_html_button.clicked.connect(self.export_html)
         self.ui.copy_button.clicked.connect(self.copy_html_body)
         self.ui.export_text_button.clicked.connect(self.export_text)
+        self.ui.export_as_button.clicked.connect(self.export_as)
+        self.ui.batch_export_button.clicked.connect(self.batch_export_days)
         self.ui.preview_button.clicked.connect(self.preview_email)
         self.ui.open_outlook_button.clicked.connect(self.open_outlook_email)
+        self.ui.project_mails_button.clicked.connect(self.open_project_emails)
+        self.jobs.busy_changed.connect(self.update_button_states)
 
     def closeEvent(self, event: QCloseEvent):
         event.ignore()
@@ -216,11 +230,21 @@ class EODLogic:
             )
 
     def update_config(self, new_config, new_config_path):
-        self.config = new_config
-        self.config_path = new_config_path
+        self.settings.replace(new_config)
+        if new_config_path != self.settings.path:
+            # The file at the old path keeps pointing at the new one, so the next start finds it
+            self.settings.save()
+            self.settings.set_path(new_config_path)
+        self.settings.save()
+        self.config = self.settings.values
+        self.config_path = self.settings.path
+        self.recipients = recipients_from_config(self.config)
+        self.watch_files()
         logging.info(f"Updated config: cc={new_config['email']['cc']}")
         self.update_config_widgets()
         self.ui.apply_theme(self.config.get("theme", "dark_default"))
+        self.update_preview_document()
+        self.refresh_preview()
 
     def update_config_widgets(self):
         self.ui.main_project.clear()
@@ -257,21 +281,29 @@ class EODLogic:
 
     def update_button_states(self):
         state = not self.tasks
+        busy = self.jobs.is_running
         self.ui.move_up_button.setDisabled(state)
         self.ui.move_down_button.setDisabled(state)
         self.ui.edit_task_button.setDisabled(state)
         self.ui.delete_task_button.setDisabled(state)
         self.ui.clear_all_button.setDisabled(state)
         self.ui.save_tasks_button.setDisabled(state)
-        self.ui.export_html_button.setEnabled(not state)
-        self.ui.copy_button.setEnabled(not state)
-        self.ui.export_text_button.setEnabled(not state)
+        self.ui.load_tasks_button.setDisabled(busy("load_tasks"))
+        self.ui.harvest_button.setDisabled(busy("harvest"))
+        self.ui.export_html_button.setEnabled(not state and not busy("export"))
+        self.ui.copy_button.setEnabled(not state and not busy("copy"))
+        self.ui.export_text_button.setEnabled(not state and not busy("export"))
+        self.ui.export_as_button.setEnabled(not state and not busy("export"))
+        self.ui.batch_export_button.setEnabled(not busy("batch_export"))
+        self.ui.preview_button.setEnabled(not busy("preview"))
+        self.ui.open_outlook_button.setEnabled(not busy("email"))
+        self.ui.project_mails_button.setEnabled(not busy("project_email"))
 
     def add_task(self):
         main_project = self.ui.main_project.currentText()
         sub_project = self.ui.sub_project.currentText()
         task = self.ui.task_entry.text().strip()
-        status = next(status for status, radio in self.ui.status_group.items() if radio.isChecked())
+        status = self.ui.status_options.current()
         task_type = self.ui.task_type.currentText()
         label = self.ui.label_combo.currentText()
         comment = self.ui.comment_entry.text().strip()
@@ -309,6 +341,65 @@ class EODLogic:
         self.update_button_states()
         self.validate_mandatory_fields()
 
+    def add_tasks(self, tasks):
+        # Tasks from outside the form (later launches, the command channel); invalid ones are skipped
+        # and reported back. A batch is appended, rendered and saved once, not per task
+        validator = TaskValidator(self.config, STATUS_COLORS)
+        added = []
+        errors = []
+        for index, task in enumerate(tasks):
+            error = validator.validate(task)
+            if error:
+                errors.append((index, error))
+            else:
+                added.append(normalize_task(task))
+        if added:
+            self.tasks.extend(added)
+            self.ui.task_list.addItems([self.task_list_text(t) for t in added])
+            self.task_list_version += 1
+            self.update_button_states()
+            self.refresh_preview()
+            self.submit_save(lambda result: self.tray_icon.showMessage(
+                "Daily Status Mail Formatter",
+                f"Added {len(added)} task(s)",
+                QSystemTrayIcon.Information,
+                2000
+            ))
+        for index, error in errors:
+            logging.warning(f"Rejected task {index + 1} of {len(tasks)}: {error}")
+        return len(added), errors
+
+    def harvest_activity(self):
+        harvest_config = self.config.get("harvest", {})
+        if not harvest_config.get("repositories") and not harvest_config.get("jira_export"):
+            QMessageBox.information(self.parent, "Harvest Activity",
+                                    "No git repositories or Jira export configured.\nAdd them under \"harvest\" in config.json.")
+            return
+        if self.jobs.is_running("harvest"):
+            return
+        config = {"harvest": harvest_config}
+        self.jobs.submit(lambda job: harvest(config), tag="harvest", on_result=self.show_harvest_proposals,
+                         on_error=lambda error: QMessageBox.critical(self.parent, "Harvest Error", f"Failed to harvest activity:\n{error}"))
+
+    def show_harvest_proposals(self, result):
+        proposals, errors = result
+        for source, error in errors:
+            logging.warning(f"Harvest skipped {source}: {error}")
+        existing = {t["task"] for t in self.tasks}
+        proposals = [p for p in proposals if p["task"] not in existing]
+        if not proposals:
+            details = "".join(f"\n{source}: {error}" for source, error in errors)
+            QMessageBox.information(self.parent, "Harvest Activity", f"No new activity found for today.{details}")
+            return
+        dialog = HarvestDialog(proposals, errors, self.parent)
+        if dialog.exec() != QDialog.Accepted:
+            return
+        added, rejected = self.add_tasks(dialog.selected_tasks())
+        if rejected:
+            # Mostly proposals whose repository or Jira project is mapped to a project that is not configured
+            details = "\n".join(f"{index + 1}: {error}" for index, error in rejected)
+            QMessageBox.warning(self.parent, "Harvest Activity", f"Added {added} task(s); {len(rejected)} could not be added:\n{details}")
+
     def edit_task(self):
         if self.ui.task_list.currentRow() < 0:
             QMessageBox.warning(self.parent, "Selection Error", "Please select a task to edit.")
@@ -319,7 +410,7 @@ class EODLogic:
         self.update_sub_project_combo()
         self.ui.sub_project.setCurrentText(task["sub_project"])
         self.ui.task_entry.setText(task["task"])
-        self.ui.status_group[task["status"]].setChecked(True)
+        self.ui.status_options.select(task["status"])
         self.ui.task_type.setCurrentText("" if task["task_type"] == "Normal" else task["task_type"])
         self.ui.label_combo.setCurrentText(task.get("label", ""))
         self.ui.comment_entry.setText(task.get("comment", ""))
@@ -357,128 +448,310 @@ class EODLogic:
             self.save_tasks()
 
     def update_task_list(self):
+        self.task_list_version += 1
+        self.fill_task_list()
+        self.update_button_states()
+        self.refresh_preview()
+
+    def fill_task_list(self):
         self.ui.task_list.clear()
         for t in self.tasks:
-            label = t.get("label", "")
-            label_display = f" [{label}]" if label else ""
-            task_type_display = f" ({t['task_type']})" if t['task_type'] != "Normal" else ""
-            self.ui.task_list.addItem(f"[{t['main_project']}][{t['sub_project']}] {t['status']}{task_type_display}{label_display} - {t['task']}")
+            self.ui.task_list.addItem(self.task_list_text(t))
+
+    def task_list_text(self, t):
+        label = t.get("label", "")
+        label_display = f" [{label}]" if label else ""
+        task_type_display = f" ({t['task_type']})" if t['task_type'] != "Normal" else ""
+        return f"[{t['main_project']}][{t['sub_project']}] {t['status']}{task_type_display}{label_display} - {t['task']}"
+
+    def watch_files(self):
+        self.reloader.unwatch_all()
+        self.reloader.watch(self.config["tasks_file_path"], lambda path: load_tasks_file(path, write_back=False))
+        self.reloader.watch(self.config_path, load_config_file)
+
+    def on_file_changed(self, path, data):
+        if path == self.config["tasks_file_path"]:
+            self.reload_tasks(data)
+        elif path == self.config_path:
+            self.reload_config(data)
+
+    def reload_tasks(self, tasks):
+        digest = content_hash(tasks)
+        if tasks == self.tasks or digest in self.written_hashes:
+            # Our own write, or a file that already matches
+            return
+        local_edits = content_hash(self.tasks) != self.synced_tasks_hash or self.editing_index is not None
+        if local_edits:
+            answer = QMessageBox.question(
+                self.parent,
+                "Tasks Changed",
+                "The tasks file was changed outside the app while you have unsaved edits.\n"
+                "Load the tasks from the file and discard your edits?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if answer != QMessageBox.Yes:
+                logging.info("Kept local tasks over the changed tasks file")
+                return
+            self.editing_index = None
+            self.ui.add_task_btn.setText("➕ Add Task")
+        logging.info("Tasks file changed on disk, reloading")
+        self.apply_tasks(tasks)
+        self.synced_tasks_hash = digest
+
+    def apply_tasks(self, tasks):
+        # Only rows whose task changed are rewritten; the preview re-renders just the affected sections
+        indices = changed_indices(self.tasks, tasks)
+        self.tasks = tasks
+        if indices is None:
+            self.update_task_list()
+            return
+        for index in indices:
+            self.ui.task_list.item(index).setText(self.task_list_text(tasks[index]))
+        self.task_list_version += 1
         self.update_button_states()
+        self.refresh_preview()
 
-    def save_tasks(self):
-        try:
-            with open(self.config["tasks_file_path"], 'w', encoding='utf-8') as f:
-                json.dump(self.tasks, f, indent=4)
-            logging.info("Tasks saved successfully")
-            self.tray_icon.showMessage(
-                "Daily Status Mail Formatter",
-                "Tasks saved successfully!",
-                QSystemTrayIcon.Information,
-                2000
+    def reload_config(self, config):
+        if not self.settings.diff(config):
+            return
+        if self.settings.has_pending_write:
+            answer = QMessageBox.question(
+                self.parent,
+                "Settings Changed",
+                "The settings file was changed outside the app while you have unsaved settings.\n"
+                "Load the settings from the file and discard yours?",
+                QMessageBox.Yes | QMessageBox.No
             )
-            QMessageBox.information(self.parent, "Success", "Tasks saved successfully!")
+            if answer != QMessageBox.Yes:
+                return
+        changed = self.settings.reload(config)
+        logging.info(f"Settings file changed on disk, reloaded: {', '.join(sorted(changed))}")
+        self.config = self.settings.values
+        self.recipients = recipients_from_config(self.config)
+        if "tasks_file_path" in changed:
+            self.watch_files()
+        if {"main_projects", "labels", "task_types"} & set(changed):
+            self.update_config_widgets()
+        if "theme" in changed:
+            self.ui.apply_theme(self.config.get("theme", "dark_default"))
+        if {"labels", "email", "signature", "logo_path"} & set(changed):
+            self.update_preview_document()
+
+    def restore_render_cache(self):
+        # Shows the tasks and mail of the last session as they were rendered; the tasks file is checked in the background
+        tasks_path = self.config["tasks_file_path"]
+        entry = load_render_cache(tasks_path, self.config)
+        if entry is not None:
+            self.tasks = entry["tasks"]
+            self.synced_tasks_hash = content_hash(self.tasks)
+            self.fill_task_list()
+            self.update_button_states()
+            recipient = self.config.get("email", {}).get("recipient", "Team")
+            self.ui.preview_pane.restore(self.tasks, recipient, self.config["labels"], entry["signature"], entry["body"])
+        self.render_cache_validator = RenderCacheValidator(tasks_path, entry["tasks_hash"] if entry else None, self.parent)
+        # Queued, so the handlers run in the GUI thread
+        self.render_cache_validator.unchanged.connect(self.on_render_cache_unchanged, Qt.QueuedConnection)
+        self.render_cache_validator.stale.connect(self.on_render_cache_stale, Qt.QueuedConnection)
+        self.render_cache_validator.failed.connect(self.on_render_cache_failed, Qt.QueuedConnection)
+        self.render_cache_validator.finished.connect(self.render_cache_validator.deleteLater)
+        self.restored_version = self.task_list_version
+        self.render_cache_validator.start()
+        return entry is not None
+
+    def on_render_cache_unchanged(self):
+        self.render_cache_validator = None
+
+    def on_render_cache_stale(self, tasks):
+        self.render_cache_validator = None
+        if self.task_list_version != self.restored_version:
+            logging.info("Tasks file changed since the last session; keeping the edits made since startup")
+            return
+        logging.info("Render cache was stale, reloading tasks from file")
+        self.tasks = tasks
+        self.synced_tasks_hash = content_hash(tasks)
+        self.update_task_list()
+        tasks_path = self.config["tasks_file_path"]
+        self.jobs.submit(lambda job, tasks=list(tasks): self.store_render_cache(tasks), key=tasks_path, tag="render_cache",
+                         must_finish=True)
+
+    def stop_render_cache_validator(self):
+        if self.render_cache_validator is not None:
+            self.render_cache_validator.wait()
+
+    def on_render_cache_failed(self, message):
+        self.render_cache_validator = None
+        logging.error(f"Failed to validate render cache: {message}")
+
+    def store_render_cache(self, tasks=None):
+        # Also called from jobs, with the tasks as they were when the job was submitted
+        tasks = self.tasks if tasks is None else tasks
+        if not os.path.exists(self.config["tasks_file_path"]):
+            return
+        try:
+            save_render_cache(self.config["tasks_file_path"], tasks, self.generate_email_body(preview=True, tasks=tasks),
+                              self.generate_signature(preview=True), self.config)
         except Exception as e:
-            logging.error(f"Failed to save tasks: {e}")
-            QMessageBox.critical(self.parent, "Save Error", f"Failed to save tasks:\n{e}")
+            logging.error(f"Failed to write render cache: {e}")
+
+    def save_tasks(self):
+        self.submit_save(self.on_tasks_saved)
+
+    def submit_save(self, on_saved=None):
+        # Saves are keyed on the tasks file, so quick successive edits are written in order
+        tasks_path = self.config["tasks_file_path"]
+        self.synced_tasks_hash = content_hash(self.tasks)
+        self.written_hashes.append(self.synced_tasks_hash)
+        self.jobs.submit(self.write_tasks, tasks_path, list(self.tasks), key=tasks_path, tag="save_tasks",
+                         on_result=on_saved, on_error=self.on_tasks_save_failed, must_finish=True)
+
+    def write_tasks(self, job, tasks_path, tasks):
+        with span("save_tasks", tasks=len(tasks)):
+            save_tasks_file(tasks_path, tasks)
+            self.store_render_cache(tasks)
+
+    def on_tasks_saved(self, result):
+        logging.info("Tasks saved successfully")
+        self.tray_icon.showMessage(
+            "Daily Status Mail Formatter",
+            "Tasks saved successfully!",
+            QSystemTrayIcon.Information,
+            2000
+        )
+        QMessageBox.information(self.parent, "Success", "Tasks saved successfully!")
+
+    def on_tasks_save_failed(self, error):
+        logging.error(f"Failed to save tasks: {error}")
+        QMessageBox.critical(self.parent, "Save Error", f"Failed to save tasks:\n{error}")
 
     def load_tasks(self):
-        if os.path.exists(self.config["tasks_file_path"]):
-            try:
-                with open(self.config["tasks_file_path"], 'r', encoding='utf-8') as f:
-                    self.tasks = json.load(f)
-                for task in self.tasks:
-                    if task["status"] == "Pending":
-                        task["status"] = "In Progress"
-                    if "task_type" not in task:
-                        task["task_type"] = "Normal"
-                self.update_task_list()
-                logging.info("Tasks loaded successfully")
-                self.tray_icon.showMessage(
-                    "Daily Status Mail Formatter",
-                    "Tasks loaded successfully!",
-                    QSystemTrayIcon.Information,
-                    2000
-                )
-                QMessageBox.information(self.parent, "Success", "Tasks loaded successfully!")
-            except Exception as e:
-                logging.error(f"Failed to load tasks: {e}")
-                QMessageBox.critical(self.parent, "Load Error", f"Failed to load tasks:\n{e}")
-                self.tasks = []
-                self.update_task_list()
-        else:
+        tasks_path = self.config["tasks_file_path"]
+        if self.jobs.is_running("load_tasks"):
+            return
+        if not os.path.exists(tasks_path):
             QMessageBox.information(self.parent, "No Tasks", "No tasks file found. Starting with an empty task list.")
             self.tasks = []
             self.update_task_list()
-        self.update_button_states()
+            return
+        # Keyed like save_tasks, so a load never overtakes a pending save
+        self.jobs.submit(self.read_tasks, tasks_path, key=tasks_path, tag="load_tasks",
+                         on_result=self.on_tasks_loaded, on_error=self.on_tasks_load_failed)
 
-    def generate_email_body(self, preview=False):
-        today = date.today().strftime("%d/%m/%Y")
-        recipient = self.config.get("email", {}).get("recipient", "Team")
-        html = f"""<!DOCTYPE html><html><body style="font-family: Calibri; color: #000; background-color: #fff;">
-        <p>Hi {recipient},</p><p>Please find below today's task updates:</p>"""
-
-        grouped = {}
-        for task in self.tasks:
-            main_proj = task["main_project"]
-            sub_proj = task["sub_project"]
-            if main_proj not in grouped:
-                grouped[main_proj] = {}
-            grouped[main_proj].setdefault(sub_proj, [])
-            text = task["task"]
-            if "http" in text:
-                words = text.split()
-                text = " ".join(f'<a href="{word}">{word}</a>' if word.startswith("http") else word for word in words)
-            task_type_display = f" ({task['task_type']})" if task["task_type"] != "Normal" else ""
-            status_display = f"{task['status']}{task_type_display}"
-            status = f'<span style="color:{STATUS_COLORS[task["status"]]}">{status_display}</span>'
-            label = task.get("label", "")
-            comment = task.get("comment", "")
-            if "http" in comment:
-                words = comment.split()
-                comment = " ".join(f'<a href="{word}">{word}</a>' if word.startswith("http") else word for word in words)
-            label_part = f'<span style="color:{self.config["labels"][label]}">{label}</span>' if label else ""
-            comment_part = f'<span style="color:#666666">{comment}</span>' if comment else ""
-            label_comment = f"{label_part} - {comment_part}" if label and comment else label_part or comment_part
-            subpoints = f'<ul><li>{label_comment}</li></ul>' if label_comment else ""
-            grouped[main_proj][sub_proj].append((status, text, subpoints))
-
-        main_idx = 1
-        for main_proj in grouped:
-            html += f"<h4><u>{main_idx}. {main_proj}</u></h4>"
-            sub_idx = 1
-            for sub_proj in grouped[main_proj]:
-                html += f"<h5>{main_idx}.{sub_idx} {sub_proj}</h5><ul>"
-                for status, text, subpoints in grouped[main_proj][sub_proj]:
-                    html += f"<li>{status} - {text}{subpoints}</li>"
-                html += "</ul>"
-                sub_idx += 1
-            main_idx += 1
-
-        html += "</body></html>"
-        return html
+    def read_tasks(self, job, tasks_path):
+        # Legacy files are migrated once; an unchanged file is served from the schema cache
+        with span("load_tasks"):
+            return load_tasks_file(tasks_path)
+
+    def on_tasks_loaded(self, tasks):
+        self.tasks = tasks
+        self.synced_tasks_hash = content_hash(tasks)
+        self.update_task_list()
+        tasks_path = self.config["tasks_file_path"]
+        self.jobs.submit(lambda job, tasks=list(tasks): self.store_render_cache(tasks), key=tasks_path, tag="render_cache",
+                         must_finish=True)
+        logging.info("Tasks loaded successfully")
+        self.tray_icon.showMessage(
+            "Daily Status Mail Formatter",
+            "Tasks loaded successfully!",
+            QSystemTrayIcon.Information,
+            2000
+        )
+        QMessageBox.information(self.parent, "Success", "Tasks loaded successfully!")
+
+    def on_tasks_load_failed(self, error):
+        logging.error(f"Failed to load tasks: {error}")
+        QMessageBox.critical(self.parent, "Load Error", f"Failed to load tasks:\n{error}")
+        self.tasks = []
+        self.update_task_list()
+
+    @traced("generate_email_body")
+    def generate_email_body(self, preview=False, tasks=None):
+        return render_email_body(self.tasks if tasks is None else tasks, self.config, self.jira_titles)
 
+    @traced("generate_signature")
     def generate_signature(self, preview=True):
-        signature = self.config["signature"]
-        logo_base64 = encode_image_base64(self.config["logo_path"])
-        logo_img = f'<img src="data:image/png;base64,{logo_base64}" style="height:40px;">' if logo_base64 and preview else ''
-        signature_html = f"""
-        <p><br>--<br>Thanks & Regards,<br><b>{signature['name']}</b><br>
-        {logo_img}<br>
-        Caparizon Software Ltd<br>
-        D-75, 8th Floor, Infra Futura, Kakkanaad, Kochi - 682021<br>
-        Mobile: {signature['mobile']}<br>
-        Office: +91 - 9400359991<br>
-        <a href="mailto:{signature['email']}">{signature['email']}</a><br>
-        <a href="http://www.caparizon.com">www.caparizon.com</a>
-        </p>
-        """
-        return signature_html
-
-    def generate_copy_html(self):
-        html_body = self.generate_email_body(preview=False)
-        signature = self.generate_signature(preview=False)
-        full_html = html_body.rsplit("</body>", 1)[0] + signature + "</body></html>"
-        return full_html
+        # The logo is only embedded for previews
+        logo_base64 = encode_image_base64(self.config["logo_path"]) if preview else ""
+        return render_signature(self.config["signature"], logo_base64)
+
+    def generate_preview_html(self, tasks=None):
+        return append_signature(self.generate_email_body(preview=True, tasks=tasks), self.generate_signature(preview=True))
+
+    def update_preview_document(self):
+        recipient = self.config.get("email", {}).get("recipient", "Team")
+        self.ui.preview_pane.set_document(recipient, self.config["labels"], self.generate_signature(preview=True))
+
+    def update_draft_preview(self):
+        task = self.ui.task_entry.text().strip()
+        main_project = self.ui.main_project.currentText()
+        sub_project = self.ui.sub_project.currentText()
+        if not (task and main_project and sub_project):
+            self.ui.preview_pane.set_draft(None)
+            return
+        status = self.ui.status_options.current() or "Completed"
+        draft = {
+            "main_project": main_project,
+            "sub_project": sub_project,
+            "task": task,
+            "status": status,
+            "task_type": self.ui.task_type.currentText() or "Normal"
+        }
+        label = self.ui.label_combo.currentText()
+        comment = self.ui.comment_entry.text().strip()
+        if label:
+            draft["label"] = label
+        if comment:
+            draft["comment"] = comment
+        self.ui.preview_pane.set_draft(draft, self.editing_index)
+
+    def refresh_preview(self):
+        self.ui.preview_pane.set_tasks(self.tasks)
+        # Push the current mail to browser tabs that are already showing the preview
+        server = get_preview_server(create=False)
+        if server and server.is_live("mail"):
+            server.publish("mail", self.generate_preview_html())
+        self.refresh_jira_titles()
+
+    def refresh_jira_titles(self):
+        # Keys are resolved once per session (the disk cache keeps them across sessions) in batches on the
+        # job runner; the same export file feeds the harvester
+        dump_path = self.config.get("harvest", {}).get("jira_export", "")
+        if dump_path != self.jira_dump_path:
+            self.jira_dump_path = dump_path
+            self.jira_requested = set()
+        keys = [key for t in self.tasks for key in task_jira_keys(t) if key not in self.jira_requested]
+        if not keys:
+            return
+        self.jira_requested.update(keys)
+        self.jobs.submit(lambda job: get_jira_resolver(dump_path).resolve(keys), key=JIRA_CACHE_PATH, tag="jira",
+                         on_result=self.on_jira_titles,
+                         on_error=lambda error: self.on_jira_titles_failed(keys, error))
+
+    def on_jira_titles(self, titles):
+        if all(self.jira_titles.get(key) == title for key, title in titles.items()):
+            return
+        # A new dict, so renders already running on the job runner keep a consistent one
+        self.jira_titles = {**self.jira_titles, **titles}
+        self.ui.preview_pane.set_jira_titles(self.jira_titles)
+        self.refresh_preview()
+
+    def on_jira_titles_failed(self, keys, error):
+        # E.g. the export file is missing or being rewritten; the keys are looked up again on the next refresh
+        logging.warning(f"Failed to resolve Jira issues: {error}")
+        self.jira_requested.difference_update(keys)
+
+    def generate_copy_html(self, tasks=None):
+        return append_signature(self.generate_email_body(preview=False, tasks=tasks), self.generate_signature(preview=False))
+
+    def status_report(self):
+        return build_status_report(self.tasks, self.config)
+
+    def start_export(self, export_format, path, success_message, error_message):
+        # The report is built from a copy of the task list and written on the job runner
+        tasks = list(self.tasks)
+        self.jobs.submit(lambda job: export_report(build_status_report(tasks, self.config), export_format, path),
+                         key=path, tag="export",
+                         on_result=lambda result: QMessageBox.information(self.parent, "Success", success_message),
+                         on_error=lambda error: QMessageBox.critical(self.parent, "Export Error", f"{error_message}:\n{error}"))
 
     def export_html(self):
         if not self.tasks:
@@ -487,21 +760,24 @@ class EODLogic:
         path, _ = QFileDialog.getSaveFileName(self.parent, "Export HTML", f"Daily_Status_{date.today().strftime('%d%m%Y')}.html", "HTML Files (*.html)")
         if not path:
             return
-        try:
-            html_content = self.generate_copy_html()
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            QMessageBox.information(self.parent, "Success", "HTML exported successfully!")
-        except Exception as e:
-            QMessageBox.critical(self.parent, "Export Error", f"Failed to export HTML:\n{e}")
+        self.start_export("html", path, "HTML exported successfully!", "Failed to export HTML")
 
     def copy_html_body(self):
         if not self.tasks:
             QMessageBox.warning(self.parent, "No Tasks", "No tasks to copy.")
             return
+        if self.jobs.is_running("copy"):
+            return
+        tasks = list(self.tasks)
+        self.jobs.submit(lambda job: self.generate_email_body(preview=False, tasks=tasks), tag="copy",
+                         on_result=self.copy_rendered_body,
+                         on_error=lambda error: QMessageBox.critical(self.parent, "Copy Error", f"Failed to copy HTML body:\n{error}"))
+
+    def copy_rendered_body(self, html_content):
+        # The clipboard is only touched from the GUI thread
         try:
-            html_content = self.generate_email_body(preview=False)
-            set_clipboard_html(html_content)
+            with span("copy_html_body"):
+                set_clipboard_html(html_content)
             self.html_copied = True
             self.ui.open_outlook_button.setEnabled(True)
             QMessageBox.information(
@@ -520,84 +796,109 @@ class EODLogic:
         path, _ = QFileDialog.getSaveFileName(self.parent, "Export Text", f"Daily_Status_{date.today().strftime('%d%m%Y')}.txt", "Text Files (*.txt)")
         if not path:
             return
-        try:
-            text_content = f"Daily Status Update - {date.today().strftime('%d/%m/%Y')}\n\n"
-            text_content += "Hi Team,\n\n"
-            text_content += f"Please find the below status update for today ({date.today().strftime('%d%m%Y')}):\n\n"
-            for task in self.tasks:
-                label = task.get("label", "")
-                label_display = f" [{label}]" if label else ""
-                comment = task.get("comment", "")
-                comment_display = f" - {comment}" if comment else ""
-                text_content += f"[{task['main_project']}][{task['sub_project']}] {task['task']} - {task['status']} ({task['task_type']}){label_display}{comment_display}\n"
-            text_content += "\nThanks,\n"
-            signature = self.config["signature"]
-            text_content += f"{signature['name']}\n{signature['mobile']}\n{signature['email']}\n"
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(text_content)
-            QMessageBox.information(self.parent, "Success", "Text exported successfully!")
-        except Exception as e:
-            QMessageBox.critical(self.parent, "Export Error", f"Failed to export text:\n{e}")
+        self.start_export("text", path, "Text exported successfully!", "Failed to export text")
+
+    def export_as(self):
+        if not self.tasks:
+            QMessageBox.warning(self.parent, "No Tasks", "No tasks to export.")
+            return
+        filters = ";;".join(EXPORT_FILTERS.values())
+        path, selected_filter = QFileDialog.getSaveFileName(self.parent, "Export As", f"Daily_Status_{date.today().strftime('%d%m%Y')}.md", filters)
+        if not path:
+            return
+        default_format = next((name for name, file_filter in EXPORT_FILTERS.items() if file_filter == selected_filter), "markdown")
+        export_format = format_for_path(path, default_format)
+        if not os.path.splitext(path)[1]:
+            path += EXPORT_FORMATS[export_format]
+        self.start_export(export_format, path, f"Exported to {os.path.basename(path)} successfully!", "Failed to export")
+
+    def batch_export_days(self):
+        paths, _ = QFileDialog.getOpenFileNames(self.parent, "Select Tasks Files To Export", os.path.dirname(self.config["tasks_file_path"]), "JSON Files (*.json)")
+        if not paths:
+            return
+        export_format, ok = QInputDialog.getItem(self.parent, "Batch Export", "Export format:", list(EXPORT_FILTERS), 0, False)
+        if not ok:
+            return
+        output_dir = QFileDialog.getExistingDirectory(self.parent, "Select Output Folder")
+        if not output_dir:
+            return
+        progress = QProgressDialog("Exporting...", "Cancel", 0, len(paths), self.parent)
+        progress.setWindowTitle("Batch Export")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        job = self.jobs.submit(lambda job: batch_export(paths, self.config, export_format, output_dir, progress=job.report_progress),
+                               tag="batch_export",
+                               on_result=lambda result: self.on_batch_exported(result, output_dir),
+                               on_error=lambda error: QMessageBox.critical(self.parent, "Export Error", f"Batch export failed:\n{error}"),
+                               on_progress=lambda done, total: progress.setValue(done),
+                               on_cancel=lambda: QMessageBox.information(self.parent, "Batch Export", "Batch export cancelled."))
+        progress.canceled.connect(job.cancel)
+        job.done.connect(progress.close, Qt.QueuedConnection)
+
+    def on_batch_exported(self, result, output_dir):
+        exported, failed = result
+        if failed:
+            details = "\n".join(f"{os.path.basename(path)}: {error}" for path, error in failed)
+            QMessageBox.warning(self.parent, "Batch Export", f"Exported {len(exported)} file(s); {len(failed)} failed:\n{details}")
+        else:
+            QMessageBox.information(self.parent, "Success", f"Exported {len(exported)} file(s) to {output_dir}.")
 
     def preview_email(self):
         if not self.tasks:
             QMessageBox.warning(self.parent, "No Tasks", "No tasks to preview.")
             return
-        html_content = self.generate_email_body(preview=True)
-        signature = self.generate_signature(preview=True)
-        full_html = html_content.rsplit("</body>", 1)[0] + signature + "</body></html>"
-        preview_email_html(full_html)
+        if self.jobs.is_running("preview"):
+            return
+        tasks = list(self.tasks)
+        self.jobs.submit(lambda job: self.generate_preview_html(tasks), tag="preview", on_result=self.show_preview,
+                         on_error=lambda error: QMessageBox.critical(self.parent, "Preview Error", f"Failed to preview email:\n{error}"))
+
+    def show_preview(self, html_content):
+        with span("preview_email"):
+            preview_email_html(html_content)
 
     def open_outlook_email(self):
         if not self.tasks:
             QMessageBox.warning(self.parent, "No Tasks", "No tasks to include in the email.")
             return
-        if not self.config["email"]["to"].strip():
-            QMessageBox.warning(self.parent, "Configuration Error", "Please configure at least one 'To' email address in Settings.")
+        if not self.recipients.to:
+            QMessageBox.warning(self.parent, "Configuration Error", "Please configure at least one valid 'To' email address in Settings.")
             return
+        if self.jobs.is_running("email"):
+            return
+        tasks = list(self.tasks)
+        # The body without signature is for manual pasting, the full HTML for the Outlook fallbacks
+        self.jobs.submit(lambda job: (self.generate_email_body(preview=False, tasks=tasks), self.generate_copy_html(tasks)),
+                         tag="email", on_result=self.send_outlook_email,
+                         on_error=lambda error: QMessageBox.critical(
+                             self.parent,
+                             "Email Error",
+                             f"Failed to prepare email:\n{error}\n"
+                             "Please try copying the HTML body and pasting it into Outlook manually."
+                         ))
 
+    def send_outlook_email(self, rendered):
+        # Runs in the GUI thread: the clipboard and Outlook's COM objects belong to it
+        html_content, full_html = rendered
+        recipients = self.recipients
         try:
-            # Copy HTML content without signature for manual pasting
-            html_content = self.generate_email_body(preview=False)
-            set_clipboard_html(html_content)
+            with span("copy_html_body"):
+                set_clipboard_html(html_content)
             self.html_copied = True
 
-            # Generate full HTML with signature for Outlook fallbacks
-            full_html = self.generate_copy_html()
-
             today = date.today().strftime("%d/%m/%Y")
             subject = f"Daily Status {today}"
-            to_emails = self.config["email"]["to"].strip()
-            cc_emails_raw = self.config["email"]["cc"].strip()
-
-            # Normalize and validate CC emails
-            if cc_emails_raw:
-                cc_list = [email.strip() for email in cc_emails_raw.replace(',', ';').split(';') if email.strip()]
-                cc_emails_com = ';'.join(cc_list)  # For COM interface
-                cc_emails = cc_emails_raw  # For mailto
-                logging.info(f"Processed CC emails: raw='{cc_emails_raw}', com='{cc_emails_com}'")
-            else:
-                cc_list = []
-                cc_emails_com = ''
-                cc_emails = ''
-                logging.warning(f"No CC emails configured: raw='{cc_emails_raw}'")
+            # Recipients were parsed and validated when the config was loaded
+            if recipients.invalid:
+                logging.warning(f"Skipping invalid email addresses: {', '.join(recipients.invalid)}")
+            if not recipients.cc:
+                logging.warning("No CC emails configured")
                 QMessageBox.information(self.parent, "Warning", "No CC emails configured. Proceeding with only To emails.")
 
-            # Try mailto URL first
+            # Try mailto URL first; the body is empty since HTML is on clipboard
             try:
-                params = {
-                    "to": to_emails,
-                    "cc": cc_emails,
-                    "subject": subject,
-                    "body": ""  # Body is empty since HTML is on clipboard
-                }
-                mailto_url = (
-                    f"mailto:{urllib.parse.quote(params['to'])}?"
-                    f"cc={urllib.parse.quote(params['cc'])}&"
-                    f"subject={urllib.parse.quote(params['subject'])}&"
-                    f"body={urllib.parse.quote(params['body'])}"
-                )
-                logging.info(f"Opening email with To: {to_emails}, CC: {cc_emails}, Subject: {subject}, URL: {mailto_url}")
+                mailto_url = recipients.mailto_url(subject)
+                logging.info(f"Opening email with To: {recipients.outlook_to}, CC: {recipients.outlook_cc}, Subject: {subject}, URL: {mailto_url}")
                 webbrowser.open(mailto_url)
                 QMessageBox.information(
                     self.parent,
@@ -612,13 +913,14 @@ class EODLogic:
 
             # Try Outlook New
             try:
-                outlook = win32com.client.Dispatch("Outlook.Application.16")
-                mail = outlook.CreateItem(0)  # 0 = olMailItem
-                mail.Subject = subject
-                mail.To = to_emails
-                mail.CC = cc_emails_com
-                mail.HTMLBody = full_html
-                mail.Display()
+                with span("open_outlook_email", client="Outlook New"):
+                    outlook = win32com.client.Dispatch("Outlook.Application.16")
+                    mail = outlook.CreateItem(0)  # 0 = olMailItem
+                    mail.Subject = subject
+                    mail.To = recipients.outlook_to
+                    mail.CC = recipients.outlook_cc
+                    mail.HTMLBody = full_html
+                    mail.Display()
                 QMessageBox.information(self.parent, "Success", "Email opened in Outlook New with pre-filled fields!")
                 return
             except Exception as e:
@@ -626,13 +928,14 @@ class EODLogic:
 
             # Fall back to classic Outlook
             try:
-                outlook = win32com.client.Dispatch("Outlook.Application")
-                mail = outlook.CreateItem(0)  # 0 = olMailItem
-                mail.Subject = subject
-                mail.To = to_emails
-                mail.CC = cc_emails_com
-                mail.HTMLBody = full_html
-                mail.Display()
+                with span("open_outlook_email", client="classic Outlook"):
+                    outlook = win32com.client.Dispatch("Outlook.Application")
+                    mail = outlook.CreateItem(0)  # 0 = olMailItem
+                    mail.Subject = subject
+                    mail.To = recipients.outlook_to
+                    mail.CC = recipients.outlook_cc
+                    mail.HTMLBody = full_html
+                    mail.Display()
                 QMessageBox.information(self.parent, "Success", "Email opened in classic Outlook with pre-filled fields!")
             except Exception as e:
                 QMessageBox.critical(
@@ -651,6 +954,86 @@ class EODLogic:
                 "Please try copying the HTML body and pasting it into Outlook manually."
             )
 
+    def open_project_emails(self):
+        if not self.tasks:
+            QMessageBox.warning(self.parent, "No Tasks", "No tasks to include in the email.")
+            return
+        projects = list(dict.fromkeys(task["main_project"] for task in self.tasks))
+        audiences = project_audiences(self.config, projects)
+        missing = [name for recipients, names in audiences if not recipients.to for name in names]
+        if missing:
+            QMessageBox.warning(self.parent, "Configuration Error",
+                                f"No valid 'To' address for: {', '.join(missing)}.\n"
+                                "Add a distribution list for these projects or a global 'To' address in Settings.")
+            return
+
+        if self.jobs.is_running("project_email"):
+            return
+        tasks = list(self.tasks)
+        jira_titles = self.jira_titles
+        self.jobs.submit(lambda job: render_audience_mails(tasks, self.config, audiences, self.generate_signature(preview=False),
+                                                           jira_titles=jira_titles),
+                         tag="project_email", on_result=self.send_project_emails,
+                         on_error=lambda error: QMessageBox.critical(self.parent, "Email Error", f"Failed to prepare project emails:\n{error}"))
+
+    def send_project_emails(self, mails):
+        # Runs in the GUI thread, which owns Outlook's COM objects
+        subject = f"Daily Status {date.today().strftime('%d/%m/%Y')}"
+        try:
+            outlook = None
+            for prog_id in ("Outlook.Application.16", "Outlook.Application"):
+                try:
+                    outlook = win32com.client.Dispatch(prog_id)
+                    break
+                except Exception as e:
+                    logging.info(f"Failed to open {prog_id}: {e}")
+            if outlook is None:
+                raise RuntimeError("Outlook is not available.")
+            for recipients, names, html in mails:
+                mail = outlook.CreateItem(0)  # 0 = olMailItem
+                mail.Subject = f"{subject} - {', '.join(names)}"
+                mail.To = recipients.outlook_to
+                mail.CC = recipients.outlook_cc
+                mail.HTMLBody = html
+                mail.Display()
+                logging.info(f"Opened project mail for {names} to {recipients.outlook_to}")
+            QMessageBox.information(self.parent, "Success", f"Opened {len(mails)} email(s), one per project distribution list.")
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Email Error",
+                f"Failed to open project emails in Outlook:\n{e}\n"
+                "Use 'Open in Email Client' to send a single combined email instead."
+            )
+
+    def toggle_profiling(self):
+        profiler = get_profiler()
+        if not profiler.running:
+            profiler.start()
+            self.profile_action.setText("Stop Profiling")
+            logging.info("Sampling profiler started")
+            return
+        self.profile_action.setText("Start Profiling")
+        try:
+            path = profiler.stop()
+        except Exception as e:
+            logging.error(f"Failed to write profile: {e}")
+            QMessageBox.critical(self.parent, "Profiling Error", f"Failed to write profile:\n{e}")
+            return
+        logging.info(f"Sampling profile written to {path}")
+        self.tray_icon.showMessage(
+            "Daily Status Mail Formatter",
+            f"Profile saved to {path}",
+            QSystemTrayIcon.Information,
+            5000
+        )
+
+    def show_timing_panel(self):
+        if self.timing_panel is None:
+            self.timing_panel = TimingPanel(self.parent)
+        self.timing_panel.show()
+        self.timing_panel.raise_()
+
     def show_settings_dialog(self):
         from daily_status_mail import SettingsWidget
         self.settings_dialog = QDialog(self.parent)
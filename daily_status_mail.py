@@ -1,18 +1,25 @@
 import sys
+import copy
+import argparse
+import logging
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QDialog, QScrollArea, QGroupBox, 
                                QFormLayout, QLineEdit, QPushButton, QListWidget, QHBoxLayout, QLabel, QFileDialog, 
                                QMessageBox, QTabWidget, QComboBox)
 from PySide6.QtCore import Qt
-from test_report_generator import TestReportGeneratorWidget
+from test_report_generator.main import TestReportGeneratorWidget
 from daily_status_ui import EODUI
 from daily_status_logic import EODLogic
+from config_schema import validate_config, is_hex_color
+from loop_watchdog import start_watchdog, stop_watchdog
+from single_instance import NOT_RUNNING, NO_REPLY, InstanceServer, send_to_running_instance
 
 # Settings Widget Class
 class SettingsWidget(QWidget):
     def __init__(self, parent, config, config_path, on_save_callback):
         super().__init__(parent)
         self.parent = parent
-        self.config = config.copy()
+        # Deep copy so edits only reach the settings store when Save is pressed
+        self.config = copy.deepcopy(config)
         self.config_path = config_path
         self.on_save_callback = on_save_callback
         self.setup_ui()
@@ -265,6 +272,31 @@ class SettingsWidget(QWidget):
 
         scroll_layout.addWidget(email_group)
 
+        # Per-Project Distribution Lists Section
+        distribution_group = QGroupBox("Project Distribution Lists")
+        distribution_group.setStyleSheet("QGroupBox { font-size: 18px; font-weight: bold; }")
+        distribution_layout = QFormLayout(distribution_group)
+        distribution_layout.setLabelAlignment(Qt.AlignRight)
+        distribution_layout.setSpacing(15)
+
+        self.distribution_project_combo = QComboBox()
+        self.distribution_project_combo.setStyleSheet("font-size: 16px; padding: 8px;")
+        self.distribution_project_combo.addItems(self.config["main_projects"].keys())
+        self.distribution_project_combo.currentTextChanged.connect(self.load_distribution_list)
+        distribution_layout.addRow("Main Project:", self.distribution_project_combo)
+        self.distribution_to_entry = QLineEdit()
+        self.distribution_to_entry.setStyleSheet("font-size: 16px; padding: 8px;")
+        self.distribution_to_entry.setPlaceholderText("Leave empty to use the global To")
+        self.distribution_to_entry.textEdited.connect(self.update_distribution_list)
+        distribution_layout.addRow("To:", self.distribution_to_entry)
+        self.distribution_cc_entry = QLineEdit()
+        self.distribution_cc_entry.setStyleSheet("font-size: 16px; padding: 8px;")
+        self.distribution_cc_entry.textEdited.connect(self.update_distribution_list)
+        distribution_layout.addRow("CC:", self.distribution_cc_entry)
+        self.load_distribution_list(self.distribution_project_combo.currentText())
+
+        scroll_layout.addWidget(distribution_group)
+
         # Notification Settings Section
         notification_group = QGroupBox("Notification Settings")
         notification_group.setStyleSheet("QGroupBox { font-size: 18px; font-weight: bold; }")
@@ -299,6 +331,22 @@ class SettingsWidget(QWidget):
         for sub_project in sub_projects:
             self.sub_project_list.addItem(sub_project)
 
+    def load_distribution_list(self, main_project):
+        entry = self.config["distribution_lists"].get(main_project, {})
+        self.distribution_to_entry.setText(entry.get("to", ""))
+        self.distribution_cc_entry.setText(entry.get("cc", ""))
+
+    def update_distribution_list(self):
+        main_project = self.distribution_project_combo.currentText()
+        if not main_project:
+            return
+        to = self.distribution_to_entry.text().strip()
+        cc = self.distribution_cc_entry.text().strip()
+        if to or cc:
+            self.config["distribution_lists"][main_project] = {"to": to, "cc": cc}
+        else:
+            self.config["distribution_lists"].pop(main_project, None)
+
     def browse_config_file(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save Config File", "config.json", "JSON Files (*.json)")
         if path:
@@ -324,6 +372,7 @@ class SettingsWidget(QWidget):
             return
         self.config["main_projects"][main_project] = []
         self.main_project_list.addItem(main_project)
+        self.distribution_project_combo.addItem(main_project)
         self.new_main_project_entry.clear()
 
     def remove_main_project(self):
@@ -333,6 +382,8 @@ class SettingsWidget(QWidget):
             return
         main_project = current.text()
         del self.config["main_projects"][main_project]
+        self.config["distribution_lists"].pop(main_project, None)
+        self.distribution_project_combo.removeItem(self.distribution_project_combo.findText(main_project))
         row = self.main_project_list.row(current)
         self.main_project_list.takeItem(row)
         self.sub_project_list.clear()
@@ -400,7 +451,7 @@ class SettingsWidget(QWidget):
         if not label:
             QMessageBox.warning(self, "Input Error", "Label name is required.")
             return
-        if not color.startswith("#") or len(color) != 7:
+        if not is_hex_color(color):
             QMessageBox.warning(self, "Input Error", "Color must be a valid hex code (e.g., #FF0000).")
             return
         if label in self.config["labels"]:
@@ -442,35 +493,14 @@ class SettingsWidget(QWidget):
             "Light Gray": "light_gray"
         }.get(theme_display, "dark_default")
 
-        try:
-            notification_time = self.config["notification_time"]
-            if not notification_time:
-                raise ValueError("Notification time is required.")
-            hours, minutes = map(int, notification_time.split(":"))
-            if not (0 <= hours <= 23 and 0 <= minutes <= 59):
-                raise ValueError("Invalid time format.")
-        except ValueError as e:
-            QMessageBox.warning(self, "Input Error", f"Notification time must be in HH:MM (24-hour) format (e.g., 18:00).\nError: {e}")
-            return
-
-        if not self.config["logo_path"]:
-            QMessageBox.warning(self, "Input Error", "Logo path is required.")
-            return
-        if not self.config["signature"]["name"]:
-            QMessageBox.warning(self, "Input Error", "Signature name is required.")
-            return
-        if not self.config["signature"]["email"]:
-            QMessageBox.warning(self, "Input Error", "Signature email is required.")
-            return
-        if not self.config["email"]["to"]:
-            QMessageBox.warning(self, "Input Error", "To email addresses are required.")
+        errors = validate_config(self.config)
+        if errors:
+            QMessageBox.warning(self, "Input Error", errors[0])
             return
 
         try:
-            new_config_path = self.config["config_file_path"]
-            from daily_status_logic import save_config
-            save_config(self.config, new_config_path)
-            self.on_save_callback(self.config, new_config_path)
+            # The settings store writes the file, at the path chosen here
+            self.on_save_callback(self.config, self.config["config_file_path"])
             QMessageBox.information(self, "Success", "Settings saved successfully!")
             self.parent.accept()
         except Exception as e:
@@ -483,6 +513,19 @@ class SettingsWidget(QWidget):
         self.parent.reject()
 
 # Main Application Class
+def build_argument_parser():
+    # The same arguments work on a first launch and are handed to the running instance on later ones
+    parser = argparse.ArgumentParser(prog="daily_status_mail", description="Daily Status Mail Formatter", exit_on_error=False)
+    parser.add_argument("--preview", action="store_true", help="render the mail and open the browser preview")
+    parser.add_argument("--add", metavar="TASK", help="add a task")
+    parser.add_argument("--project", help="main project of the added task")
+    parser.add_argument("--sub-project", help="sub project of the added task")
+    parser.add_argument("--status", default="Completed")
+    parser.add_argument("--type", dest="task_type", default="Normal")
+    parser.add_argument("--label", default="")
+    parser.add_argument("--comment", default="")
+    return parser
+
 class EODTool(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -515,8 +558,50 @@ class EODTool(QMainWindow):
     def closeEvent(self, event):
         self.eod_logic.closeEvent(event)
 
+    def handle_arguments(self, args):
+        try:
+            options, unknown = build_argument_parser().parse_known_args(args)
+        except argparse.ArgumentError as e:
+            logging.error(f"Ignoring arguments {args}: {e}")
+            return
+        if unknown:
+            logging.warning(f"Ignoring unknown arguments: {' '.join(unknown)}")
+        if options.add:
+            self.eod_logic.add_tasks([{
+                "main_project": options.project,
+                "sub_project": options.sub_project,
+                "task": options.add,
+                "status": options.status,
+                "task_type": options.task_type,
+                "label": options.label,
+                "comment": options.comment
+            }])
+        if options.preview:
+            self.eod_logic.preview_email()
+        if not (options.add or options.preview):
+            # A plain second launch brings the running window forward
+            self.showMaximized()
+            self.raise_()
+            self.activateWindow()
+
 if __name__ == "__main__":
+    # A later launch hands its arguments to the running instance and exits before building any UI
+    handoff = send_to_running_instance(sys.argv[1:])
+    if handoff == NO_REPLY:
+        logging.warning("Daily Status Mail Formatter is running but did not answer; not starting a second instance")
+    if handoff != NOT_RUNNING:
+        sys.exit(0)
     app = QApplication(sys.argv)
+    instance_server = InstanceServer()
+    if not instance_server.listen(sys.argv[1:]):
+        sys.exit(0)
+    # Stalls of the event loop are logged with the main thread's stack
+    start_watchdog()
+    app.aboutToQuit.connect(stop_watchdog)
     window = EODTool()
     window.showMaximized()
+    instance_server.arguments_received.connect(window.handle_arguments)
+    instance_server.task_handler = window.eod_logic.add_tasks
+    if len(sys.argv) > 1:
+        window.handle_arguments(sys.argv[1:])
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,226 @@
+import json
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextBrowser
+from PySide6.QtCore import QTimer
+from daily_status_render import (EMAIL_HEAD, EMAIL_FOOT, group_tasks, render_greeting, render_task_item,
+                                 render_main_heading, render_sub_section, append_signature)
+
+try:
+    from PySide6.QtWebEngineWidgets import QWebEngineView
+except ImportError:
+    QWebEngineView = None
+
+# Empty document the web view loads once; everything after that is DOM patching
+PREVIEW_SHELL = '<!DOCTYPE html><html><body style="font-family: Calibri; color: #000; background-color: #fff;"></body></html>'
+
+# Marks the task currently being typed into the form
+DRAFT_ITEM_ATTRIBUTES = ' style="opacity: 0.6;"'
+
+def section_element_id(main_idx, sub_idx):
+    return f"section-{main_idx}-{sub_idx}"
+
+class MailPreviewPane(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tasks = []
+        self.labels = {}
+        self.jira_titles = {}
+        self.recipient = "Team"
+        self.signature_html = ""
+        self.grouped = {}
+        self.item_cache = {}
+        self.section_html = {}
+        self.layout_keys = None
+        self.draft = None
+        self.draft_replace = None
+        self.draft_keys = set()
+        self.dirty_keys = set()
+        self.needs_regroup = False
+        self.needs_full_render = True
+        # Mail from the render cache, shown as-is until the first change
+        self.restored_html = None
+        self.view_ready = QWebEngineView is None
+        self.setup_ui()
+
+        # Coalesce bursts of edits (e.g. fast typing) into one render per event loop pass
+        self.render_timer = QTimer(self)
+        self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(0)
+        self.render_timer.timeout.connect(self.render)
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        preview_label = QLabel("Live Preview")
+        preview_label.setObjectName("sectionLabel")
+        layout.addWidget(preview_label)
+        if QWebEngineView is not None:
+            self.view = QWebEngineView()
+            self.view.loadFinished.connect(self.on_load_finished)
+            self.view.setHtml(PREVIEW_SHELL)
+        else:
+            self.view = QTextBrowser()
+            self.view.setOpenExternalLinks(True)
+        layout.addWidget(self.view)
+
+    def on_load_finished(self, ok):
+        self.view_ready = ok
+        self.needs_full_render = True
+        self.schedule_render()
+
+    def restore(self, tasks, recipient, labels, signature_html, body_html):
+        # Shows an already rendered mail; sections are rendered on the first change after it
+        self.set_document(recipient, labels, signature_html)
+        self.tasks = tasks
+        self.restored_html = append_signature(body_html, signature_html)[len(EMAIL_HEAD):-len(EMAIL_FOOT)]
+
+    def set_document(self, recipient, labels, signature_html):
+        self.restored_html = None
+        self.recipient = recipient
+        self.labels = labels
+        self.signature_html = signature_html
+        self.item_cache.clear()
+        self.needs_regroup = True
+        self.needs_full_render = True
+        self.schedule_render()
+
+    def set_jira_titles(self, jira_titles):
+        # Every item may link to a newly resolved issue, so the cached items are dropped
+        self.jira_titles = jira_titles
+        self.item_cache.clear()
+        self.needs_full_render = True
+        self.schedule_render()
+
+    def set_tasks(self, tasks):
+        self.restored_html = None
+        self.tasks = tasks
+        self.needs_regroup = True
+        self.schedule_render()
+
+    def set_draft(self, draft, replace_index=None):
+        if draft == self.draft and replace_index == self.draft_replace:
+            return
+        self.restored_html = None
+        self.dirty_keys |= self.draft_keys
+        self.draft = draft
+        self.draft_replace = replace_index
+        self.draft_keys = set()
+        if draft is not None:
+            self.draft_keys.add((draft["main_project"], draft["sub_project"]))
+            if replace_index is not None and replace_index < len(self.tasks):
+                replaced = self.tasks[replace_index]
+                self.draft_keys.add((replaced["main_project"], replaced["sub_project"]))
+        self.dirty_keys |= self.draft_keys
+        self.schedule_render()
+
+    def schedule_render(self):
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.schedule_render()
+
+    def regroup(self):
+        self.grouped = group_tasks(self.tasks)
+        fingerprints = [tuple(task.items()) for task in self.tasks]
+        self.item_cache = {fingerprint: self.item_cache[fingerprint] for fingerprint in fingerprints if fingerprint in self.item_cache}
+        self.dirty_keys = {(main_proj, sub_proj) for main_proj, sub_groups in self.grouped.items() for sub_proj in sub_groups}
+        self.dirty_keys |= self.draft_keys
+        self.needs_regroup = False
+
+    def document_layout(self):
+        layout = [(main_proj, list(sub_groups)) for main_proj, sub_groups in self.grouped.items()]
+        if self.draft is not None:
+            main_proj, sub_proj = self.draft["main_project"], self.draft["sub_project"]
+            sub_projects = next((subs for name, subs in layout if name == main_proj), None)
+            if sub_projects is None:
+                layout.append((main_proj, [sub_proj]))
+            elif sub_proj not in sub_projects:
+                sub_projects.append(sub_proj)
+        return layout
+
+    def item_html(self, task):
+        fingerprint = tuple(task.items())
+        html = self.item_cache.get(fingerprint)
+        if html is None:
+            html = self.item_cache[fingerprint] = render_task_item(task, self.labels, jira_titles=self.jira_titles)
+        return html
+
+    def render_section(self, main_idx, sub_idx, main_proj, sub_proj):
+        key = (main_proj, sub_proj)
+        indices = self.grouped.get(main_proj, {}).get(sub_proj, [])
+        draft_html = None
+        if self.draft is not None and key == (self.draft["main_project"], self.draft["sub_project"]):
+            draft_html = render_task_item(self.draft, self.labels, DRAFT_ITEM_ATTRIBUTES, self.jira_titles)
+        items = []
+        for index in indices:
+            if index == self.draft_replace:
+                if draft_html is not None:
+                    items.append(draft_html)
+                    draft_html = None
+                continue
+            items.append(self.item_html(self.tasks[index]))
+        if draft_html is not None:
+            items.append(draft_html)
+        return render_sub_section(main_idx, sub_idx, sub_proj, items)
+
+    def render(self):
+        if not self.isVisible() or not self.view_ready:
+            return
+        if self.restored_html is not None:
+            self.show_html(self.restored_html)
+            return
+        if self.needs_regroup:
+            self.regroup()
+        layout = self.document_layout()
+        layout_keys = [(main_proj, sub_proj) for main_proj, sub_projects in layout for sub_proj in sub_projects]
+        if self.needs_full_render or layout_keys != self.layout_keys or QWebEngineView is None:
+            self.render_full(layout, layout_keys)
+            return
+
+        # Layout is unchanged, so only the dirty sections need to be re-rendered and patched in place
+        numbers = self.section_numbers(layout)
+        script = []
+        for key in self.dirty_keys:
+            if key not in numbers:
+                continue
+            main_idx, sub_idx = numbers[key]
+            html = self.render_section(main_idx, sub_idx, *key)
+            if html != self.section_html.get(key):
+                self.section_html[key] = html
+                script.append(f"document.getElementById({json.dumps(section_element_id(main_idx, sub_idx))}).innerHTML = {json.dumps(html)};")
+        self.dirty_keys = set()
+        if script:
+            self.view.page().runJavaScript("\n".join(script))
+
+    def section_numbers(self, layout):
+        # Maps each (main, sub) key to its (main_idx, sub_idx) numbering in the document
+        numbers = {}
+        for main_idx, (main_proj, sub_projects) in enumerate(layout, 1):
+            for sub_idx, sub_proj in enumerate(sub_projects, 1):
+                numbers[(main_proj, sub_proj)] = (main_idx, sub_idx)
+        return numbers
+
+    def render_full(self, layout, layout_keys):
+        parts = [render_greeting(self.recipient)]
+        self.section_html = {}
+        for main_idx, (main_proj, sub_projects) in enumerate(layout, 1):
+            parts.append(render_main_heading(main_idx, main_proj))
+            for sub_idx, sub_proj in enumerate(sub_projects, 1):
+                html = self.render_section(main_idx, sub_idx, main_proj, sub_proj)
+                self.section_html[(main_proj, sub_proj)] = html
+                parts.append(f'<div id="{section_element_id(main_idx, sub_idx)}">{html}</div>')
+        parts.append(self.signature_html)
+        self.show_html("".join(parts))
+        self.layout_keys = layout_keys
+        self.dirty_keys = set()
+        self.needs_full_render = False
+
+    def show_html(self, body):
+        if QWebEngineView is not None:
+            self.view.page().runJavaScript(f"document.body.innerHTML = {json.dumps(body)};")
+        else:
+            scroll_bar = self.view.verticalScrollBar()
+            position = scroll_bar.value()
+            self.view.setHtml(EMAIL_HEAD + body + EMAIL_FOOT)
+            scroll_bar.setValue(position)
@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from jira_cache import jira_url_key
+
+# Define STATUS_COLORS for the email format
+STATUS_COLORS = {
+    "Completed": "#5e8f59",
+    "In Progress": "#c06530",
+    "To Be Done": "#029de6",
+    "Blocked": "#ff0000"
+}
+
+EMAIL_HEAD = '<!DOCTYPE html><html><body style="font-family: Calibri; color: #000; background-color: #fff;">\n        '
+EMAIL_FOOT = "</body></html>"
+
+def group_tasks(tasks):
+    # Task indices grouped by main project, then sub-project, in order of first appearance
+    grouped = {}
+    for index, task in enumerate(tasks):
+        grouped.setdefault(task["main_project"], {}).setdefault(task["sub_project"], []).append(index)
+    return grouped
+
+def link_html(url, jira_titles=None):
+    # jira_titles is {key: title}, resolved beforehand; links to a known issue read "KSD-4456 — title"
+    key = jira_url_key(url) if jira_titles else None
+    title = jira_titles.get(key) if key else None
+    return f'<a href="{url}">{key} — {escape(title)}</a>' if title else f'<a href="{url}">{url}</a>'
+
+def linkify(text, jira_titles=None):
+    if "http" not in text:
+        return text
+    return " ".join(link_html(word, jira_titles) if word.startswith("http") else word for word in text.split())
+
+def render_greeting(recipient):
+    return f"<p>Hi {recipient},</p><p>Please find below today's task updates:</p>"
+
+def render_task_item(task, labels, attributes="", jira_titles=None):
+    text = linkify(task["task"], jira_titles)
+    task_type_display = f" ({task['task_type']})" if task["task_type"] != "Normal" else ""
+    status = f'<span style="color:{STATUS_COLORS[task["status"]]}">{task["status"]}{task_type_display}</span>'
+    label = task.get("label", "")
+    comment = linkify(task.get("comment", ""), jira_titles)
+    label_part = f'<span style="color:{labels[label]}">{label}</span>' if label else ""
+    comment_part = f'<span style="color:#666666">{comment}</span>' if comment else ""
+    label_comment = f"{label_part} - {comment_part}" if label and comment else label_part or comment_part
+    subpoints = f'<ul><li>{label_comment}</li></ul>' if label_comment else ""
+    return f"<li{attributes}>{status} - {text}{subpoints}</li>"
+
+def render_main_heading(main_idx, main_proj):
+    return f"<h4><u>{main_idx}. {main_proj}</u></h4>"
+
+def render_sub_section(main_idx, sub_idx, sub_proj, items):
+    return f"<h5>{main_idx}.{sub_idx} {sub_proj}</h5><ul>{''.join(items)}</ul>"
+
+def render_email_body(tasks, config, jira_titles=None):
+    return render_grouped_body(tasks, group_tasks(tasks), config, jira_titles)
+
+def render_grouped_body(tasks, groups, config, jira_titles=None):
+    # groups is group_tasks(tasks) or a slice of it; its indices point into tasks
+    recipient = config.get("email", {}).get("recipient", "Team")
+    labels = config["labels"]
+    parts = [EMAIL_HEAD, render_greeting(recipient)]
+    for main_idx, (main_proj, sub_groups) in enumerate(groups.items(), 1):
+        parts.append(render_main_heading(main_idx, main_proj))
+        for sub_idx, (sub_proj, indices) in enumerate(sub_groups.items(), 1):
+            items = [render_task_item(tasks[index], labels, jira_titles=jira_titles) for index in indices]
+            parts.append(render_sub_section(main_idx, sub_idx, sub_proj, items))
+    parts.append(EMAIL_FOOT)
+    return "".join(parts)
+
+def render_signature(signature, logo_base64=""):
+    logo_img = f'<img src="data:image/png;base64,{logo_base64}" style="height:40px;">' if logo_base64 else ''
+    return f"""
+        <p><br>--<br>Thanks & Regards,<br><b>{signature['name']}</b><br>
+        {logo_img}<br>
+        Caparizon Software Ltd<br>
+        D-75, 8th Floor, Infra Futura, Kakkanaad, Kochi - 682021<br>
+        Mobile: {signature['mobile']}<br>
+        Office: +91 - 9400359991<br>
+        <a href="mailto:{signature['email']}">{signature['email']}</a><br>
+        <a href="http://www.caparizon.com">www.caparizon.com</a>
+        </p>
+        """
+
+def append_signature(body_html, signature_html):
+    return body_html.rsplit("</body>", 1)[0] + signature_html + "</body></html>"
+
+def render_audience_mails(tasks, config, audiences, signature_html, max_workers=4, jira_titles=None):
+    # audiences is a list of (recipients, main_projects); the grouping is built once and sliced per mail,
+    # and the signature is rendered once by the caller and shared by every mail
+    groups = group_tasks(tasks)
+
+    def render(projects):
+        sliced = {project: groups[project] for project in projects if project in groups}
+        return append_signature(render_grouped_body(tasks, sliced, config, jira_titles), signature_html)
+
+    if len(audiences) <= 1:
+        bodies = [render(projects) for _, projects in audiences]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(audiences))) as pool:
+            bodies = list(pool.map(render, [projects for _, projects in audiences]))
+    return [(recipients, projects, body) for (recipients, projects), body in zip(audiences, bodies)]
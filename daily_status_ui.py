@@ -1,7 +1,9 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QScrollArea,
-                               QLabel, QComboBox, QLineEdit, QRadioButton, QPushButton, QListWidget,
-                               QFrame, QTabWidget, QSizePolicy)
+                               QLabel, QComboBox, QLineEdit, QPushButton, QListWidget,
+                               QFrame, QTabWidget, QSizePolicy, QSplitter)
 from PySide6.QtCore import Qt
+from daily_status_preview import MailPreviewPane
+from option_group import RadioOptionGroup
 
 # Status Labels and Colors
 STATUS_LABELS = {
@@ -35,13 +37,22 @@ class EODUI(QWidget):
         self.settings_button = QPushButton("⚙ Settings")
         top_bar.addWidget(self.settings_button)
 
+        # Split Pane: Main Content on the left, Live Preview on the right
+        self.splitter = QSplitter(Qt.Horizontal)
+        main_tab_layout.addWidget(self.splitter)
+
         # Scroll Area for Main Content
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         self.sub_widget = QWidget()
         scroll_layout = QVBoxLayout(self.sub_widget)
         scroll_area.setWidget(self.sub_widget)
-        main_tab_layout.addWidget(scroll_area)
+        self.splitter.addWidget(scroll_area)
+
+        self.preview_pane = MailPreviewPane()
+        self.splitter.addWidget(self.preview_pane)
+        self.splitter.setStretchFactor(0, 3)
+        self.splitter.setStretchFactor(1, 2)
 
         # Project Selection Section
         project_frame = QFrame()
@@ -94,14 +105,8 @@ class EODUI(QWidget):
         status_label = QLabel("Select Status: <span style='color: red;'>*</span>")
         status_label.setTextFormat(Qt.TextFormat.RichText)
         status_layout = QHBoxLayout()
-        self.status_group = {}
-        for status in STATUS_LABELS:
-            radio_button = QRadioButton(status)
-            radio_button.setObjectName(f"status-{status.replace(' ', '\\ ')}")
-            if status == "Completed":
-                radio_button.setChecked(True)
-            status_layout.addWidget(radio_button)
-            self.status_group[status] = radio_button
+        self.status_options = RadioOptionGroup(status_layout, object_name=lambda status: f"status-{status.replace(' ', '\\ ')}", parent=self)
+        self.status_options.set_options(STATUS_LABELS, "Completed")
         task_layout.addRow(status_label, status_layout)
 
         task_type_label = QLabel("Task Type: <span style='color: red;'>*</span>")
@@ -156,6 +161,10 @@ class EODUI(QWidget):
         self.load_tasks_button = QPushButton("📂 Load Tasks")
         list_buttons_layout.addWidget(self.load_tasks_button)
 
+        self.harvest_button = QPushButton("📥 Harvest Activity")
+        self.harvest_button.setToolTip("Propose tasks from today's git commits and the Jira export")
+        list_buttons_layout.addWidget(self.harvest_button)
+
         # Export Options Section
         export_frame = QFrame()
         export_frame.setObjectName("sectionFrame")
@@ -180,6 +189,14 @@ class EODUI(QWidget):
         self.export_text_button = QPushButton("Export as Text")
         export_buttons_layout.addWidget(self.export_text_button)
 
+        self.export_as_button = QPushButton("Export As...")
+        self.export_as_button.setToolTip("Export as Markdown, PDF, Word, JSON, HTML or text")
+        export_buttons_layout.addWidget(self.export_as_button)
+
+        self.batch_export_button = QPushButton("Batch Export...")
+        self.batch_export_button.setToolTip("Export several saved tasks files at once")
+        export_buttons_layout.addWidget(self.batch_export_button)
+
         self.preview_button = QPushButton("Preview EOD Email")
         export_buttons_layout.addWidget(self.preview_button)
 
@@ -187,6 +204,10 @@ class EODUI(QWidget):
         self.open_outlook_button.setEnabled(True)  # Enabled since HTML body is set directly
         export_buttons_layout.addWidget(self.open_outlook_button)
 
+        self.project_mails_button = QPushButton("Send Per Project")
+        self.project_mails_button.setToolTip("Open one mail per project distribution list")
+        export_buttons_layout.addWidget(self.project_mails_button)
+
     def apply_theme(self, theme_name):
         themes = {
             "dark_default": {
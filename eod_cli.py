@@ -0,0 +1,95 @@
+import argparse
+import json
+import sys
+from single_instance import CommandClient
+
+# Tasks per request; each batch is validated, shown and saved once by the running app
+BATCH_SIZE = 500
+
+def read_tasks(source):
+    # A JSON array, or one task object per line (blank lines and # comments are skipped)
+    text = source.read()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    tasks = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            tasks.append(json.loads(line))
+        except ValueError as e:
+            raise ValueError(f"line {number}: {e}")
+    return tasks
+
+def send_tasks(client, tasks):
+    # Returns (added count, [(position, message), ...]) with positions counted over all tasks
+    added = 0
+    errors = []
+    for start in range(0, len(tasks), BATCH_SIZE):
+        reply = client.request({"tasks": tasks[start:start + BATCH_SIZE]})
+        if reply is None:
+            raise ConnectionError("The running instance did not answer.")
+        if not reply.get("ok"):
+            raise ConnectionError(reply.get("error", "Request failed."))
+        added += reply["added"]
+        errors.extend((start + index, message) for index, message in reply["errors"])
+    return added, errors
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="eod_cli", description="Add tasks to the running Daily Status Mail Formatter")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add_parser = commands.add_parser("add", help="add one task")
+    add_parser.add_argument("task")
+    add_parser.add_argument("--project", required=True, help="main project")
+    add_parser.add_argument("--sub-project", required=True)
+    add_parser.add_argument("--status", default="Completed")
+    add_parser.add_argument("--type", dest="task_type", default="Normal")
+    add_parser.add_argument("--label", default="")
+    add_parser.add_argument("--comment", default="")
+    import_parser = commands.add_parser("import", help="add tasks from a JSON array or JSON lines")
+    import_parser.add_argument("file", nargs="?", default="-", help="file to read, or - for stdin (default)")
+    args = parser.parse_args(argv)
+
+    if args.command == "add":
+        tasks = [{
+            "main_project": args.project,
+            "sub_project": args.sub_project,
+            "task": args.task,
+            "status": args.status,
+            "task_type": args.task_type,
+            "label": args.label,
+            "comment": args.comment
+        }]
+    else:
+        try:
+            if args.file == "-":
+                tasks = read_tasks(sys.stdin)
+            else:
+                with open(args.file, "r", encoding="utf-8") as f:
+                    tasks = read_tasks(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read tasks: {e}", file=sys.stderr)
+            return 1
+        if not isinstance(tasks, list):
+            print("Failed to read tasks: expected a list of tasks", file=sys.stderr)
+            return 1
+
+    client = CommandClient()
+    if not client.connected:
+        print("Daily Status Mail Formatter is not running.", file=sys.stderr)
+        return 2
+    try:
+        added, errors = send_tasks(client, tasks)
+    except ConnectionError as e:
+        print(e, file=sys.stderr)
+        return 1
+    finally:
+        client.close()
+    for index, message in errors:
+        print(f"Task {index + 1}: {message}", file=sys.stderr)
+    print(f"Added {added} of {len(tasks)} task(s).")
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QPushButton
+from PySide6.QtCore import Qt
+
+class HarvestDialog(QDialog):
+    # Lists proposed tasks with checkboxes; the checked ones are returned by selected_tasks()
+    def __init__(self, proposals, errors=(), parent=None):
+        super().__init__(parent)
+        self.proposals = proposals
+        self.setWindowTitle("Harvest Activity")
+        self.resize(760, 440)
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel(f"{len(proposals)} task(s) found in today's git and Jira activity:"))
+        self.proposal_list = QListWidget()
+        self.proposal_list.setAlternatingRowColors(True)
+        for proposal in proposals:
+            task_type = f" ({proposal['task_type']})" if proposal["task_type"] != "Normal" else ""
+            item = QListWidgetItem(f"[{proposal['main_project']}][{proposal['sub_project']}] {proposal['status']}{task_type} - "
+                                   f"{proposal['task']}    ← {proposal['source']}")
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.proposal_list.addItem(item)
+        layout.addWidget(self.proposal_list)
+
+        if errors:
+            error_label = QLabel("Skipped:\n" + "\n".join(f"{source}: {error}" for source, error in errors))
+            error_label.setStyleSheet("color: #c06530;")
+            error_label.setWordWrap(True)
+            layout.addWidget(error_label)
+
+        button_layout = QHBoxLayout()
+        select_all_button = QPushButton("Select All")
+        select_all_button.clicked.connect(lambda: self.set_all(Qt.Checked))
+        select_none_button = QPushButton("Select None")
+        select_none_button.clicked.connect(lambda: self.set_all(Qt.Unchecked))
+        add_button = QPushButton("Add Selected")
+        add_button.setDefault(True)
+        add_button.clicked.connect(self.accept)
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(select_all_button)
+        button_layout.addWidget(select_none_button)
+        button_layout.addStretch()
+        button_layout.addWidget(add_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+    def set_all(self, state):
+        for row in range(self.proposal_list.count()):
+            self.proposal_list.item(row).setCheckState(state)
+
+    def selected_tasks(self):
+        return [{key: value for key, value in proposal.items() if key != "source"}
+                for row, proposal in enumerate(self.proposals)
+                if self.proposal_list.item(row).checkState() == Qt.Checked]
@@ -0,0 +1,279 @@
+import csv
+import json
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from config_schema import DEFAULT_PERSISTENT_DIR
+
+# Per-repository reflog positions and the commits already read today, plus the parsed Jira export
+HARVEST_STATE_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, "harvest_state.json")
+HARVEST_WORKERS = 8
+GIT_TIMEOUT_S = 20
+# Keeps git from flashing a console window in the windowed build
+GIT_CREATIONFLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+JIRA_KEY_RE = re.compile(r"\b[A-Z][A-Z0-9_]+-\d+\b")
+# Reflog actions that record a commit made in this clone
+COMMIT_ACTIONS = ("commit", "cherry-pick", "revert")
+# Jira status (lower case) -> STATUS_COLORS status; anything else is "In Progress"
+JIRA_STATUSES = {
+    "done": "Completed",
+    "closed": "Completed",
+    "resolved": "Completed",
+    "blocked": "Blocked",
+    "to do": "To Be Done",
+    "open": "To Be Done",
+    "backlog": "To Be Done",
+    "selected for development": "To Be Done"
+}
+JIRA_DATE_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z", "%d/%b/%y %I:%M %p", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+def jira_keys(text):
+    return list(dict.fromkeys(JIRA_KEY_RE.findall(text)))
+
+def run_git(repo_path, *args):
+    result = subprocess.run(["git", "-C", repo_path, *args], capture_output=True, text=True, encoding="utf-8",
+                            errors="replace", timeout=GIT_TIMEOUT_S, creationflags=GIT_CREATIONFLAGS)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+    return result.stdout
+
+def git_dir(repo_path):
+    dot_git = os.path.join(repo_path, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    if os.path.isfile(dot_git):
+        # Worktrees and submodules point at their own git directory
+        with open(dot_git, "r", encoding="utf-8") as f:
+            line = f.readline().strip()
+        if line.startswith("gitdir:"):
+            return os.path.normpath(os.path.join(repo_path, line[len("gitdir:"):].strip()))
+    if os.path.isdir(os.path.join(repo_path, "objects")):
+        return repo_path
+    raise ValueError(f"{repo_path} is not a git repository")
+
+def read_reflog(path, offset):
+    # Returns (complete lines after offset, new offset); a line still being written is left for the next run
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    return data[:end].decode("utf-8", errors="replace").splitlines(), offset + end
+
+def parse_reflog_line(line):
+    # "<old sha> <new sha> <name> <<email>> <unix time> <tz>\t<message>" -> (new sha, local date, message)
+    header, _, message = line.partition("\t")
+    fields = header.split(" ")
+    if len(fields) < 4:
+        return None
+    try:
+        timestamp = int(fields[-2])
+    except ValueError:
+        return None
+    return fields[1], datetime.fromtimestamp(timestamp).date(), message
+
+def commit_messages(repo_path, shas):
+    # sha -> (subject, body); if git cannot show them (e.g. pruned after an amend) the reflog subjects are used
+    try:
+        output = run_git(repo_path, "show", "-s", "--format=%H%x1f%s%x1f%b%x1e", *shas)
+    except (OSError, RuntimeError, subprocess.TimeoutExpired):
+        return {}
+    messages = {}
+    for record in output.split("\x1e"):
+        fields = record.strip().split("\x1f")
+        if len(fields) == 3:
+            messages[fields[0]] = (fields[1], fields[2].strip())
+    return messages
+
+def scan_repository(repo_path, day, state):
+    # Returns the repository's new state; only reflog lines appended since the previous run are read
+    reflog_path = os.path.join(git_dir(repo_path), "logs", "HEAD")
+    exists = os.path.exists(reflog_path)
+    if state.get("day") != day.isoformat() or not exists or os.path.getsize(reflog_path) < state.get("offset", 0):
+        # A new day, or the reflog was expired or rewritten
+        state = {"day": day.isoformat(), "offset": 0, "commits": [], "branches": []}
+    else:
+        state = dict(state, commits=list(state["commits"]), branches=list(state["branches"]))
+    if not exists:
+        return state
+    lines, state["offset"] = read_reflog(reflog_path, state["offset"])
+    new_commits = {}
+    for line in lines:
+        entry = parse_reflog_line(line)
+        if entry is None or entry[1] != day:
+            continue
+        sha, _, message = entry
+        action, _, detail = message.partition(": ")
+        if action.split(" ")[0] in COMMIT_ACTIONS:
+            new_commits[sha] = detail
+        elif action == "checkout" and " to " in detail:
+            branch = detail.rsplit(" to ", 1)[1]
+            if branch not in state["branches"]:
+                state["branches"].append(branch)
+    if new_commits:
+        messages = commit_messages(repo_path, list(new_commits))
+        for sha, subject in new_commits.items():
+            subject, body = messages.get(sha, (subject, ""))
+            state["commits"].append({"sha": sha, "subject": subject, "body": body})
+    return state
+
+def parse_jira_date(value):
+    for fmt in JIRA_DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+        return parsed.astimezone().date() if parsed.tzinfo else parsed.date()
+    return None
+
+def parse_jira_export(path):
+    # Jira's CSV export or a saved REST search result (JSON); returns [{"key", "summary", "status", "updated"}]
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        issues = data.get("issues", []) if isinstance(data, dict) else data
+        rows = []
+        for issue in issues:
+            fields = issue.get("fields", {})
+            status = fields.get("status")
+            rows.append({
+                "key": issue.get("key", ""),
+                "summary": fields.get("summary") or "",
+                "status": (status.get("name", "") if isinstance(status, dict) else status) or "",
+                "updated": fields.get("updated") or ""
+            })
+    else:
+        with open(path, "r", newline="", encoding="utf-8-sig") as f:
+            rows = [{
+                "key": row.get("Issue key") or "",
+                "summary": row.get("Summary") or "",
+                "status": row.get("Status") or "",
+                "updated": row.get("Updated") or ""
+            } for row in csv.DictReader(f)]
+    return [row for row in rows if JIRA_KEY_RE.fullmatch(row["key"])]
+
+def updated_on(issue, day):
+    # Exports without an Updated column are taken as already filtered to the day
+    return not issue["updated"] or parse_jira_date(issue["updated"]) in (None, day)
+
+def scan_jira_export(path, day, state):
+    # The export is parsed again only when the file (or the day) changed. Only the day's issues are kept,
+    # so the state file does not grow into a copy of the export
+    stat = os.stat(path)
+    file_key = [stat.st_mtime_ns, stat.st_size]
+    if state.get("path") == path and state.get("stat") == file_key and state.get("day") == day.isoformat():
+        return state
+    return {"path": path, "stat": file_key, "day": day.isoformat(),
+            "issues": [issue for issue in parse_jira_export(path) if updated_on(issue, day)]}
+
+def jira_task_text(key, summary, harvest_config):
+    # Tasks are usually Jira links, as typed by hand; without a base URL the key and summary are used
+    base_url = harvest_config.get("jira_base_url", "")
+    if base_url:
+        return f"{base_url.rstrip('/')}/{key}"
+    return f"{key} {summary}".strip()
+
+def project_for(key, harvest_config, fallback=None):
+    return harvest_config.get("jira_projects", {}).get(key.split("-")[0], fallback)
+
+def make_proposal(mapping, task, status, source):
+    return {
+        "main_project": mapping.get("main_project", ""),
+        "sub_project": mapping.get("sub_project", ""),
+        "task": task,
+        "status": status,
+        "task_type": "Normal",
+        "source": source
+    }
+
+def repository_proposals(repo, state, harvest_config):
+    name = os.path.basename(os.path.normpath(repo["path"]))
+    proposals = []
+    for commit in state["commits"]:
+        source = f"git {name} {commit['sha'][:8]}"
+        keys = jira_keys(f"{commit['subject']}\n{commit['body']}")
+        for key in keys:
+            proposals.append(make_proposal(project_for(key, harvest_config, repo), jira_task_text(key, commit["subject"], harvest_config),
+                                           "In Progress", source))
+        if not keys:
+            proposals.append(make_proposal(repo, commit["subject"], "Completed", source))
+    for branch in state["branches"]:
+        for key in jira_keys(branch):
+            proposals.append(make_proposal(project_for(key, harvest_config, repo), jira_task_text(key, "", harvest_config),
+                                           "In Progress", f"git {name} branch {branch}"))
+    return proposals
+
+def jira_proposals(state, harvest_config):
+    proposals = []
+    for issue in state["issues"]:
+        mapping = project_for(issue["key"], harvest_config)
+        if mapping is None:
+            continue
+        status = JIRA_STATUSES.get(issue["status"].lower(), "In Progress")
+        proposals.append(make_proposal(mapping, jira_task_text(issue["key"], issue["summary"], harvest_config), status,
+                                       f"Jira {issue['key']} ({issue['status']})"))
+    return proposals
+
+def load_harvest_state(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+def save_harvest_state(path, state):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=4)
+    os.replace(temp_path, path)
+
+def harvest(config, day=None, state_path=HARVEST_STATE_PATH, max_workers=HARVEST_WORKERS):
+    # Returns (proposals, [(source, error)]). Repositories are scanned concurrently, each resuming from the
+    # reflog position stored by the previous run. Proposals carry a "source" next to the task fields
+    day = day or date.today()
+    harvest_config = config.get("harvest", {})
+    repositories = harvest_config.get("repositories", [])
+    jira_export = harvest_config.get("jira_export", "")
+    state = load_harvest_state(state_path)
+    old_states = state.get("repositories", {})
+    new_state = {"repositories": {}}
+    git_proposals, found_in_jira, errors = [], [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = []
+        for repo in repositories:
+            key = os.path.normcase(os.path.abspath(repo["path"]))
+            futures.append((repo, key, pool.submit(scan_repository, repo["path"], day, old_states.get(key, {}))))
+        jira_future = pool.submit(scan_jira_export, jira_export, day, state.get("jira", {})) if jira_export else None
+        for repo, key, future in futures:
+            try:
+                repo_state = future.result()
+            except Exception as e:
+                errors.append((repo["path"], str(e)))
+                if key in old_states:
+                    new_state["repositories"][key] = old_states[key]
+                continue
+            new_state["repositories"][key] = repo_state
+            git_proposals.extend(repository_proposals(repo, repo_state, harvest_config))
+        if jira_future is not None:
+            try:
+                new_state["jira"] = jira_future.result()
+                found_in_jira = jira_proposals(new_state["jira"], harvest_config)
+            except Exception as e:
+                errors.append((jira_export, str(e)))
+    save_harvest_state(state_path, new_state)
+    # Jira knows the issue's real status, so its proposal wins over one guessed from git
+    proposals = {}
+    for proposal in found_in_jira + git_proposals:
+        proposals.setdefault(proposal["task"], proposal)
+    # A repository or Jira project mapped without both projects gives tasks the form would reject
+    mapped = []
+    for proposal in proposals.values():
+        if proposal["main_project"] and proposal["sub_project"]:
+            mapped.append(proposal)
+        else:
+            errors.append((proposal["source"], "no main_project/sub_project configured in harvest"))
+    return mapped, errors
@@ -0,0 +1,143 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from config_schema import DEFAULT_PERSISTENT_DIR
+from harvesters import JIRA_KEY_RE, parse_jira_export
+
+JIRA_CACHE_PATH = os.path.join(DEFAULT_PERSISTENT_DIR, "jira_cache.json")
+JIRA_CACHE_VERSION = 1
+MAX_ENTRIES = 5000
+# Titles and statuses change rarely; a day old entry is looked up again
+TTL_S = 24 * 60 * 60
+# Keys per source.lookup() call
+LOOKUP_BATCH = 200
+
+@lru_cache(maxsize=4096)
+def jira_url_key(url):
+    keys = JIRA_KEY_RE.findall(url)
+    return keys[-1] if keys else None
+
+@lru_cache(maxsize=4096)
+def jira_url_keys(text):
+    # Keys of the Jira links in a text; cached, since the same task texts are scanned after every change
+    return tuple(key for key in (jira_url_key(word) for word in text.split() if word.startswith("http")) if key)
+
+def task_jira_keys(task):
+    return jira_url_keys(task["task"]) + jira_url_keys(task.get("comment", ""))
+
+class JiraCache:
+    # key -> [title, status, fetched at], least recently used first. Keys the source did not know are kept
+    # with a None title, so they are not looked up again until they expire
+    def __init__(self, path=JIRA_CACHE_PATH, max_entries=MAX_ENTRIES, ttl=TTL_S):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.dirty = False
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != JIRA_CACHE_VERSION:
+            return
+        self.entries = OrderedDict((key, entry) for key, *entry in data.get("entries", []))
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": JIRA_CACHE_VERSION, "entries": [[key, *entry] for key, entry in self.entries.items()]}, f)
+        os.replace(temp_path, self.path)
+        self.dirty = False
+
+    def get(self, key, now=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if (now or time.time()) - entry[2] > self.ttl:
+            del self.entries[key]
+            self.dirty = True
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, title, status, now=None):
+        self.entries[key] = [title, status, now or time.time()]
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def titles(self, keys):
+        titles = {}
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None and entry[0]:
+                titles[key] = entry[0]
+        return titles
+
+class DumpSource:
+    # Issues from a local Jira export (CSV or JSON, see harvesters.parse_jira_export), indexed once per file change.
+    # Any object with the same lookup(keys) -> {key: {"title", "status"}} method can stand in for it
+    def __init__(self, path):
+        self.path = path
+        self.file_key = None
+        self.index = {}
+
+    def lookup(self, keys):
+        stat = os.stat(self.path)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if file_key != self.file_key:
+            self.index = {issue["key"]: issue for issue in parse_jira_export(self.path)}
+            self.file_key = file_key
+        return {key: {"title": self.index[key]["summary"], "status": self.index[key]["status"]}
+                for key in keys if key in self.index}
+
+class JiraResolver:
+    def __init__(self, cache, source=None):
+        self.cache = cache
+        self.source = source
+
+    def resolve(self, keys):
+        # Looks up the keys that are not cached (or expired) in batches, then returns {key: title} for every
+        # key with a known title. Blocking; the app runs it on the job runner, never while rendering
+        keys = list(dict.fromkeys(keys))
+        missing = [key for key in keys if self.cache.get(key) is None]
+        if missing and self.source is not None:
+            for start in range(0, len(missing), LOOKUP_BATCH):
+                batch = missing[start:start + LOOKUP_BATCH]
+                found = self.source.lookup(batch)
+                for key in batch:
+                    issue = found.get(key, {})
+                    self.cache.put(key, issue.get("title"), issue.get("status"))
+            self.cache.save()
+        return self.cache.titles(keys)
+
+_resolver = None
+_custom_source = None
+
+def set_jira_source(source):
+    # Replaces the export file as the source, e.g. with a client for a team service
+    global _custom_source
+    _custom_source = source
+
+def get_jira_resolver(dump_path=""):
+    global _resolver
+    if _resolver is None:
+        cache = JiraCache()
+        cache.load()
+        _resolver = JiraResolver(cache)
+    if _custom_source is not None:
+        _resolver.source = _custom_source
+    elif not dump_path:
+        _resolver.source = None
+    elif not isinstance(_resolver.source, DumpSource) or _resolver.source.path != dump_path:
+        _resolver.source = DumpSource(dump_path)
+    return _resolver
@@ -0,0 +1,129 @@
+import logging
+import threading
+from collections import deque
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Qt
+
+class JobCancelled(Exception):
+    pass
+
+class Job(QObject):
+    # Created and owned by the GUI thread; its signals are emitted from a pool thread and
+    # delivered through queued connections, so every callback runs in the GUI thread
+    progress = Signal(int, int)
+    succeeded = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+    done = Signal()
+
+    def __init__(self, func, args, kwargs, key=None, tag=None, must_finish=False):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.tag = tag
+        # Writes the user expects on disk; shutdown() runs these instead of cancelling them
+        self.must_finish = must_finish
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        # For job functions to call between steps
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, done, total):
+        self.check_cancelled()
+        self.progress.emit(done, total)
+
+    def execute(self):
+        try:
+            self.check_cancelled()
+            result = self.func(self, *self.args, **self.kwargs)
+        except JobCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logging.error(f"Job {self.tag or self.func.__name__} failed: {e}")
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(result)
+        finally:
+            self.done.emit()
+
+class JobRunnable(QRunnable):
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self.setAutoDelete(True)
+
+    def run(self):
+        self.job.execute()
+
+class JobRunner(QObject):
+    # Emitted when a job starts or ends, so buttons can be refreshed
+    busy_changed = Signal()
+
+    def __init__(self, max_threads=None, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        if max_threads:
+            self.pool.setMaxThreadCount(max_threads)
+        self.jobs = []
+        # key -> jobs waiting for an earlier job with the same key (e.g. writes to one file), in submit order
+        self.waiting = {}
+
+    def submit(self, func, *args, key=None, tag=None, on_result=None, on_error=None, on_progress=None, on_cancel=None,
+               must_finish=False, **kwargs):
+        # func(job, *args, **kwargs) runs on the pool; jobs sharing a key run one after another in submit order
+        job = Job(func, args, kwargs, key, tag, must_finish)
+        for signal, callback in ((job.succeeded, on_result), (job.failed, on_error), (job.progress, on_progress),
+                                 (job.cancelled, on_cancel)):
+            if callback is not None:
+                signal.connect(callback, Qt.QueuedConnection)
+        job.done.connect(lambda: self.finish(job), Qt.QueuedConnection)
+        self.jobs.append(job)
+        if key is not None and key in self.waiting:
+            self.waiting[key].append(job)
+        else:
+            if key is not None:
+                self.waiting[key] = deque()
+            self.pool.start(JobRunnable(job))
+        self.busy_changed.emit()
+        return job
+
+    def finish(self, job):
+        self.jobs.remove(job)
+        queue = self.waiting.get(job.key)
+        if queue:
+            self.pool.start(JobRunnable(queue.popleft()))
+        elif queue is not None:
+            del self.waiting[job.key]
+        job.deleteLater()
+        self.busy_changed.emit()
+
+    def is_running(self, tag=None):
+        return any(tag is None or job.tag == tag for job in self.jobs)
+
+    def cancel(self, tag=None):
+        for job in self.jobs:
+            if tag is None or job.tag == tag:
+                job.cancel()
+
+    def shutdown(self):
+        # Called on quit, when the event loop no longer delivers finish(): everything but must_finish jobs is
+        # cancelled, the pool is drained, then jobs still waiting behind their key are run here, in order
+        for job in self.jobs:
+            if not job.must_finish:
+                job.cancel()
+        self.pool.waitForDone()
+        waiting, self.waiting = self.waiting, {}
+        for queue in waiting.values():
+            for job in queue:
+                if job.must_finish:
+                    job.execute()
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+# Editors and sync clients often write a file several times in a row; only the last write is read
+DEBOUNCE_MS = 300
+
+def content_hash(data):
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+def changed_indices(old, new):
+    # Positions whose task differs; None when tasks were added or removed
+    if len(old) != len(new):
+        return None
+    return [index for index, (old_task, new_task) in enumerate(zip(old, new)) if old_task != new_task]
+
+class FileReloader(QObject):
+    # Emits (path, parsed data) after a watched file changed on disk; parsing runs on the job runner
+    changed = Signal(str, object)
+    failed = Signal(str, str)
+
+    def __init__(self, jobs, parent=None):
+        super().__init__(parent)
+        self.jobs = jobs
+        self.loaders = {}
+        self.timers = {}
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.schedule)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+
+    def watch(self, path, loader):
+        # loader(path) is called on a worker thread and returns the parsed data
+        self.loaders[path] = loader
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(DEBOUNCE_MS)
+        timer.timeout.connect(lambda: self.reload(path))
+        self.timers[path] = timer
+        self.add_paths(path)
+
+    def unwatch_all(self):
+        for timer in self.timers.values():
+            timer.stop()
+            timer.deleteLater()
+        self.timers = {}
+        self.loaders = {}
+        watched = self.watcher.files() + self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+
+    def add_paths(self, path):
+        if os.path.exists(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+        directory = os.path.dirname(path)
+        if os.path.isdir(directory) and directory not in self.watcher.directories():
+            self.watcher.addPath(directory)
+
+    def schedule(self, path):
+        timer = self.timers.get(path)
+        if timer is not None:
+            timer.start()
+
+    def on_directory_changed(self, directory):
+        # Files replaced by a rename (atomic saves, OneDrive) drop out of the watcher; pick them up again
+        watched = self.watcher.files()
+        for path in self.loaders:
+            if os.path.dirname(path) == directory and path not in watched and os.path.exists(path):
+                self.watcher.addPath(path)
+                self.schedule(path)
+
+    def reload(self, path):
+        self.add_paths(path)
+        if path not in self.loaders or not os.path.exists(path):
+            return
+        loader = self.loaders[path]
+        # Keyed on the path, so a reload is ordered with the app's own writes to the same file
+        self.jobs.submit(lambda job: loader(path), key=path, tag="reload",
+                         on_result=lambda data: self.changed.emit(path, data),
+                         on_error=lambda error: self.failed.emit(path, error))
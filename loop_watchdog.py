@@ -0,0 +1,100 @@
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from PySide6.QtCore import QObject, QTimer
+
+HEARTBEAT_MS = 100
+# A heartbeat later than this counts as a stall
+STALL_THRESHOLD_MS = 500
+# Stall reports kept in memory; all of them also go to the log
+MAX_STALL_REPORTS = 50
+
+@dataclass
+class StallReport:
+    started: float
+    duration_ms: float
+    stack: list = field(default_factory=list)
+
+    def format(self):
+        when = time.strftime("%H:%M:%S", time.localtime(self.started))
+        return f"Event loop stalled at {when} for {self.duration_ms:.0f} ms\n" + "".join(self.stack)
+
+class EventLoopWatchdog(QObject):
+    # The heartbeat timer runs on the event loop; a monitor thread notices when it stops firing
+    # and captures what the main thread is executing at that moment
+    def __init__(self, threshold_ms=STALL_THRESHOLD_MS, heartbeat_ms=HEARTBEAT_MS, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_ms = heartbeat_ms
+        self.reports = deque(maxlen=MAX_STALL_REPORTS)
+        self.max_latency_ms = 0.0
+        self.last_beat = time.monotonic()
+        self.current = None
+        self.main_thread_id = threading.main_thread().ident
+        self.stop_event = threading.Event()
+        self.monitor = None
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setInterval(heartbeat_ms)
+        self.heartbeat.timeout.connect(self.beat)
+
+    def start(self):
+        if self.monitor is not None:
+            return
+        self.last_beat = time.monotonic()
+        self.stop_event.clear()
+        self.monitor = threading.Thread(target=self.watch, name="event-loop-watchdog", daemon=True)
+        self.monitor.start()
+        self.heartbeat.start()
+
+    def stop(self):
+        if self.monitor is None:
+            return
+        self.heartbeat.stop()
+        self.stop_event.set()
+        self.monitor.join()
+        self.monitor = None
+
+    def beat(self):
+        now = time.monotonic()
+        # Latency is how much later than scheduled this heartbeat arrived
+        latency_ms = (now - self.last_beat) * 1000 - self.heartbeat_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.last_beat = now
+
+    def watch(self):
+        interval = min(self.threshold / 4, self.heartbeat_ms / 1000)
+        while not self.stop_event.wait(interval):
+            last_beat = self.last_beat
+            stalled_for = time.monotonic() - last_beat
+            if stalled_for > self.threshold:
+                if self.current is None or self.current.started != last_beat:
+                    self.current = StallReport(last_beat, stalled_for * 1000, self.main_stack())
+                    self.reports.append(self.current)
+                    logging.warning(self.current.format())
+                else:
+                    self.current.duration_ms = stalled_for * 1000
+            elif self.current is not None:
+                self.current.duration_ms = (last_beat - self.current.started) * 1000
+                logging.warning(f"Event loop recovered after {self.current.duration_ms:.0f} ms")
+                self.current = None
+
+    def main_stack(self):
+        frame = sys._current_frames().get(self.main_thread_id)
+        return traceback.format_stack(frame) if frame is not None else []
+
+_watchdog = None
+
+def start_watchdog(threshold_ms=STALL_THRESHOLD_MS):
+    global _watchdog
+    if _watchdog is None:
+        _watchdog = EventLoopWatchdog(threshold_ms)
+        _watchdog.start()
+    return _watchdog
+
+def stop_watchdog():
+    if _watchdog is not None:
+        _watchdog.stop()
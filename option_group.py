@@ -0,0 +1,126 @@
+from PySide6.QtWidgets import QButtonGroup, QRadioButton
+from PySide6.QtCore import QObject, Signal
+
+def unique_options(options):
+    # Keeps the first occurrence of each option, in order
+    return list(dict.fromkeys(options))
+
+class RadioOptionGroup(QObject):
+    selection_changed = Signal(str)
+
+    def __init__(self, layout, object_name=None, add_stretch=False, parent=None):
+        super().__init__(parent)
+        self.layout = layout
+        self.object_name = object_name
+        self.group = QButtonGroup(self)
+        self.group.setExclusive(True)
+        self.group.buttonToggled.connect(self.on_button_toggled)
+        # option -> QRadioButton, kept in display order
+        self.buttons = {}
+        self.selected = None
+        if add_stretch:
+            self.layout.addStretch()
+
+    def options(self):
+        return list(self.buttons)
+
+    def current(self):
+        return self.selected
+
+    def button(self, option):
+        return self.buttons.get(option)
+
+    def __contains__(self, option):
+        return option in self.buttons
+
+    def select(self, option):
+        button = self.buttons.get(option)
+        if button is None:
+            return False
+        button.setChecked(True)
+        return True
+
+    def set_options(self, options, default=None):
+        options = unique_options(options)
+        wanted = set(options)
+        for option in [option for option in self.buttons if option not in wanted]:
+            button = self.buttons.pop(option)
+            self.group.removeButton(button)
+            self.layout.removeWidget(button)
+            button.deleteLater()
+            if option == self.selected:
+                self.selected = None
+        added = False
+        for option in options:
+            if option not in self.buttons:
+                button = QRadioButton(option)
+                if self.object_name:
+                    button.setObjectName(self.object_name(option))
+                self.group.addButton(button)
+                self.buttons[option] = button
+                added = True
+        if added or list(self.buttons) != options:
+            # Existing buttons are only re-inserted, never recreated
+            self.buttons = {option: self.buttons[option] for option in options}
+            for button in self.buttons.values():
+                self.layout.removeWidget(button)
+            for index, button in enumerate(self.buttons.values()):
+                self.layout.insertWidget(index, button)
+        if self.selected is None:
+            fallback = default if default in self.buttons else next(iter(self.buttons), None)
+            if fallback is not None:
+                self.select(fallback)
+
+    def on_button_toggled(self, button, checked):
+        if not checked:
+            return
+        option = button.text()
+        if option != self.selected:
+            self.selected = option
+            self.selection_changed.emit(option)
+
+class ListOptionGroup(QObject):
+    def __init__(self, list_widget, options=(), parent=None):
+        super().__init__(parent)
+        self.list_widget = list_widget
+        # option -> QListWidgetItem, kept in display order
+        self.items = {}
+        self.set_options(options)
+
+    def options(self):
+        return list(self.items)
+
+    def current(self):
+        item = self.list_widget.currentItem()
+        return item.text() if item else None
+
+    def __contains__(self, option):
+        return option in self.items
+
+    def add(self, option):
+        if option in self.items:
+            return False
+        self.list_widget.addItem(option)
+        self.items[option] = self.list_widget.item(self.list_widget.count() - 1)
+        return True
+
+    def remove(self, option):
+        item = self.items.pop(option, None)
+        if item is None:
+            return False
+        self.list_widget.takeItem(self.list_widget.row(item))
+        return True
+
+    def set_options(self, options):
+        options = unique_options(options)
+        wanted = set(options)
+        for option in [option for option in self.items if option not in wanted]:
+            self.remove(option)
+        for option in options:
+            self.add(option)
+        if list(self.items) != options:
+            for option in options:
+                self.list_widget.takeItem(self.list_widget.row(self.items[option]))
+            for option in options:
+                self.list_widget.addItem(self.items[option])
+            self.items = {option: self.items[option] for option in options}
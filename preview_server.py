@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+import webbrowser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Loopback address the preview server binds to (port is chosen by the OS)
+PREVIEW_HOST = "127.0.0.1"
+
+# Seconds between keep-alive comments on idle live-reload streams
+KEEPALIVE_INTERVAL = 15
+
+# Seconds to wait for a freshly opened tab to connect before opening another one
+TAB_CONNECT_GRACE = 5
+
+LIVE_RELOAD_SCRIPT = """<script>
+(function () {
+    var source = new EventSource("/events/%s");
+    source.onmessage = function (event) {
+        if (event.data !== "%d") {
+            window.location.reload();
+        }
+    };
+})();
+</script>"""
+
+class _PreviewPage:
+    def __init__(self):
+        self.body = b""
+        self.version = 0
+        self.clients = 0
+        self.opened_at = 0.0
+
+class _PreviewRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = [part for part in self.path.split("?", 1)[0].split("/") if part]
+        if len(parts) == 1:
+            self.serve_page(parts[0])
+        elif len(parts) == 2 and parts[0] == "events":
+            self.serve_events(parts[1])
+        else:
+            self.send_error(404)
+
+    def serve_page(self, name):
+        body = self.server.preview.page_body(name)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def serve_events(self, name):
+        preview = self.server.preview
+        if preview.page_body(name) is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        preview.client_connected(name)
+        try:
+            version = None
+            while True:
+                new_version = preview.wait_for_change(name, version, KEEPALIVE_INTERVAL)
+                if new_version is None:
+                    break
+                if new_version == version:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    version = new_version
+                    self.wfile.write(f"data: {version}\n\n".encode("ascii"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            preview.client_disconnected(name)
+
+    def log_message(self, format, *args):
+        logging.debug(f"Preview server: {format % args}")
+
+class PreviewServer:
+    def __init__(self, host=PREVIEW_HOST, port=0):
+        self.host = host
+        self.port = port
+        self.pages = {}
+        self.condition = threading.Condition()
+        self.httpd = None
+        self.thread = None
+        self.stopping = False
+
+    def start(self):
+        if self.httpd:
+            return
+        self.httpd = ThreadingHTTPServer((self.host, self.port), _PreviewRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.preview = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="PreviewServer", daemon=True)
+        self.thread.start()
+        logging.info(f"Preview server listening on {self.url('')}")
+
+    def stop(self):
+        if not self.httpd:
+            return
+        with self.condition:
+            self.stopping = True
+            self.condition.notify_all()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.httpd = None
+        self.thread = None
+        with self.condition:
+            self.pages.clear()
+        logging.info("Preview server stopped")
+
+    def url(self, name):
+        return f"http://{self.host}:{self.port}/{name}"
+
+    def publish(self, name, html_content):
+        marker = html_content.rfind("</body>")
+        if marker < 0:
+            marker = len(html_content)
+        with self.condition:
+            page = self.pages.setdefault(name, _PreviewPage())
+            page.version += 1
+            script = LIVE_RELOAD_SCRIPT % (name, page.version)
+            page.body = (html_content[:marker] + script + html_content[marker:]).encode("utf-8")
+            self.condition.notify_all()
+
+    def show(self, name, html_content):
+        self.start()
+        self.publish(name, html_content)
+        with self.condition:
+            page = self.pages[name]
+            if page.clients or time.monotonic() - page.opened_at < TAB_CONNECT_GRACE:
+                return
+            page.opened_at = time.monotonic()
+        webbrowser.open(self.url(name))
+
+    def is_live(self, name):
+        with self.condition:
+            page = self.pages.get(name)
+            return bool(page and page.clients)
+
+    def page_body(self, name):
+        with self.condition:
+            page = self.pages.get(name)
+            return page.body if page else None
+
+    def client_connected(self, name):
+        with self.condition:
+            self.pages[name].clients += 1
+
+    def client_disconnected(self, name):
+        with self.condition:
+            page = self.pages.get(name)
+            if page:
+                page.clients -= 1
+
+    def wait_for_change(self, name, version, timeout):
+        # Returns the current version, or None once the server is shutting down
+        with self.condition:
+            self.condition.wait_for(lambda: self.stopping or self.pages[name].version != version, timeout)
+            if self.stopping:
+                return None
+            return self.pages[name].version
+
+_preview_server = None
+_preview_server_lock = threading.Lock()
+
+def get_preview_server(create=True):
+    global _preview_server
+    with _preview_server_lock:
+        if _preview_server is None and create:
+            _preview_server = PreviewServer()
+        return _preview_server
+
+def shutdown_preview_server():
+    global _preview_server
+    with _preview_server_lock:
+        server, _preview_server = _preview_server, None
+    if server:
+        server.stop()
@@ -0,0 +1,105 @@
+import re
+import urllib.parse
+from dataclasses import dataclass
+from functools import lru_cache
+
+# RFC 5322 "dot-atom" local part and a dotted domain; quoted local parts and IP literals are not accepted
+ADDRESS_RE = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}"
+)
+# "Display Name <address>" or "<address>"
+NAMED_ADDRESS_RE = re.compile(r'\s*"?([^"<]*?)"?\s*<([^<>]+)>\s*')
+SEPARATOR_RE = re.compile(r"[;,\n]")
+
+@dataclass(frozen=True)
+class Recipient:
+    address: str
+    name: str = ""
+
+    @property
+    def key(self):
+        return self.address.casefold()
+
+    @property
+    def display(self):
+        return f"{self.name} <{self.address}>" if self.name else self.address
+
+@dataclass(frozen=True)
+class RecipientList:
+    to: tuple = ()
+    cc: tuple = ()
+    # Entries that did not look like an address, as typed
+    invalid: tuple = ()
+
+    @property
+    def outlook_to(self):
+        return "; ".join(recipient.display for recipient in self.to)
+
+    @property
+    def outlook_cc(self):
+        return "; ".join(recipient.display for recipient in self.cc)
+
+    def mailto_url(self, subject, body=""):
+        to = ",".join(recipient.address for recipient in self.to)
+        cc = ",".join(recipient.address for recipient in self.cc)
+        return (
+            f"mailto:{urllib.parse.quote(to, safe='@,')}?"
+            f"cc={urllib.parse.quote(cc, safe='@,')}&"
+            f"subject={urllib.parse.quote(subject)}&"
+            f"body={urllib.parse.quote(body)}"
+        )
+
+def parse_recipient(text):
+    text = text.strip()
+    match = NAMED_ADDRESS_RE.fullmatch(text)
+    name, address = (match.group(1).strip(), match.group(2).strip()) if match else ("", text)
+    if not ADDRESS_RE.fullmatch(address):
+        return None
+    return Recipient(address, name)
+
+def parse_recipients(raw, seen=None):
+    # Returns (recipients, invalid); addresses already in seen (lower-cased) are skipped
+    seen = set() if seen is None else seen
+    recipients = []
+    invalid = []
+    for part in SEPARATOR_RE.split(raw or ""):
+        if not part.strip():
+            continue
+        recipient = parse_recipient(part)
+        if recipient is None:
+            invalid.append(part.strip())
+        elif recipient.key not in seen:
+            seen.add(recipient.key)
+            recipients.append(recipient)
+    return recipients, invalid
+
+@lru_cache(maxsize=32)
+def build_recipients(to_raw, cc_raw):
+    # Addresses in To are dropped from CC; the result is cached per raw To/CC pair
+    seen = set()
+    to, invalid_to = parse_recipients(to_raw, seen)
+    cc, invalid_cc = parse_recipients(cc_raw, seen)
+    return RecipientList(tuple(to), tuple(cc), tuple(invalid_to + invalid_cc))
+
+def recipients_from_config(config):
+    email = config.get("email", {})
+    return build_recipients(email.get("to", ""), email.get("cc", ""))
+
+def project_audiences(config, projects):
+    # One (recipients, [main projects]) entry per distinct audience; projects without their own
+    # distribution list go to the global To/CC, and projects sharing a list share one mail.
+    # A list with only CC addresses is sent to the global To with its own CC
+    lists = config.get("distribution_lists", {})
+    email = config.get("email", {})
+    audiences = {}
+    for project in projects:
+        entry = lists.get(project) or {}
+        if entry.get("to", "").strip():
+            recipients = build_recipients(entry.get("to", ""), entry.get("cc", ""))
+        elif entry.get("cc", "").strip():
+            recipients = build_recipients(email.get("to", ""), entry["cc"])
+        else:
+            recipients = recipients_from_config(config)
+        audiences.setdefault(recipients, []).append(project)
+    return list(audiences.items())
@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import os
+from PySide6.QtCore import QThread, Signal
+from config_schema import load_tasks_file
+
+RENDER_CACHE_VERSION = 1
+
+def render_cache_path(tasks_path):
+    # Kept next to the tasks file, e.g. Json/tasks.render_cache.json
+    return os.path.splitext(tasks_path)[0] + ".render_cache.json"
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def logo_file_key(logo_path):
+    # The logo is inlined into the signature, so replacing the file at the same path must change the key
+    try:
+        stat = os.stat(logo_path)
+    except (OSError, ValueError):
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def render_inputs_hash(config):
+    # Everything besides the tasks that changes the rendered mail
+    logo_path = config.get("logo_path", "")
+    inputs = [config.get("labels", {}), config.get("email", {}).get("recipient", "Team"),
+              config.get("signature", {}), logo_path, logo_file_key(logo_path)]
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+def save_render_cache(tasks_path, tasks, body_html, signature_html, config):
+    path = render_cache_path(tasks_path)
+    entry = {
+        "version": RENDER_CACHE_VERSION,
+        "tasks_hash": file_hash(tasks_path),
+        "inputs_hash": render_inputs_hash(config),
+        "tasks": tasks,
+        "body": body_html,
+        "signature": signature_html
+    }
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def load_render_cache(tasks_path, config):
+    # Returns the cached entry only if it was rendered with the current labels, recipient and signature
+    path = render_cache_path(tasks_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except Exception as e:
+        logging.error(f"Failed to read render cache {path}: {e}")
+        return None
+    if entry.get("version") != RENDER_CACHE_VERSION or entry.get("inputs_hash") != render_inputs_hash(config):
+        return None
+    return entry
+
+class RenderCacheValidator(QThread):
+    # unchanged: the cache matches the tasks file (or there is nothing to load); stale: the tasks read from the file.
+    # The thread object itself lives in the GUI thread, so queued connections deliver there.
+    unchanged = Signal()
+    stale = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, tasks_path, tasks_hash=None, parent=None):
+        super().__init__(parent)
+        self.tasks_path = tasks_path
+        self.tasks_hash = tasks_hash
+
+    def run(self):
+        try:
+            if not os.path.exists(self.tasks_path):
+                if self.tasks_hash is None:
+                    self.unchanged.emit()
+                else:
+                    self.stale.emit([])
+            elif self.tasks_hash is not None and file_hash(self.tasks_path) == self.tasks_hash:
+                self.unchanged.emit()
+            else:
+                self.stale.emit(load_tasks_file(self.tasks_path, write_back=False))
+        except Exception as e:
+            self.failed.emit(str(e))
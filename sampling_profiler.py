@@ -0,0 +1,98 @@
+import os
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from config_schema import DEFAULT_PERSISTENT_DIR
+
+SAMPLE_INTERVAL_MS = 10
+MAX_DEPTH = 64
+# Distinct stacks kept in memory; samples of new stacks past this are counted under OVERFLOW_STACK
+MAX_STACKS = 20000
+OVERFLOW_STACK = "[other stacks]"
+# Least frequent stacks are left out once the output would pass this size
+MAX_FILE_BYTES = 5 * 1024 * 1024
+
+class SamplingProfiler:
+    # Samples every thread's stack from a background thread; the output is the collapsed-stack
+    # format ("frame;frame;frame count") read by flamegraph.pl, speedscope and similar tools
+    def __init__(self, interval_ms=SAMPLE_INTERVAL_MS, output_dir=DEFAULT_PERSISTENT_DIR):
+        self.interval = interval_ms / 1000
+        self.output_dir = output_dir
+        self.stacks = Counter()
+        self.samples = 0
+        self.frame_labels = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.started = None
+
+    @property
+    def running(self):
+        return self.thread is not None
+
+    def start(self):
+        if self.running:
+            return
+        self.stacks.clear()
+        self.samples = 0
+        self.started = datetime.now()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="sampling-profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        # Returns the path of the written profile
+        if not self.running:
+            return None
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        return self.write()
+
+    def run(self):
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self.add_sample(names.get(thread_id, str(thread_id)), frame)
+            self.samples += 1
+
+    def frame_label(self, code):
+        label = self.frame_labels.get(code)
+        if label is None:
+            label = self.frame_labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def add_sample(self, thread_name, frame):
+        frames = []
+        while frame is not None and len(frames) < MAX_DEPTH:
+            frames.append(self.frame_label(frame.f_code))
+            frame = frame.f_back
+        frames.append(thread_name)
+        stack = ";".join(reversed(frames))
+        if stack not in self.stacks and len(self.stacks) >= MAX_STACKS:
+            stack = OVERFLOW_STACK
+        self.stacks[stack] += 1
+
+    def write(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"profile_{self.started.strftime('%Y%m%d_%H%M%S')}.folded")
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                line = f"{stack} {count}\n"
+                written += len(line.encode("utf-8"))
+                if written > MAX_FILE_BYTES:
+                    break
+                f.write(line)
+        self.stacks.clear()
+        return path
+
+_profiler = None
+
+def get_profiler():
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
@@ -0,0 +1,184 @@
+import copy
+import json
+import logging
+import os
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
+from tracing import span
+from config_schema import DEFAULT_PERSISTENT_CONFIG_PATH, CONFIG_SCHEMA_VERSION, load_config_file, save_config_file
+
+DEFAULT_SETTINGS_PATH = DEFAULT_PERSISTENT_CONFIG_PATH
+
+# Changes are collected for this long before the file is written
+WRITE_BEHIND_MS = 500
+
+def coerce_value(value, default):
+    # Values are typed after their default; lists stored as JSON strings (old QSettings format) are parsed once here
+    if isinstance(default, list) and isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return copy.deepcopy(default)
+    if isinstance(default, dict):
+        return merge_defaults(value if isinstance(value, dict) else {}, default)
+    if default is not None and not isinstance(value, type(default)):
+        if isinstance(default, str) and isinstance(value, (int, float)):
+            return str(value)
+        return copy.deepcopy(default)
+    return value
+
+def merge_defaults(values, defaults):
+    merged = {key: coerce_value(values[key], default) if key in values else copy.deepcopy(default)
+              for key, default in defaults.items()}
+    for key, value in values.items():
+        if key not in merged:
+            merged[key] = value
+    return merged
+
+def read_legacy_qsettings(organization, application):
+    # Flattens every group, e.g. "Configuration/browsers" -> "browsers"
+    settings = QSettings(organization, application)
+    return {key.rsplit("/", 1)[-1]: settings.value(key) for key in settings.allKeys()}
+
+class SettingsStore(QObject):
+    # Emits the top-level key (or section name) that changed
+    changed = Signal(str)
+
+    def __init__(self, path=DEFAULT_SETTINGS_PATH, defaults=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.defaults = defaults or {}
+        self.values = merge_defaults(self.read_file(), self.defaults)
+        self.write_timer = QTimer(self)
+        self.write_timer.setSingleShot(True)
+        self.write_timer.setInterval(WRITE_BEHIND_MS)
+        self.write_timer.timeout.connect(self.flush)
+
+    def read_file(self):
+        if not os.path.exists(self.path):
+            logging.info(f"No settings file found at {self.path}, using defaults")
+            return {}
+        try:
+            with span("load_config"):
+                return load_config_file(self.path)
+        except Exception as e:
+            logging.error(f"Error loading settings from {self.path}: {e}")
+            return {}
+
+    def register_defaults(self, defaults):
+        # Lets a component that is created after the store add its own keys; existing values are kept.
+        # A file already at the current schema version was fixed up by its migrations, so only new keys are added.
+        self.defaults.update(defaults)
+        if self.values.get("schema_version") == CONFIG_SCHEMA_VERSION:
+            for key, default in defaults.items():
+                if key not in self.values:
+                    self.values[key] = copy.deepcopy(default)
+        else:
+            self.values = merge_defaults(self.values, self.defaults)
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def section(self, name, defaults=None, legacy=None):
+        # A section is a nested dict stored under one key; legacy() is only consulted if the section was never saved
+        if name not in self.values and legacy is not None:
+            try:
+                self.values[name] = legacy()
+            except Exception as e:
+                logging.error(f"Failed to import legacy settings for {name}: {e}")
+            self.schedule_write()
+        if defaults is not None:
+            # Kept with the store's defaults, so replace(), reload() and set_path() merge them in again
+            self.defaults[name] = defaults
+            self.values[name] = merge_defaults(self.values.get(name) or {}, defaults)
+        return self.values.setdefault(name, {})
+
+    def set(self, key, value):
+        if self.values.get(key) == value:
+            return
+        self.values[key] = value
+        self.schedule_write()
+        self.changed.emit(key)
+
+    def set_in_section(self, name, key, value):
+        section = self.values.setdefault(name, {})
+        if section.get(key) == value:
+            return
+        section[key] = value
+        self.schedule_write()
+        self.changed.emit(name)
+
+    def update_section(self, name, values):
+        section = self.values.setdefault(name, {})
+        changed = {key: value for key, value in values.items() if section.get(key) != value}
+        if not changed:
+            return
+        section.update(changed)
+        self.schedule_write()
+        self.changed.emit(name)
+
+    def replace(self, values):
+        changed = [key for key in set(values) | set(self.values) if values.get(key) != self.values.get(key)]
+        self.values = merge_defaults(values, self.defaults)
+        if changed:
+            self.schedule_write()
+        for key in changed:
+            self.changed.emit(key)
+
+    def diff(self, values):
+        # Top-level keys that would change if values (read from the file) were loaded
+        merged = merge_defaults(values, self.defaults)
+        return [key for key in set(merged) | set(self.values)
+                if key != "schema_version" and merged.get(key) != self.values.get(key)]
+
+    def reload(self, values):
+        # Takes values that were read back from the file, so nothing is written
+        changed = self.diff(values)
+        self.write_timer.stop()
+        self.values = merge_defaults(values, self.defaults)
+        for key in changed:
+            self.changed.emit(key)
+        return changed
+
+    @property
+    def has_pending_write(self):
+        return self.write_timer.isActive()
+
+    def snapshot(self):
+        return copy.deepcopy(self.values)
+
+    def schedule_write(self):
+        self.write_timer.start()
+
+    def save(self):
+        # Writes now and raises on failure, for saves the user asked for
+        self.write_timer.stop()
+        save_config_file(self.path, self.values)
+        self.values["schema_version"] = CONFIG_SCHEMA_VERSION
+
+    def flush(self):
+        try:
+            self.save()
+        except Exception as e:
+            logging.error(f"Failed to save settings to {self.path}: {e}")
+
+    def set_path(self, path, load=False):
+        # Moves the store to another file; with load=True that file's values replace the current ones
+        if path == self.path:
+            return
+        if self.has_pending_write:
+            self.flush()
+        self.path = path
+        if load:
+            self.values = merge_defaults(self.read_file(), self.defaults)
+
+_settings_store = None
+
+def get_settings_store():
+    global _settings_store
+    if _settings_store is None:
+        _settings_store = SettingsStore()
+    return _settings_store
+
+def flush_settings_store():
+    if _settings_store is not None and _settings_store.has_pending_write:
+        _settings_store.flush()
@@ -0,0 +1,125 @@
+import getpass
+import json
+import logging
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+# One instance per user; the name maps to a Unix socket or a Windows named pipe
+SERVER_NAME = f"DailyStatusMailFormatter-{getpass.getuser()}"
+CONNECT_TIMEOUT_MS = 200
+REPLY_TIMEOUT_MS = 5000
+
+# Results of send_to_running_instance
+HANDED_OFF = "handed_off"
+# Connected, but the instance did not answer in time (e.g. blocked in an Outlook call); its socket is live
+NO_REPLY = "no_reply"
+# Nothing accepted the connection; a socket file left behind is stale
+NOT_RUNNING = "not_running"
+
+# The channel speaks JSON lines: each request line gets exactly one reply line, in order.
+#   {"args": ["--preview"]}          -> {"ok": true}
+#   {"tasks": [{...}, {...}]}        -> {"ok": true, "added": 1, "errors": [[1, "Unknown status 'x'."]]}
+# where each error is [position in the batch, message]
+# Anything else gets {"ok": false, "error": "..."}
+
+class CommandClient:
+    # Talks to the running instance with blocking calls; needs no QApplication
+    def __init__(self, server_name=SERVER_NAME):
+        self.socket = QLocalSocket()
+        self.socket.connectToServer(server_name)
+        self.connected = self.socket.waitForConnected(CONNECT_TIMEOUT_MS)
+
+    def request(self, message):
+        # Returns the reply as a dict, or None if the instance went away or did not answer in time
+        self.socket.write((json.dumps(message) + "\n").encode("utf-8"))
+        while self.socket.bytesToWrite():
+            if not self.socket.waitForBytesWritten(REPLY_TIMEOUT_MS):
+                return None
+        while not self.socket.canReadLine():
+            if not self.socket.waitForReadyRead(REPLY_TIMEOUT_MS):
+                return None
+        try:
+            return json.loads(self.socket.readLine().data().decode("utf-8"))
+        except ValueError:
+            return None
+
+    def close(self):
+        if self.connected:
+            self.socket.disconnectFromServer()
+
+def send_to_running_instance(args, server_name=SERVER_NAME):
+    client = CommandClient(server_name)
+    if not client.connected:
+        return NOT_RUNNING
+    reply = client.request({"args": args})
+    client.close()
+    return HANDED_OFF if reply and reply.get("ok") else NO_REPLY
+
+class InstanceServer(QObject):
+    # Receives the arguments of later launches and task batches from the command channel
+    arguments_received = Signal(list)
+
+    def __init__(self, server_name=SERVER_NAME, parent=None):
+        super().__init__(parent)
+        self.server_name = server_name
+        # Called with a list of task dicts; returns (added count, [(position, message), ...])
+        self.task_handler = None
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self.on_new_connection)
+
+    def listen(self, args=()):
+        # False means another instance is running; it took args or is too busy to answer.
+        # With socket options set, listen() on Unix replaces an existing socket file even while another
+        # instance serves it, so a live instance is looked for first
+        result = send_to_running_instance(list(args), self.server_name)
+        if result == NO_REPLY:
+            logging.warning(f"The running instance did not answer; arguments {list(args)} were not handed over")
+        if result != NOT_RUNNING:
+            return False
+        # Nothing accepted the connection, so a socket left behind by a crashed instance can go
+        QLocalServer.removeServer(self.server_name)
+        if not self.server.listen(self.server_name):
+            logging.error(f"Failed to listen on {self.server_name}: {self.server.errorString()}")
+        return True
+
+    def on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda socket=socket: self.read_requests(socket))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def read_requests(self, socket):
+        while socket.canReadLine():
+            reply = self.handle_request(socket.readLine().data())
+            socket.write((json.dumps(reply) + "\n").encode("utf-8"))
+        socket.flush()
+
+    def handle_request(self, line):
+        try:
+            message = json.loads(line.decode("utf-8"))
+        except ValueError as e:
+            return {"ok": False, "error": f"Malformed request: {e}"}
+        if not isinstance(message, dict):
+            return {"ok": False, "error": "Request must be an object."}
+        if "args" in message:
+            args = message["args"]
+            if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+                return {"ok": False, "error": "'args' must be a list of strings."}
+            # Handled on the next event loop pass, after the reply is written: a handler may open a modal
+            # dialog, and a launch left waiting for the reply would take this instance for a stale one
+            QTimer.singleShot(0, lambda: self.arguments_received.emit(args))
+            return {"ok": True}
+        if "tasks" in message:
+            if not isinstance(message["tasks"], list):
+                return {"ok": False, "error": "'tasks' must be a list."}
+            if self.task_handler is None:
+                return {"ok": False, "error": "The application is still starting."}
+            try:
+                added, errors = self.task_handler(message["tasks"])
+            except Exception as e:
+                # A reply is always written, or the client would wait out its timeout
+                logging.exception("Failed to add tasks from the command channel")
+                return {"ok": False, "error": f"Failed to add tasks: {e}"}
+            return {"ok": True, "added": added, "errors": errors}
+        return {"ok": False, "error": "Unknown request."}
@@ -0,0 +1,294 @@
+import json
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+from daily_status_render import (EMAIL_HEAD, EMAIL_FOOT, group_tasks, render_greeting, render_task_item,
+                                 render_main_heading, render_sub_section, render_signature, append_signature)
+from config_schema import load_tasks_file
+
+# File extension for every export format; the exporters below are looked up by these names
+EXPORT_FORMATS = {"html": ".html", "text": ".txt", "markdown": ".md", "json": ".json", "pdf": ".pdf", "docx": ".docx"}
+
+# Days exported in parallel by batch_export
+BATCH_EXPORT_WORKERS = 4
+
+@dataclass
+class StatusItem:
+    task: str
+    status: str
+    task_type: str = "Normal"
+    label: str = ""
+    label_color: str = ""
+    comment: str = ""
+    # Index in the task list; sections group items by project, the text export lists them in this order
+    position: int = 0
+
+    def as_task(self):
+        task = {"task": self.task, "status": self.status, "task_type": self.task_type}
+        if self.label:
+            task["label"] = self.label
+        if self.comment:
+            task["comment"] = self.comment
+        return task
+
+@dataclass
+class StatusSection:
+    name: str
+    items: list = field(default_factory=list)
+
+@dataclass
+class StatusProject:
+    name: str
+    sections: list = field(default_factory=list)
+
+@dataclass
+class StatusReport:
+    day: date
+    recipient: str = "Team"
+    projects: list = field(default_factory=list)
+    signature: dict = field(default_factory=dict)
+
+    @property
+    def title(self):
+        return f"Daily Status Update - {self.day.strftime('%d/%m/%Y')}"
+
+def build_status_report(tasks, config, day=None):
+    labels = config.get("labels", {})
+    projects = []
+    for main_proj, sub_groups in group_tasks(tasks).items():
+        project = StatusProject(main_proj)
+        for sub_proj, indices in sub_groups.items():
+            section = StatusSection(sub_proj)
+            for index in indices:
+                task = tasks[index]
+                label = task.get("label", "")
+                section.items.append(StatusItem(task["task"], task["status"], task.get("task_type", "Normal"),
+                                                label, labels.get(label, "#000000") if label else "",
+                                                task.get("comment", ""), index))
+            project.sections.append(section)
+        projects.append(project)
+    return StatusReport(day or date.today(), config.get("email", {}).get("recipient", "Team"),
+                        projects, dict(config.get("signature", {})))
+
+def iter_html(report):
+    # Same markup as the mail body, followed by the signature without the logo
+    yield EMAIL_HEAD
+    yield render_greeting(report.recipient)
+    for main_idx, project in enumerate(report.projects, 1):
+        yield render_main_heading(main_idx, project.name)
+        for sub_idx, section in enumerate(project.sections, 1):
+            items = [render_task_item(item.as_task(), {item.label: item.label_color}) for item in section.items]
+            yield render_sub_section(main_idx, sub_idx, section.name, items)
+    yield append_signature(EMAIL_FOOT, render_signature(report.signature))
+
+def _item_suffix(item):
+    task_type = f" ({item.task_type})" if item.task_type != "Normal" else ""
+    label = f" [{item.label}]" if item.label else ""
+    comment = f" - {item.comment}" if item.comment else ""
+    return task_type, label, comment
+
+def _signature_lines(report):
+    return [report.signature.get(key, "") for key in ("name", "mobile", "email")]
+
+def iter_text(report):
+    # The plain text format predates the other exports and is kept as it was: addressed to the team,
+    # one line per task in list order, task type always shown
+    yield f"{report.title}\n\nHi Team,\n\n"
+    yield f"Please find the below status update for today ({report.day.strftime('%d%m%Y')}):\n\n"
+    entries = sorted(((item.position, project.name, section.name, item) for project in report.projects
+                      for section in project.sections for item in section.items), key=lambda entry: entry[0])
+    for _, project_name, section_name, item in entries:
+        _, label, comment = _item_suffix(item)
+        yield f"[{project_name}][{section_name}] {item.task} - {item.status} ({item.task_type}){label}{comment}\n"
+    yield "\nThanks,\n" + "\n".join(_signature_lines(report)) + "\n"
+
+def iter_markdown(report):
+    yield f"# {report.title}\n\nHi {report.recipient},\n\nPlease find below today's task updates:\n"
+    for main_idx, project in enumerate(report.projects, 1):
+        yield f"\n## {main_idx}. {project.name}\n"
+        for sub_idx, section in enumerate(project.sections, 1):
+            lines = [f"\n### {main_idx}.{sub_idx} {section.name}\n\n"]
+            for item in section.items:
+                task_type, label, comment = _item_suffix(item)
+                lines.append(f"- **{item.status}{task_type}** - {item.task}{label}{comment}\n")
+            yield "".join(lines)
+    yield "\n--\nThanks & Regards,  \n" + "  \n".join(line for line in _signature_lines(report) if line) + "\n"
+
+class _DateEncoder(json.JSONEncoder):
+    def default(self, o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return super().default(o)
+
+def iter_json(report):
+    return _DateEncoder(indent=2, ensure_ascii=False).iterencode(asdict(report))
+
+def _document_lines(report):
+    # (style, text) pairs shared by the PDF and DOCX writers
+    yield "title", report.title
+    yield "body", f"Hi {report.recipient},"
+    yield "body", "Please find below today's task updates:"
+    for main_idx, project in enumerate(report.projects, 1):
+        yield "heading", f"{main_idx}. {project.name}"
+        for sub_idx, section in enumerate(project.sections, 1):
+            yield "subheading", f"{main_idx}.{sub_idx} {section.name}"
+            for item in section.items:
+                task_type, label, comment = _item_suffix(item)
+                yield "bullet", f"• {item.status}{task_type} - {item.task}{label}{comment}"
+    yield "body", "Thanks & Regards,"
+    for line in _signature_lines(report):
+        if line:
+            yield "body", line
+
+# Font resource, size and extra space above, per line style
+PDF_STYLES = {"title": ("F2", 16, 10), "heading": ("F2", 13, 10), "subheading": ("F2", 11, 6),
+              "body": ("F1", 11, 4), "bullet": ("F1", 10, 2)}
+PDF_PAGE_SIZE = (595, 842)  # A4 in points
+PDF_MARGIN = 56
+
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def _wrap(text, width):
+    words = text.split()
+    line = ""
+    for word in words:
+        if line and len(line) + 1 + len(word) > width:
+            yield line
+            line = "  " + word
+        else:
+            line = f"{line} {word}" if line else word
+    yield line
+
+def _pdf_pages(report):
+    width, height = PDF_PAGE_SIZE
+    commands = []
+    y = height - PDF_MARGIN
+    for style, text in _document_lines(report):
+        font, size, space = PDF_STYLES[style]
+        # Helvetica averages about half the font size per character
+        for line in _wrap(text, int((width - 2 * PDF_MARGIN) / (size * 0.5))):
+            y -= size + space
+            space = 2
+            if y < PDF_MARGIN:
+                yield "\n".join(commands)
+                commands = []
+                y = height - PDF_MARGIN - size
+            commands.append(f"BT /{font} {size} Tf {PDF_MARGIN} {y} Td ({_pdf_escape(line)}) Tj ET")
+    yield "\n".join(commands)
+
+def write_pdf(report, stream):
+    # Minimal PDF 1.4 writer: standard Helvetica fonts, one content stream per page, written as it goes
+    offsets = {}
+    position = 0
+
+    def write(data):
+        nonlocal position
+        stream.write(data)
+        position += len(data)
+
+    def write_object(number, body):
+        offsets[number] = position
+        write(f"{number} 0 obj\n".encode("latin-1") + body + b"\nendobj\n")
+
+    write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+    write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    write_object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+    page_numbers = []
+    number = 5
+    for content in _pdf_pages(report):
+        data = content.encode("cp1252", errors="replace")
+        write_object(number, b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream")
+        write_object(number + 1, (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+            "/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>" % (*PDF_PAGE_SIZE, number)
+        ).encode("latin-1"))
+        page_numbers.append(number + 1)
+        number += 2
+    kids = " ".join(f"{page} 0 R" for page in page_numbers)
+    write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_numbers)} >>".encode("latin-1"))
+    xref_position = position
+    entries = [b"0000000000 65535 f \n"] + [b"%010d 00000 n \n" % offsets[n] for n in range(1, number)]
+    write(b"xref\n0 %d\n" % number + b"".join(entries))
+    write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (number, xref_position))
+
+DOCX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+DOCX_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCX_HEAD = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>"""
+DOCX_FOOT = "</w:body></w:document>"
+
+# Bold flag and size in half-points, per line style
+DOCX_STYLES = {"title": (True, 32), "heading": (True, 26), "subheading": (True, 22), "body": (False, 22), "bullet": (False, 20)}
+
+def write_docx(report, stream):
+    with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", DOCX_RELS)
+        with archive.open("word/document.xml", "w") as document:
+            document.write(DOCX_HEAD.encode("utf-8"))
+            for style, text in _document_lines(report):
+                bold, size = DOCX_STYLES[style]
+                run_props = f'{"<w:b/>" if bold else ""}<w:sz w:val="{size}"/>'
+                indent = '<w:pPr><w:ind w:left="360"/></w:pPr>' if style == "bullet" else ""
+                document.write(f'<w:p>{indent}<w:r><w:rPr>{run_props}</w:rPr><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'.encode("utf-8"))
+            document.write(DOCX_FOOT.encode("utf-8"))
+
+TEXT_EXPORTERS = {"html": iter_html, "text": iter_text, "markdown": iter_markdown, "json": iter_json}
+BINARY_EXPORTERS = {"pdf": write_pdf, "docx": write_docx}
+
+def export_report(report, export_format, path):
+    if export_format in BINARY_EXPORTERS:
+        with open(path, "wb") as f:
+            BINARY_EXPORTERS[export_format](report, f)
+        return path
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in TEXT_EXPORTERS[export_format](report):
+            f.write(chunk)
+    return path
+
+def format_for_path(path, default="html"):
+    extension = os.path.splitext(path)[1].lower()
+    return next((name for name, ext in EXPORT_FORMATS.items() if ext == extension), default)
+
+def export_tasks_file(tasks_path, config, export_format, output_dir):
+    # The day is taken from the tasks file's modification time
+    day = datetime.fromtimestamp(os.path.getmtime(tasks_path)).date()
+    report = build_status_report(load_tasks_file(tasks_path, write_back=False), config, day)
+    name = os.path.splitext(os.path.basename(tasks_path))[0]
+    return export_report(report, export_format, os.path.join(output_dir, name + EXPORT_FORMATS[export_format]))
+
+def batch_export(tasks_paths, config, export_format, output_dir, max_workers=BATCH_EXPORT_WORKERS, progress=None):
+    # Returns (exported paths, [(tasks path, error)]); each day is read, built and streamed to disk on its own worker.
+    # progress(done, total) is called as days finish; if it raises, days that have not started are skipped
+    os.makedirs(output_dir, exist_ok=True)
+    exported, failed = [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [(path, pool.submit(export_tasks_file, path, config, export_format, output_dir)) for path in tasks_paths]
+        try:
+            for done, (path, future) in enumerate(futures, 1):
+                try:
+                    exported.append(future.result())
+                except Exception as e:
+                    failed.append((path, str(e)))
+                if progress is not None:
+                    progress(done, len(futures))
+        except BaseException:
+            for _, future in futures:
+                future.cancel()
+            raise
+    return exported, failed
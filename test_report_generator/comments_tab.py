@@ -49,4 +49,16 @@ class CommentsTab(QWidget):
         comments_layout.addWidget(generate_btn, alignment=Qt.AlignRight)
 
         main_layout.addWidget(comments_frame)
-        main_layout.addStretch()
\ No newline at end of file
+        main_layout.addStretch()
+
+    def snapshot(self):
+        return {
+            "notes": self.notes_text.toPlainText().strip(),
+            "recommendations": self.recommendations_text.toPlainText().strip(),
+            "conclusion": self.conclusion_text.toPlainText().strip()
+        }
+
+    def restore(self, report):
+        self.notes_text.setText(report.notes)
+        self.recommendations_text.setText(report.recommendations)
+        self.conclusion_text.setText(report.conclusion)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from dataclasses import dataclass, field
+from test_report_generator.importers import STATUS_ALIASES
+
+FAILURE_STATUSES = frozenset(["Fail", "Blocked"])
+PASS_STATUSES = frozenset(["Passed"])
+
+@dataclass
+class RunComparison:
+    baseline_name: str = ""
+    # Changed rows are (ticket_id, baseline_status, current_status) tuples
+    new_failures: list = field(default_factory=list)
+    fixes: list = field(default_factory=list)
+    flips: list = field(default_factory=list)
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    unchanged: int = 0
+
+def canonical_status(status):
+    # Statuses are user-configurable, so e.g. "failed" or "OK" are classified as Fail / Passed
+    return STATUS_ALIASES.get(status.strip().lower(), status.strip())
+
+def first_statuses(rows):
+    # ticket_id -> status of its first row; later duplicates are ignored on both sides
+    statuses = {}
+    for row in rows:
+        statuses.setdefault(row[0], row[2])
+    return statuses
+
+def compare_runs(baseline_rows, current_rows, baseline_name=""):
+    # Rows are (ticket_id, type, status, priority); tickets are joined through a dict on ticket_id
+    baseline = first_statuses(baseline_rows)
+    comparison = RunComparison(baseline_name=baseline_name)
+    new_failures = comparison.new_failures.append
+    fixes = comparison.fixes.append
+    flips = comparison.flips.append
+    added = comparison.added.append
+    current = first_statuses(current_rows)
+    unchanged = 0
+    for ticket_id, status in current.items():
+        baseline_status = baseline.get(ticket_id)
+        canonical = canonical_status(status)
+        if baseline_status is None:
+            if canonical in FAILURE_STATUSES:
+                new_failures((ticket_id, "", status))
+            else:
+                added((ticket_id, "", status))
+            continue
+        baseline_canonical = canonical_status(baseline_status)
+        if baseline_canonical == canonical:
+            unchanged += 1
+        elif canonical in FAILURE_STATUSES and baseline_canonical not in FAILURE_STATUSES:
+            new_failures((ticket_id, baseline_status, status))
+        elif baseline_canonical in FAILURE_STATUSES and canonical in PASS_STATUSES:
+            fixes((ticket_id, baseline_status, status))
+        else:
+            flips((ticket_id, baseline_status, status))
+    comparison.removed = [(ticket_id, status, "") for ticket_id, status in baseline.items() if ticket_id not in current]
+    comparison.unchanged = unchanged
+    return comparison
@@ -1,14 +1,12 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QComboBox,
-                               QDateEdit, QGroupBox, QPushButton, QButtonGroup, QRadioButton, QScrollArea)
+                               QDateEdit, QGroupBox, QPushButton, QScrollArea)
 from PySide6.QtCore import Qt, QDate
+from option_group import RadioOptionGroup
 
 class DetailsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.test_cases = []
-        self.browser_group = QButtonGroup(self)
-        self.env_group = QButtonGroup(self)
-        self.status_group = QButtonGroup(self)
         self.setup_ui()
         self.load_dynamic_options()
 
@@ -74,6 +72,7 @@ class DetailsTab(QWidget):
         browser_inner_layout.setContentsMargins(15, 10, 15, 10)
         self.browser_layout = QHBoxLayout()
         browser_inner_layout.addLayout(self.browser_layout)
+        self.browser_options = RadioOptionGroup(self.browser_layout, add_stretch=True, parent=self)
         browser_inner_layout.addStretch()
         details_layout.addRow("", browser_frame)
 
@@ -85,6 +84,7 @@ class DetailsTab(QWidget):
         env_inner_layout.setContentsMargins(15, 10, 15, 10)
         self.env_layout = QHBoxLayout()
         env_inner_layout.addLayout(self.env_layout)
+        self.env_options = RadioOptionGroup(self.env_layout, add_stretch=True, parent=self)
         env_inner_layout.addStretch()
         details_layout.addRow("", env_frame)
 
@@ -113,6 +113,7 @@ class DetailsTab(QWidget):
         status_inner_layout.setContentsMargins(15, 10, 15, 10)
         self.status_layout = QHBoxLayout()
         status_inner_layout.addLayout(self.status_layout)
+        self.status_options = RadioOptionGroup(self.status_layout, add_stretch=True, parent=self)
         status_inner_layout.addStretch()
         details_layout.addRow("", status_frame)
 
@@ -136,49 +137,47 @@ class DetailsTab(QWidget):
         else:
             print("Error: Could not find tab_widget for navigation")
 
-    def load_dynamic_options(self):
-        # Store current selections
-        current_browser = next((b.text() for b in self.browser_group.buttons() if b.isChecked()), None)
-        current_env = next((e.text() for e in self.env_group.buttons() if e.isChecked()), None)
-        current_status = next((s.text() for s in self.status_group.buttons() if s.isChecked()), None)
-
-        # Clear existing buttons safely
-        for group, layout in [(self.browser_group, self.browser_layout),
-                              (self.env_group, self.env_layout),
-                              (self.status_group, self.status_layout)]:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    group.removeButton(widget)
-                    widget.deleteLater()
-
-        # Load browsers
-        browsers = self.parent().config.get("browsers", ["Chrome", "Firefox", "Edge", "Safari"])
-        default_browser = self.parent().config.get("browser", browsers[0])
-        for browser in browsers:
-            radio = QRadioButton(browser)
-            radio.setChecked(browser == (current_browser or default_browser))
-            self.browser_group.addButton(radio)
-            self.browser_layout.addWidget(radio)
-        self.browser_layout.addStretch()
-
-        # Load environments
-        environments = self.parent().config.get("environments", ["DEV", "QA", "UAT", "PROD"])
-        default_env = self.parent().config.get("environment", environments[0])
-        for env in environments:
-            radio = QRadioButton(env)
-            radio.setChecked(env == (current_env or default_env))
-            self.env_group.addButton(radio)
-            self.env_layout.addWidget(radio)
-        self.env_layout.addStretch()
-
-        # Load statuses
-        statuses = self.parent().config.get("statuses", ["Passed", "Fail", "Blocked"])
-        default_status = self.parent().config.get("status", statuses[0])
-        for status in statuses:
-            radio = QRadioButton(status)
-            radio.setChecked(status == (current_status or default_status))
-            self.status_group.addButton(radio)
-            self.status_layout.addWidget(radio)
-        self.status_layout.addStretch()
\ No newline at end of file
+    def snapshot(self):
+        return {
+            "title": self.title_entry.text().strip() or "Test Report",
+            "project_name": self.project_name_entry.text().strip(),
+            "project_version": self.project_version_entry.text().strip(),
+            "test_type": self.test_type_combo.currentText(),
+            "browser": self.browser_options.current() or "Chrome",
+            "change_id": self.change_id_entry.text().strip(),
+            "environment": self.env_options.current() or "DEV",
+            "start_date": self.start_date.date().toString("dd/MM/yyyy"),
+            "end_date": self.end_date.date().toString("dd/MM/yyyy"),
+            "tester": self.tester_entry.text().strip(),
+            "status": self.status_options.current() or "Passed"
+        }
+
+    def restore(self, report):
+        self.title_entry.setText(report.title)
+        self.project_name_entry.setText(report.project_name)
+        self.project_version_entry.setText(report.project_version)
+        if report.test_type:
+            self.test_type_combo.setCurrentText(report.test_type)
+        self.change_id_entry.setText(report.change_id)
+        self.tester_entry.setText(report.tester)
+        for date_edit, value in [(self.start_date, report.start_date), (self.end_date, report.end_date)]:
+            restored_date = QDate.fromString(value, "dd/MM/yyyy")
+            if restored_date.isValid():
+                date_edit.setDate(restored_date)
+        self.browser_options.select(report.browser)
+        self.env_options.select(report.environment)
+        self.status_options.select(report.status)
+
+    def load_dynamic_options(self, config=None):
+        # Only options added or removed in the settings are touched; the current selection is kept.
+        # Once the tab is inside the QTabWidget its parent is no longer the main widget, so callers pass the config.
+        if config is None:
+            config = self.parent().config
+        browsers = config.get("browsers", ["Chrome", "Firefox", "Edge", "Safari"])
+        self.browser_options.set_options(browsers, config.get("browser", browsers[0] if browsers else None))
+
+        environments = config.get("environments", ["DEV", "QA", "UAT", "PROD"])
+        self.env_options.set_options(environments, config.get("environment", environments[0] if environments else None))
+
+        statuses = config.get("statuses", ["Passed", "Fail", "Blocked"])
+        self.status_options.set_options(statuses, config.get("status", statuses[0] if statuses else None))
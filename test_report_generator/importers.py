@@ -0,0 +1,112 @@
+import csv
+import os
+import xml.etree.ElementTree as ET
+from PySide6.QtCore import QObject, Signal, Slot
+from test_report_generator.results_model import TYPE_OPTIONS, PRIORITY_OPTIONS, DEFAULT_RESULT_ROW
+
+# Rows handed to the table per signal while importing
+IMPORT_CHUNK_SIZE = 2000
+
+# Accepted CSV header names (lower-cased) for each result field
+CSV_COLUMN_ALIASES = {
+    "ticket_id": ("ticket_id", "ticket id", "ticket", "key", "id", "test", "test case", "testcase", "name"),
+    "type": ("type", "issue type", "ticket type"),
+    "status": ("status", "result", "outcome"),
+    "priority": ("priority", "severity")
+}
+
+STATUS_ALIASES = {
+    "pass": "Passed", "passed": "Passed", "ok": "Passed", "success": "Passed",
+    "fail": "Fail", "failed": "Fail", "failure": "Fail", "error": "Fail",
+    "blocked": "Blocked", "skip": "Blocked", "skipped": "Blocked"
+}
+
+_TYPE_LOOKUP = {option.lower(): option for option in TYPE_OPTIONS}
+_PRIORITY_LOOKUP = {option.lower(): option for option in PRIORITY_OPTIONS}
+
+def normalize_result(ticket_id, result_type="", status="", priority=""):
+    return (
+        ticket_id.strip(),
+        _TYPE_LOOKUP.get(result_type.strip().lower(), DEFAULT_RESULT_ROW[1]),
+        STATUS_ALIASES.get(status.strip().lower(), status.strip()),
+        _PRIORITY_LOOKUP.get(priority.strip().lower(), DEFAULT_RESULT_ROW[3])
+    )
+
+def iter_csv_results(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = [column.strip().lower() for column in next(reader, [])]
+        positions = {}
+        for field_name, aliases in CSV_COLUMN_ALIASES.items():
+            positions[field_name] = next((header.index(alias) for alias in aliases if alias in header), None)
+        if positions["ticket_id"] is None:
+            raise ValueError("CSV file has no ticket/test column.")
+        for record in reader:
+            values = [record[position] if position is not None and position < len(record) else ""
+                      for position in positions.values()]
+            if values[0].strip():
+                yield normalize_result(*values)
+
+def iter_junit_results(path):
+    # Works for JUnit and xUnit style reports; each <testcase> is dropped from the tree once read
+    parents = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag != "testcase":
+            continue
+        name = elem.get("name", "")
+        classname = elem.get("classname", "")
+        ticket_id = f"{classname}.{name}" if classname else name
+        if elem.find("failure") is not None or elem.find("error") is not None:
+            status = "Fail"
+        elif elem.find("skipped") is not None:
+            status = "Blocked"
+        else:
+            status = "Passed"
+        properties = {prop.get("name", "").lower(): prop.get("value", "") for prop in elem.iter("property")}
+        yield normalize_result(ticket_id, properties.get("type", ""), status, properties.get("priority", ""))
+        elem.clear()
+        if parents:
+            parents[-1].remove(elem)
+
+def iter_result_file(path):
+    if os.path.splitext(path)[1].lower() == ".xml":
+        return iter_junit_results(path)
+    return iter_csv_results(path)
+
+class ResultsImportWorker(QObject):
+    rows_ready = Signal(list)
+    finished = Signal(int)
+    failed = Signal(str)
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    @Slot()
+    def run(self):
+        count = 0
+        chunk = []
+        try:
+            for row in iter_result_file(self.path):
+                if self.cancelled:
+                    break
+                chunk.append(row)
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    self.rows_ready.emit(chunk)
+                    count += len(chunk)
+                    chunk = []
+            if chunk and not self.cancelled:
+                self.rows_ready.emit(chunk)
+                count += len(chunk)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(count)
@@ -0,0 +1,73 @@
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+ISSUE_HEADERS = ["No", "Issue"]
+
+def normalize_issue(text):
+    # Issues differing only in case or whitespace are treated as duplicates
+    return " ".join(text.split()).casefold()
+
+class IssuesTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Issue store: display text in order, plus the normalized texts for O(1) duplicate checks
+        self.issues = []
+        self.keys = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.issues)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(ISSUE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        if index.column() == 0:
+            return str(index.row() + 1)
+        return self.issues[index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return ISSUE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def unique_issues(self, lines):
+        keys = self.keys
+        batch_keys = set()
+        issues = []
+        for line in lines:
+            issue = line.strip()
+            if not issue:
+                continue
+            key = normalize_issue(issue)
+            if key in keys or key in batch_keys:
+                continue
+            batch_keys.add(key)
+            issues.append(issue)
+        return issues, batch_keys
+
+    def add_issues(self, lines):
+        issues, batch_keys = self.unique_issues(lines)
+        if issues:
+            first = len(self.issues)
+            self.beginInsertRows(QModelIndex(), first, first + len(issues) - 1)
+            self.issues.extend(issues)
+            self.keys |= batch_keys
+            self.endInsertRows()
+        return len(issues)
+
+    def remove_issue(self, row):
+        if not 0 <= row < len(self.issues):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.keys.discard(normalize_issue(self.issues.pop(row)))
+        self.endRemoveRows()
+        if row < len(self.issues):
+            self.dataChanged.emit(self.index(row, 0), self.index(len(self.issues) - 1, 0), [Qt.DisplayRole])
+
+    def set_issues(self, lines):
+        self.beginResetModel()
+        self.issues = []
+        self.keys = set()
+        self.issues, self.keys = self.unique_issues(lines)
+        self.endResetModel()
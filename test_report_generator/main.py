@@ -1,18 +1,20 @@
 import sys
 import os
-import json
-import webbrowser
-import tempfile
-from datetime import datetime
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-                               QPushButton, QScrollArea)
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QSettings
+                               QPushButton, QScrollArea, QFileDialog)
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve
 from PySide6.QtGui import QFont, QFontDatabase
 from test_report_generator.details_tab import DetailsTab
 from test_report_generator.results_tab import ResultsTab
 from test_report_generator.comments_tab import CommentsTab
 from test_report_generator.settings_dialog import SettingsDialog
 from test_report_generator.utils import NotificationDialog
+from test_report_generator.report import TestReport, render_report
+from test_report_generator.session import load_session, save_session
+from test_report_generator.compare import compare_runs
+from preview_server import get_preview_server
+from tracing import span
+from settings_store import get_settings_store, flush_settings_store, read_legacy_qsettings
 
 # Default Configuration
 DEFAULT_TEST_CONFIG = {
@@ -37,24 +39,45 @@ DEFAULT_TEST_CONFIG = {
     "conclusion": ""
 }
 
+# Persisted under the "test_report" section of the shared settings store
+TEST_REPORT_SECTION = "test_report"
+DEFAULT_TEST_SETTINGS = {
+    "theme": "dark_default",
+    "browsers": ["Chrome", "Firefox", "Edge", "Safari"],
+    "environments": ["DEV", "QA", "UAT", "PROD"],
+    "statuses": ["Passed", "Fail", "Blocked"],
+    "default_project": "",
+    "default_version": "",
+    "default_tester": "",
+    "notes": "",
+    "recommendations": "",
+    "conclusion": ""
+}
+
+# Where these settings lived before the settings store; imported once on first start
+LEGACY_QSETTINGS = ("xAI", "TestReportGenerator")
+
 class TestReportGeneratorWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.config = DEFAULT_TEST_CONFIG.copy()
-        self.settings = QSettings("xAI", "TestReportGenerator")
-        self.theme = self.settings.value("theme", "dark_default")
-        
-        # Create test_report_config.json if it doesn't exist
-        config_path = "test_report_config.json"
-        if not os.path.exists(config_path):
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(DEFAULT_TEST_CONFIG, f, indent=4)
-        
+        self.settings = get_settings_store()
+        self.settings.section(TEST_REPORT_SECTION, DEFAULT_TEST_SETTINGS, legacy=lambda: read_legacy_qsettings(*LEGACY_QSETTINGS))
+        self.theme = self.report_settings()["theme"]
+        self.session_restored = False
+        self.baseline_report = None
+        self.baseline_name = ""
+
         self.setObjectName("EODTaskTracker")
         self.setup_ui()
         self.load_fonts()
         self.load_configuration()
         self.apply_theme(self.theme)
+        QApplication.instance().aboutToQuit.connect(self.save_session)
+        QApplication.instance().aboutToQuit.connect(flush_settings_store)
+
+    def report_settings(self):
+        return self.settings.section(TEST_REPORT_SECTION)
 
     def load_fonts(self):
         font_db = QFontDatabase()
@@ -244,6 +267,7 @@ class TestReportGeneratorWidget(QWidget):
                 font-size: 16px;
             }}
             QWidget#EODTaskTracker QTableWidget,
+            QWidget#EODTaskTracker QTableView,
             QWidget#EODTaskTracker QListWidget {{
                 background-color: {theme['list_background']};
                 color: {theme['text_color']};
@@ -254,11 +278,13 @@ class TestReportGeneratorWidget(QWidget):
                 font-size: 16px;
             }}
             QWidget#EODTaskTracker QTableWidget::item:selected,
+            QWidget#EODTaskTracker QTableView::item:selected,
             QWidget#EODTaskTracker QListWidget::item:selected {{
                 background-color: {theme['button_background']};
                 color: white;
             }}
-            QWidget#EODTaskTracker QTableWidget::item:alternate {{
+            QWidget#EODTaskTracker QTableWidget::item:alternate,
+            QWidget#EODTaskTracker QTableView::item:alternate {{
                 background-color: {theme['list_alternate']};
             }}
             QWidget#EODTaskTracker QTabWidget::pane {{
@@ -290,7 +316,7 @@ class TestReportGeneratorWidget(QWidget):
         themes = ["dark_default", "dark_blue", "dark_purple", "dark_green", "light_gray"]
         current_index = themes.index(self.theme) if self.theme in themes else 0
         self.theme = themes[(current_index + 1) % len(themes)]
-        self.settings.setValue("theme", self.theme)
+        self.settings.set_in_section(TEST_REPORT_SECTION, "theme", self.theme)
         self.apply_theme(self.theme)
 
     def show_settings_dialog(self):
@@ -299,7 +325,6 @@ class TestReportGeneratorWidget(QWidget):
             dialog = SettingsDialog(self)
             if dialog.exec():
                 print("Settings dialog closed with accept")
-                self.details_tab.load_dynamic_options()
                 self.load_configuration()
                 self.apply_theme(self.theme)
         except Exception as e:
@@ -307,140 +332,92 @@ class TestReportGeneratorWidget(QWidget):
             NotificationDialog(f"Failed to open settings dialog:\n{e}", "Error", is_error=True, parent=self).exec()
 
     def load_configuration(self):
-        try:
-            self.settings.beginGroup("Configuration")
-            self.comments_tab.notes_text.setText(self.settings.value("notes", ""))
-            self.comments_tab.recommendations_text.setText(self.settings.value("recommendations", ""))
-            self.comments_tab.conclusion_text.setText(self.settings.value("conclusion", ""))
-            self.config["browsers"] = json.loads(self.settings.value("browsers", json.dumps(["Chrome", "Firefox", "Edge", "Safari"])))
-            self.config["environments"] = json.loads(self.settings.value("environments", json.dumps(["DEV", "QA", "UAT", "PROD"])))
-            self.config["statuses"] = json.loads(self.settings.value("statuses", json.dumps(["Passed", "Fail", "Blocked"])))
-            self.settings.endGroup()
-        except Exception as e:
-            print(f"Failed to load configuration: {e}")
+        # Values are already parsed and cached by the settings store
+        settings = self.report_settings()
+        self.comments_tab.notes_text.setText(settings["notes"])
+        self.comments_tab.recommendations_text.setText(settings["recommendations"])
+        self.comments_tab.conclusion_text.setText(settings["conclusion"])
+        self.config["browsers"] = list(settings["browsers"])
+        self.config["environments"] = list(settings["environments"])
+        self.config["statuses"] = list(settings["statuses"])
+        for entry, key in [(self.details_tab.project_name_entry, "default_project"),
+                           (self.details_tab.project_version_entry, "default_version"),
+                           (self.details_tab.tester_entry, "default_tester")]:
+            if not entry.text():
+                entry.setText(settings[key])
+        self.details_tab.load_dynamic_options(self.config)
 
-    def generate_report(self):
-        title = self.details_tab.title_entry.text().strip() or "Test Report"
-        project_name = self.details_tab.project_name_entry.text().strip()
-        project_version = self.details_tab.project_version_entry.text().strip()
-        test_type = self.details_tab.test_type_combo.currentText()
-        browser = next((b.text() for b in self.details_tab.browser_group.buttons() if b.isChecked()), "Chrome")
-        change_id = self.details_tab.change_id_entry.text().strip()
-        environment = next((e.text() for e in self.details_tab.env_group.buttons() if e.isChecked()), "DEV")
-        start_date = self.details_tab.start_date.date().toString("dd/MM/yyyy")
-        end_date = self.details_tab.end_date.date().toString("dd/MM/yyyy")
-        tester = self.details_tab.tester_entry.text().strip()
-        status = next((s.text() for s in self.details_tab.status_group.buttons() if s.isChecked()), "Passed")
-        test_cases = []  # No TestCaseGeneratorTab provided
-        test_results = []
-        for row in range(self.results_tab.results_table.rowCount()):
-            ticket_id = self.results_tab.results_table.item(row, 1).text() if self.results_tab.results_table.item(row, 1) else ""
-            type_text = self.results_tab.results_table.cellWidget(row, 2).currentText()
-            status_text = self.results_tab.results_table.item(row, 3).text() if self.results_tab.results_table.item(row, 3) else ""
-            priority_text = self.results_tab.results_table.cellWidget(row, 4).currentText()
-            test_results.append({
-                "no": str(row + 1),
-                "ticket_id": ticket_id,
-                "type": type_text,
-                "status": status_text,
-                "priority": priority_text
-            })
-        issues = self.results_tab.issues
-        notes = self.comments_tab.notes_text.toPlainText().strip()
-        recommendations = self.comments_tab.recommendations_text.toPlainText().strip()
-        conclusion = self.comments_tab.conclusion_text.toPlainText().strip()
+    def showEvent(self, event):
+        super().showEvent(event)
+        # The saved session is only read the first time the tab is opened
+        if not self.session_restored:
+            self.session_restored = True
+            self.restore_session()
 
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>{title}</title>
-    <style>
-        body {{ font-family: Calibri, Arial, sans-serif; font-size: 12pt; margin: 40px; max-width: 1000px; }}
-        .header {{ background-color: #1976D2; color: white; padding: 20px; border-radius: 8px; }}
-        .header h1 {{ margin: 0; font-size: 24pt; }}
-        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-        th, td {{ border: 1px solid #B0BEC5; padding: 12px; text-align: left; }}
-        th {{ background-color: #1976D2; color: white; }}
-        h2 {{ color: #1976D2; font-size: 18pt; margin-top: 20px; }}
-        .status-passed {{ color: #388E3C; font-weight: bold; }}
-        .status-fail {{ color: #D32F2F; font-weight: bold; }}
-        .status-blocked {{ color: #FBC02D; font-weight: bold; }}
-        ul {{ margin: 10px 0; padding-left: 20px; }}
-        .footer {{ text-align: center; color: #616161; margin-top: 40px; padding-top: 20px; border-top: 1px solid #B0BEC5; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>{title}</h1>
-    </div>
-    <h2>Test Report Details</h2>
-    <p><b>Project Name & Version:</b> {project_name} {project_version}</p>
-    <p><b>Type of Test:</b> {test_type}</p>
-    <p><b>Browser:</b> {browser}</p>
-    <p><b>Change ID:</b> {change_id}</p>
-    <p><b>Environment:</b> {environment}</p>
-    <p><b>Start Date:</b> {start_date}</p>
-    <p><b>End Date:</b> {end_date}</p>
-    <p><b>Tester:</b> {tester}</p>
-    <p><b>Status:</b> <span class="status-{status.lower()}">{status}</span></p>
+    def restore_session(self):
+        try:
+            report = load_session()
+        except Exception as e:
+            print(f"Failed to load test report session: {e}")
+            return
+        if report is None:
+            return
+        self.details_tab.restore(report)
+        self.results_tab.restore_results(report.test_results)
+        self.results_tab.restore_issues(report.issues)
+        self.comments_tab.restore(report)
 
-    <h2>Summary</h2>
-    <p>The QA team tested <b>{project_name}</b> to ensure its functionality, reliability, and performance. This report summarizes the test results and any issues encountered during testing.</p>
+    def save_session(self):
+        # Never overwrite the stored session before it has been restored
+        if not self.session_restored:
+            return
+        try:
+            save_session(self.snapshot_report())
+        except Exception as e:
+            print(f"Failed to save test report session: {e}")
 
-    <h2>Test Cases</h2>
-    <p>No test cases provided.</p>
+    def save_run_as(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Save Test Run", "test_run.json.gz", "Test Runs (*.json.gz)")
+        if not path:
+            return
+        try:
+            save_session(self.snapshot_report(), path)
+            NotificationDialog("Test run saved!", "Success", parent=self).exec()
+        except Exception as e:
+            NotificationDialog(f"Failed to save test run:\n{e}", "Error", is_error=True, parent=self).exec()
 
-    <h2>Test Results</h2>
-    <table>
-        <thead>
-            <tr>
-                <th>No</th>
-                <th>Ticket ID</th>
-                <th>Type</th>
-                <th>Status</th>
-                <th>Priority</th>
-            </tr>
-        </thead>
-        <tbody>
-"""
-        for result in test_results:
-            type_color = {"Bug": "#EF5350", "Change Request": "#42A5F5", "Feature": "#66BB6A"}.get(result["type"], "#000000")
-            html_content += f"""
-            <tr>
-                <td>{result['no']}</td>
-                <td>{result['ticket_id']}</td>
-                <td style="color: {type_color};">{result['type']}</td>
-                <td>{result['status']}</td>
-                <td>{result['priority']}</td>
-            </tr>
-"""
-        html_content += """
-        </tbody>
-    </table>
+    def choose_baseline_run(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Compare With Test Run", "", "Test Runs (*.json.gz)")
+        if not path:
+            return
+        try:
+            baseline = load_session(path)
+            if baseline is None:
+                raise ValueError("Unsupported test run file.")
+        except Exception as e:
+            NotificationDialog(f"Failed to load test run:\n{e}", "Error", is_error=True, parent=self).exec()
+            return
+        self.baseline_report = baseline
+        self.baseline_name = os.path.basename(path)
+        self.results_tab.baseline_label.setText(f"Baseline Run: {self.baseline_name} ({len(baseline.test_results)} results)")
 
-    <h2>Issues Identified</h2>
-    <ul>
-"""
-        for issue in issues:
-            html_content += f"<li>{issue}</li>\n"
-        html_content += """
-    </ul>
+    def snapshot_report(self):
+        return TestReport(
+            **self.details_tab.snapshot(),
+            test_results=self.results_tab.results_snapshot(),
+            issues=list(self.results_tab.issues),
+            **self.comments_tab.snapshot()
+        )
 
-    <h2>Comments</h2>
-    <p><b>Notes:</b> {notes}</p>
-    <p><b>Remarks:</b> {recommendations}</p>
-    <p><b>Conclusion:</b> {conclusion}</p>
-    <div class="footer">
-        <p>Generated by Test Report Generator on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-    </div>
-</body>
-</html>
-"""
+    def generate_report(self):
+        with span("generate_report"):
+            report = self.snapshot_report()
+            if self.baseline_report is not None:
+                report.comparison = compare_runs(self.baseline_report.test_results, report.test_results, self.baseline_name)
+            html_content = render_report(report)
+            self.save_session()
         try:
-            with tempfile.NamedTemporaryFile('w', delete=False, suffix='.html') as f:
-                f.write(html_content)
-                webbrowser.open('file://' + os.path.realpath(f.name))
+            get_preview_server().show("report", html_content)
             NotificationDialog("Test report generated and opened in browser!", "Success", parent=self).exec()
         except Exception as e:
             NotificationDialog(f"Failed to generate report:\n{e}", "Error", is_error=True, parent=self).exec()
\ No newline at end of file
@@ -0,0 +1,231 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Column order of a test result row; "No" is not stored, it is the row position
+RESULT_FIELDS = ("ticket_id", "type", "status", "priority")
+
+TYPE_COLORS = {"Bug": "#EF5350", "Change Request": "#42A5F5", "Feature": "#66BB6A"}
+
+REPORT_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Calibri, Arial, sans-serif; font-size: 12pt; margin: 40px; max-width: 1000px; }}
+        .header {{ background-color: #1976D2; color: white; padding: 20px; border-radius: 8px; }}
+        .header h1 {{ margin: 0; font-size: 24pt; }}
+        table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
+        th, td {{ border: 1px solid #B0BEC5; padding: 12px; text-align: left; }}
+        th {{ background-color: #1976D2; color: white; }}
+        h2 {{ color: #1976D2; font-size: 18pt; margin-top: 20px; }}
+        .status-passed {{ color: #388E3C; font-weight: bold; }}
+        .status-fail {{ color: #D32F2F; font-weight: bold; }}
+        .status-blocked {{ color: #FBC02D; font-weight: bold; }}
+        ul {{ margin: 10px 0; padding-left: 20px; }}
+        .footer {{ text-align: center; color: #616161; margin-top: 40px; padding-top: 20px; border-top: 1px solid #B0BEC5; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{title}</h1>
+    </div>
+    <h2>Test Report Details</h2>
+    <p><b>Project Name & Version:</b> {project_name} {project_version}</p>
+    <p><b>Type of Test:</b> {test_type}</p>
+    <p><b>Browser:</b> {browser}</p>
+    <p><b>Change ID:</b> {change_id}</p>
+    <p><b>Environment:</b> {environment}</p>
+    <p><b>Start Date:</b> {start_date}</p>
+    <p><b>End Date:</b> {end_date}</p>
+    <p><b>Tester:</b> {tester}</p>
+    <p><b>Status:</b> <span class="status-{status_class}">{status}</span></p>
+
+    <h2>Summary</h2>
+    <p>The QA team tested <b>{project_name}</b> to ensure its functionality, reliability, and performance. This report summarizes the test results and any issues encountered during testing.</p>
+
+    <h2>Test Cases</h2>
+    <p>No test cases provided.</p>
+
+    <h2>Test Results</h2>
+    <table>
+        <thead>
+            <tr>
+                <th>No</th>
+                <th>Ticket ID</th>
+                <th>Type</th>
+                <th>Status</th>
+                <th>Priority</th>
+            </tr>
+        </thead>
+        <tbody>
+"""
+
+RESULT_ROW = """
+            <tr>
+                <td>{0}</td>
+                <td>{1}</td>
+                <td style="color: {5};">{2}</td>
+                <td>{3}</td>
+                <td>{4}</td>
+            </tr>
+"""
+
+ISSUES_HEAD = """
+        </tbody>
+    </table>
+
+    <h2>Issues Identified</h2>
+    <ul>
+"""
+
+REPORT_FOOT = """
+    </ul>
+
+    <h2>Comments</h2>
+    <p><b>Notes:</b> {notes}</p>
+    <p><b>Remarks:</b> {recommendations}</p>
+    <p><b>Conclusion:</b> {conclusion}</p>
+    <div class="footer">
+        <p>Generated by Test Report Generator on {generated_at}</p>
+    </div>
+</body>
+</html>
+"""
+
+COMPARISON_HEAD = """
+        </tbody>
+    </table>
+
+    <h2>Regression Comparison</h2>
+    <p><b>Baseline Run:</b> {baseline_name}</p>
+    <table>
+        <thead>
+            <tr>
+                <th>New Failures</th>
+                <th>Fixes</th>
+                <th>Flips</th>
+                <th>Added</th>
+                <th>Removed</th>
+                <th>Unchanged</th>
+            </tr>
+        </thead>
+        <tbody>
+            <tr>
+                <td>{new_failures}</td>
+                <td>{fixes}</td>
+                <td>{flips}</td>
+                <td>{added}</td>
+                <td>{removed}</td>
+                <td>{unchanged}</td>
+            </tr>
+"""
+
+COMPARISON_TABLE_HEAD = """
+        </tbody>
+    </table>
+
+    <h3>{heading}</h3>
+    <table>
+        <thead>
+            <tr>
+                <th>Ticket ID</th>
+                <th>Baseline Status</th>
+                <th>Current Status</th>
+            </tr>
+        </thead>
+        <tbody>
+"""
+
+COMPARISON_ROW = """
+            <tr>
+                <td>{0}</td>
+                <td>{1}</td>
+                <td>{2}</td>
+            </tr>
+"""
+
+# Number of result rows rendered into one chunk by iter_report_html
+ROWS_PER_CHUNK = 1000
+
+@dataclass
+class TestReport:
+    title: str = "Test Report"
+    project_name: str = ""
+    project_version: str = ""
+    test_type: str = ""
+    browser: str = "Chrome"
+    change_id: str = ""
+    environment: str = "DEV"
+    start_date: str = ""
+    end_date: str = ""
+    tester: str = ""
+    status: str = "Passed"
+    # Rows are (ticket_id, type, status, priority) tuples, see RESULT_FIELDS
+    test_results: list = field(default_factory=list)
+    issues: list = field(default_factory=list)
+    notes: str = ""
+    recommendations: str = ""
+    conclusion: str = ""
+    generated_at: datetime = field(default_factory=datetime.now)
+    # Optional RunComparison against a saved baseline run
+    comparison: object = None
+
+def iter_report_html(report):
+    yield REPORT_HEAD.format(
+        title=report.title,
+        project_name=report.project_name,
+        project_version=report.project_version,
+        test_type=report.test_type,
+        browser=report.browser,
+        change_id=report.change_id,
+        environment=report.environment,
+        start_date=report.start_date,
+        end_date=report.end_date,
+        tester=report.tester,
+        status=report.status,
+        status_class=report.status.lower()
+    )
+    row_format = RESULT_ROW.format
+    type_color = TYPE_COLORS.get
+    results = report.test_results
+    for start in range(0, len(results), ROWS_PER_CHUNK):
+        yield "".join(
+            row_format(no, ticket_id, result_type, status, priority, type_color(result_type, "#000000"))
+            for no, (ticket_id, result_type, status, priority) in enumerate(results[start:start + ROWS_PER_CHUNK], start + 1)
+        )
+    if report.comparison is not None:
+        yield from iter_comparison_html(report.comparison)
+    yield ISSUES_HEAD
+    yield "".join(f"<li>{issue}</li>\n" for issue in report.issues)
+    yield REPORT_FOOT.format(
+        notes=report.notes,
+        recommendations=report.recommendations,
+        conclusion=report.conclusion,
+        generated_at=report.generated_at.strftime('%Y-%m-%d %H:%M:%S')
+    )
+
+def iter_comparison_html(comparison):
+    yield COMPARISON_HEAD.format(
+        baseline_name=comparison.baseline_name,
+        new_failures=len(comparison.new_failures),
+        fixes=len(comparison.fixes),
+        flips=len(comparison.flips),
+        added=len(comparison.added),
+        removed=len(comparison.removed),
+        unchanged=comparison.unchanged
+    )
+    for heading, rows in [("New Failures", comparison.new_failures), ("Fixes", comparison.fixes),
+                          ("Flips", comparison.flips), ("Added", comparison.added), ("Removed", comparison.removed)]:
+        if not rows:
+            continue
+        yield COMPARISON_TABLE_HEAD.format(heading=heading)
+        for start in range(0, len(rows), ROWS_PER_CHUNK):
+            yield "".join(COMPARISON_ROW.format(*row) for row in rows[start:start + ROWS_PER_CHUNK])
+
+def write_report(report, stream):
+    for chunk in iter_report_html(report):
+        stream.write(chunk)
+
+def render_report(report):
+    return "".join(iter_report_html(report))
@@ -0,0 +1,97 @@
+from PySide6.QtWidgets import QStyledItemDelegate, QComboBox
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from test_report_generator.report import RESULT_FIELDS
+
+RESULT_HEADERS = ["No", "Ticket ID", "Type", "Status", "Priority"]
+TYPE_OPTIONS = ["Bug", "Change Request", "Feature"]
+PRIORITY_OPTIONS = ["High", "Medium", "Low"]
+
+# Values a fresh "Add Row" starts with, in RESULT_FIELDS order
+DEFAULT_RESULT_ROW = ("", TYPE_OPTIONS[0], "", PRIORITY_OPTIONS[0])
+
+class ResultsTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row is a list in RESULT_FIELDS order; the "No" column is derived from the row position
+        self.rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(RESULT_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if index.column() == 0:
+            return str(index.row() + 1)
+        return self.rows[index.row()][index.column() - 1]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole or index.column() == 0:
+            return False
+        self.rows[index.row()][index.column() - 1] = str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return RESULT_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def insert_rows(self, rows):
+        rows = [list(row) for row in rows]
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def add_row(self):
+        self.insert_rows([DEFAULT_RESULT_ROW])
+
+    def remove_row(self, row):
+        if not 0 <= row < len(self.rows):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        self.endRemoveRows()
+        # Rows below shift up, so their derived numbers change
+        if row < len(self.rows):
+            self.dataChanged.emit(self.index(row, 0), self.index(len(self.rows) - 1, 0), [Qt.DisplayRole])
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = [list(row) for row in rows]
+        self.endResetModel()
+
+    def snapshot(self):
+        return [tuple(row) for row in self.rows]
+
+class ComboBoxDelegate(QStyledItemDelegate):
+    def __init__(self, options, parent=None):
+        super().__init__(parent)
+        self.options = options
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.addItems(self.options)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+def result_column(field_name):
+    return RESULT_FIELDS.index(field_name) + 1
@@ -1,12 +1,23 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-                               QPushButton, QGroupBox, QComboBox, QTextEdit, QLabel)
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                               QHeaderView, QPushButton, QGroupBox, QTextEdit, QLabel, QFileDialog)
+from PySide6.QtCore import Qt, QThread, QTimer
+from test_report_generator.importers import ResultsImportWorker
+from test_report_generator.issues_model import IssuesTableModel
+from test_report_generator.session import SESSION_RESTORE_CHUNK_SIZE
+from test_report_generator.utils import NotificationDialog
+from test_report_generator.results_model import (ResultsTableModel, ComboBoxDelegate, TYPE_OPTIONS,
+                                                 PRIORITY_OPTIONS, result_column)
 
 class ResultsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.issues = []
+        self.import_thread = None
+        self.import_worker = None
+        self.pending_rows = []
+        self.pending_offset = 0
         self.setup_ui()
+        # Connected before TestReportGeneratorWidget.save_session, so the session is saved after the import stopped
+        QApplication.instance().aboutToQuit.connect(self.stop_import)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -38,16 +49,42 @@ class ResultsTab(QWidget):
         self.parent().animate_button(remove_row_btn)
         button_layout.addWidget(remove_row_btn)
 
+        self.import_btn = QPushButton("Import Results")
+        self.import_btn.setToolTip("Import test results from a CSV or JUnit/xUnit XML file")
+        self.import_btn.clicked.connect(self.import_results)
+        self.parent().animate_button(self.import_btn)
+        button_layout.addWidget(self.import_btn)
+
+        save_run_btn = QPushButton("Save Run...")
+        save_run_btn.setToolTip("Save the current results as a run for later comparison")
+        save_run_btn.clicked.connect(self.parent().save_run_as)
+        self.parent().animate_button(save_run_btn)
+        button_layout.addWidget(save_run_btn)
+
+        compare_btn = QPushButton("Compare With Run...")
+        compare_btn.setToolTip("Pick a saved run to compare against in the generated report")
+        compare_btn.clicked.connect(self.parent().choose_baseline_run)
+        self.parent().animate_button(compare_btn)
+        button_layout.addWidget(compare_btn)
+
         button_layout.addStretch()
         results_layout.addLayout(button_layout)
 
-        self.results_table = QTableWidget()
-        self.results_table.setRowCount(0)
-        self.results_table.setColumnCount(5)
-        self.results_table.setHorizontalHeaderLabels(["No", "Ticket ID", "Type", "Status", "Priority"])
+        self.baseline_label = QLabel("Baseline Run: none")
+        results_layout.addWidget(self.baseline_label)
+
+        # Combo editors are created by the delegates only while a cell is being edited
+        self.results_model = ResultsTableModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setItemDelegateForColumn(result_column("type"), ComboBoxDelegate(TYPE_OPTIONS, self.results_table))
+        self.results_table.setItemDelegateForColumn(result_column("priority"), ComboBoxDelegate(PRIORITY_OPTIONS, self.results_table))
+        self.results_table.setEditTriggers(QTableView.DoubleClicked | QTableView.SelectedClicked | QTableView.EditKeyPressed | QTableView.AnyKeyPressed)
+        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.results_table.verticalHeader().hide()
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setSelectionMode(QTableView.SingleSelection)
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
         self.results_table.setMinimumHeight(150)
         results_layout.addWidget(self.results_table)
 
@@ -74,17 +111,20 @@ class ResultsTab(QWidget):
         button_layout2.addStretch()
         issues_layout.addLayout(button_layout2)
 
-        self.issues_list = QTableWidget()
-        self.issues_list.setRowCount(0)
-        self.issues_list.setColumnCount(2)
-        self.issues_list.setHorizontalHeaderLabels(["No", "Issue"])
+        self.issues_model = IssuesTableModel(self)
+        self.issues_list = QTableView()
+        self.issues_list.setModel(self.issues_model)
+        self.issues_list.horizontalHeader().setStretchLastSection(True)
+        self.issues_list.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.issues_list.verticalHeader().hide()
         self.issues_list.setAlternatingRowColors(True)
-        self.issues_list.setSelectionMode(QTableWidget.SingleSelection)
-        self.issues_list.setSelectionBehavior(QTableWidget.SelectRows)
+        self.issues_list.setSelectionMode(QTableView.SingleSelection)
+        self.issues_list.setSelectionBehavior(QTableView.SelectRows)
         self.issues_list.setMinimumHeight(150)
         issues_layout.addWidget(self.issues_list)
 
         layout.addWidget(results_frame)
+        layout.addWidget(issues_frame)
         layout.addStretch()
 
         # Next Button
@@ -103,43 +143,91 @@ class ResultsTab(QWidget):
             print("Error: Could not find tab_widget for navigation")
 
     def add_row(self):
-        row_position = self.results_table.rowCount()
-        self.results_table.insertRow(row_position)
-
-        self.results_table.setItem(row_position, 0, QTableWidgetItem(str(row_position + 1)))
-        self.results_table.setItem(row_position, 1, QTableWidgetItem(""))
-        type_combo = QComboBox()
-        type_combo.addItems(["Bug", "Change Request", "Feature"])
-        self.results_table.setCellWidget(row_position, 2, type_combo)
-        self.results_table.setItem(row_position, 3, QTableWidgetItem(""))
-        priority_combo = QComboBox()
-        priority_combo.addItems(["High", "Medium", "Low"])
-        self.results_table.setCellWidget(row_position, 4, priority_combo)
+        self.results_model.add_row()
+
+    def add_rows(self, rows):
+        self.results_model.insert_rows(rows)
 
     def remove_row(self):
-        current_row = self.results_table.currentRow()
+        current_row = self.results_table.currentIndex().row()
         if current_row >= 0:
-            self.results_table.removeRow(current_row)
-            for row in range(self.results_table.rowCount()):
-                self.results_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
+            self.results_model.remove_row(current_row)
+
+    def results_snapshot(self):
+        # Rows of a session that is still being restored are included as well
+        return self.results_model.snapshot() + [tuple(row) for row in self.pending_rows[self.pending_offset:]]
+
+    def restore_results(self, rows):
+        self.results_model.set_rows([])
+        self.pending_rows = rows
+        self.pending_offset = 0
+        self.restore_next_chunk()
+
+    def restore_next_chunk(self):
+        end = self.pending_offset + SESSION_RESTORE_CHUNK_SIZE
+        self.results_model.insert_rows(self.pending_rows[self.pending_offset:end])
+        self.pending_offset = end
+        if end < len(self.pending_rows):
+            QTimer.singleShot(0, self.restore_next_chunk)
+        else:
+            self.pending_rows = []
+            self.pending_offset = 0
+
+    @property
+    def issues(self):
+        return self.issues_model.issues
+
+    def restore_issues(self, issues):
+        self.issues_model.set_issues(issues)
+
+    def import_results(self):
+        if self.import_thread is not None:
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Import Test Results", "", "Test Results (*.csv *.xml);;CSV Files (*.csv);;JUnit XML (*.xml)")
+        if path:
+            self.start_import(path)
+
+    def start_import(self, path):
+        # Parsing runs on a worker thread; rows arrive here in chunks through queued signals
+        self.import_btn.setEnabled(False)
+        self.import_thread = QThread(self)
+        self.import_worker = ResultsImportWorker(path)
+        self.import_worker.moveToThread(self.import_thread)
+        self.import_thread.started.connect(self.import_worker.run)
+        self.import_worker.rows_ready.connect(self.add_rows)
+        self.import_worker.finished.connect(self.on_import_finished)
+        self.import_worker.failed.connect(self.on_import_failed)
+        self.import_thread.start()
+
+    def stop_import(self):
+        if self.import_thread is None:
+            return
+        self.import_worker.cancel()
+        self.import_thread.quit()
+        self.import_thread.wait()
+        self.import_worker.deleteLater()
+        self.import_thread.deleteLater()
+        self.import_thread = None
+        self.import_worker = None
+        self.import_btn.setEnabled(True)
+
+    def on_import_finished(self, count):
+        self.stop_import()
+        NotificationDialog(f"Imported {count} test results.", "Success", parent=self).exec()
+
+    def on_import_failed(self, message):
+        self.stop_import()
+        NotificationDialog(f"Failed to import test results:\n{message}", "Error", is_error=True, parent=self).exec()
 
     def add_issue(self):
-        issue_text = self.issues_text.toPlainText().strip()
-        if issue_text:
-            for issue in issue_text.split('\n'):
-                issue = issue.strip()
-                if issue:
-                    self.issues.append(issue)
-                    row_position = self.issues_list.rowCount()
-                    self.issues_list.insertRow(row_position)
-                    self.issues_list.setItem(row_position, 0, QTableWidgetItem(str(row_position + 1)))
-                    self.issues_list.setItem(row_position, 1, QTableWidgetItem(issue))
-            self.issues_text.clear()
+        lines = self.issues_text.toPlainText().splitlines()
+        added = self.issues_model.add_issues(lines)
+        self.issues_text.clear()
+        skipped = sum(1 for line in lines if line.strip()) - added
+        if skipped:
+            NotificationDialog(f"Skipped {skipped} duplicate issue(s).", "Info", parent=self).exec()
 
     def remove_issue(self):
-        current_row = self.issues_list.currentRow()
+        current_row = self.issues_list.currentIndex().row()
         if current_row >= 0:
-            self.issues.pop(current_row)
-            self.issues_list.removeRow(current_row)
-            for row in range(self.issues_list.rowCount()):
-                self.issues_list.setItem(row, 0, QTableWidgetItem(str(row + 1)))
\ No newline at end of file
+            self.issues_model.remove_issue(current_row)
\ No newline at end of file
@@ -0,0 +1,47 @@
+import gzip
+import json
+import os
+from dataclasses import fields
+from test_report_generator.report import TestReport
+
+SESSION_VERSION = 1
+
+# Saved next to the Daily Status Mail files in the Json directory
+DEFAULT_SESSION_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Json", "test_report_session.json.gz")
+
+# Result rows added to the table per event loop pass while a session is restored
+SESSION_RESTORE_CHUNK_SIZE = 5000
+
+_TEXT_FIELDS = [f.name for f in fields(TestReport) if f.name not in ("test_results", "issues", "generated_at", "comparison")]
+
+def report_to_dict(report):
+    data = {name: getattr(report, name) for name in _TEXT_FIELDS}
+    data["version"] = SESSION_VERSION
+    data["test_results"] = [list(row) for row in report.test_results]
+    data["issues"] = list(report.issues)
+    return data
+
+def report_from_dict(data):
+    values = {name: data[name] for name in _TEXT_FIELDS if name in data}
+    return TestReport(
+        **values,
+        test_results=[tuple(row) for row in data.get("test_results", [])],
+        issues=list(data.get("issues", []))
+    )
+
+def save_session(report, path=DEFAULT_SESSION_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    payload = json.dumps(report_to_dict(report), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    temp_path = path + ".tmp"
+    with gzip.open(temp_path, "wb", compresslevel=1) as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+
+def load_session(path=DEFAULT_SESSION_PATH):
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, "rb") as f:
+        data = json.loads(f.read())
+    if data.get("version") != SESSION_VERSION:
+        return None
+    return report_from_dict(data)
@@ -1,15 +1,16 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QFormLayout,
                                QGroupBox, QListWidget, QMessageBox)
 from PySide6.QtCore import Qt
-import json
+from option_group import ListOptionGroup
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Test Report Settings")
-        self.browsers = self.parent().config.get("browsers", ["Chrome", "Firefox", "Edge", "Safari"])
-        self.environments = self.parent().config.get("environments", ["DEV", "QA", "UAT", "PROD"])
-        self.statuses = self.parent().config.get("statuses", ["Passed", "Fail", "Blocked"])
+        settings = self.parent().report_settings()
+        self.browsers = settings["browsers"]
+        self.environments = settings["environments"]
+        self.statuses = settings["statuses"]
         self.setup_ui()
 
     def setup_ui(self):
@@ -50,8 +51,7 @@ class SettingsDialog(QDialog):
         browsers_layout = QVBoxLayout(browsers_frame)
 
         self.browser_list = QListWidget()
-        for browser in self.browsers:
-            self.browser_list.addItem(browser)
+        self.browser_options = ListOptionGroup(self.browser_list, self.browsers, self)
         browsers_layout.addWidget(self.browser_list)
 
         browser_input_layout = QHBoxLayout()
@@ -72,8 +72,7 @@ class SettingsDialog(QDialog):
         env_layout = QVBoxLayout(env_frame)
 
         self.env_list = QListWidget()
-        for env in self.environments:
-            self.env_list.addItem(env)
+        self.env_options = ListOptionGroup(self.env_list, self.environments, self)
         env_layout.addWidget(self.env_list)
 
         env_input_layout = QHBoxLayout()
@@ -94,8 +93,7 @@ class SettingsDialog(QDialog):
         status_layout = QVBoxLayout(status_frame)
 
         self.status_list = QListWidget()
-        for status in self.statuses:
-            self.status_list.addItem(status)
+        self.status_options = ListOptionGroup(self.status_list, self.statuses, self)
         status_layout.addWidget(self.status_list)
 
         status_input_layout = QHBoxLayout()
@@ -137,85 +135,68 @@ class SettingsDialog(QDialog):
         if not browser:
             QMessageBox.warning(self, "Input Error", "Browser name is required.")
             return
-        if browser in self.browsers:
+        if browser in self.browser_options:
             QMessageBox.warning(self, "Duplicate", "Browser already exists.")
             return
-        self.browsers.append(browser)
-        self.browser_list.addItem(browser)
+        self.browser_options.add(browser)
         self.new_browser_entry.clear()
 
     def remove_browser(self):
-        current = self.browser_list.currentItem()
-        if not current:
+        current = self.browser_options.current()
+        if current is None:
             QMessageBox.warning(self, "Selection Error", "Please select a browser to remove.")
             return
-        browser = current.text()
-        self.browsers.remove(browser)
-        row = self.browser_list.row(current)
-        self.browser_list.takeItem(row)
+        self.browser_options.remove(current)
 
     def add_environment(self):
         env = self.new_env_entry.text().strip()
         if not env:
             QMessageBox.warning(self, "Input Error", "Environment name is required.")
             return
-        if env in self.environments:
+        if env in self.env_options:
             QMessageBox.warning(self, "Duplicate", "Environment already exists.")
             return
-        self.environments.append(env)
-        self.env_list.addItem(env)
+        self.env_options.add(env)
         self.new_env_entry.clear()
 
     def remove_environment(self):
-        current = self.env_list.currentItem()
-        if not current:
+        current = self.env_options.current()
+        if current is None:
             QMessageBox.warning(self, "Selection Error", "Please select an environment to remove.")
             return
-        env = current.text()
-        self.environments.remove(env)
-        row = self.env_list.row(current)
-        self.env_list.takeItem(row)
+        self.env_options.remove(current)
 
     def add_status(self):
         status = self.new_status_entry.text().strip()
         if not status:
             QMessageBox.warning(self, "Input Error", "Status name is required.")
             return
-        if status in self.statuses:
+        if status in self.status_options:
             QMessageBox.warning(self, "Duplicate", "Status already exists.")
             return
-        self.statuses.append(status)
-        self.status_list.addItem(status)
+        self.status_options.add(status)
         self.new_status_entry.clear()
 
     def remove_status(self):
-        current = self.status_list.currentItem()
-        if not current:
+        current = self.status_options.current()
+        if current is None:
             QMessageBox.warning(self, "Selection Error", "Please select a status to remove.")
             return
-        status = current.text()
-        self.statuses.remove(status)
-        row = self.status_list.row(current)
-        self.status_list.takeItem(row)
+        self.status_options.remove(current)
 
     def save(self):
-        settings = self.parent().settings if hasattr(self.parent(), 'settings') else None
-        if settings:
-            settings.beginGroup("Configuration")
-            settings.setValue("browsers", json.dumps(self.browsers))
-            settings.setValue("environments", json.dumps(self.environments))
-            settings.setValue("statuses", json.dumps(self.statuses))
-            settings.setValue("default_project", self.default_project_entry.text().strip())
-            settings.setValue("default_version", self.default_version_entry.text().strip())
-            settings.setValue("default_tester", self.default_tester_entry.text().strip())
-            settings.endGroup()
+        self.parent().settings.update_section("test_report", {
+            "browsers": self.browser_options.options(),
+            "environments": self.env_options.options(),
+            "statuses": self.status_options.options(),
+            "default_project": self.default_project_entry.text().strip(),
+            "default_version": self.default_version_entry.text().strip(),
+            "default_tester": self.default_tester_entry.text().strip()
+        })
         self.accept()
 
     def load_settings(self):
-        settings = self.parent().settings if hasattr(self.parent(), 'settings') else None
-        if settings:
-            settings.beginGroup("Configuration")
-            self.default_project_entry.setText(settings.value("default_project", ""))
-            self.default_version_entry.setText(settings.value("default_version", ""))
-            self.default_tester_entry.setText(settings.value("default_tester", ""))
-            settings.endGroup()
\ No newline at end of file
+        settings = self.parent().report_settings()
+        self.default_project_entry.setText(settings["default_project"])
+        self.default_version_entry.setText(settings["default_version"])
+        self.default_tester_entry.setText(settings["default_tester"])
@@ -0,0 +1,85 @@
+import os
+from datetime import datetime
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QTableWidget, QTableWidgetItem,
+                               QHeaderView, QFileDialog, QMessageBox)
+from PySide6.QtCore import Qt, QTimer
+from config_schema import DEFAULT_PERSISTENT_DIR
+from tracing import tracer
+
+TIMING_COLUMNS = ["Span", "Calls", "Total ms", "Mean ms", "Max ms"]
+REFRESH_MS = 1000
+
+class TimingPanel(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Timings")
+        self.resize(560, 380)
+        layout = QVBoxLayout(self)
+
+        self.enabled_check = QCheckBox("Record spans")
+        self.enabled_check.setChecked(tracer.enabled)
+        self.enabled_check.toggled.connect(self.set_enabled)
+        layout.addWidget(self.enabled_check)
+
+        self.table = QTableWidget(0, len(TIMING_COLUMNS))
+        self.table.setHorizontalHeaderLabels(TIMING_COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        button_layout = QHBoxLayout()
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        export_button = QPushButton("Export Chrome Trace...")
+        export_button.clicked.connect(self.export_trace)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        button_layout.addWidget(clear_button)
+        button_layout.addWidget(export_button)
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+        # Only refreshes while the panel is open
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def set_enabled(self, enabled):
+        tracer.enabled = enabled
+
+    def clear(self):
+        tracer.clear()
+        self.refresh()
+
+    def refresh(self):
+        summary = tracer.summary()
+        self.table.setRowCount(len(summary))
+        for row, (name, (count, total, longest)) in enumerate(summary):
+            values = [name, str(count), f"{total / 1000:.1f}", f"{total / count / 1000:.2f}", f"{longest / 1000:.1f}"]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def export_trace(self):
+        default_path = os.path.join(DEFAULT_PERSISTENT_DIR, f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        path, _ = QFileDialog.getSaveFileName(self, "Export Chrome Trace", default_path, "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            tracer.export_chrome_trace(path)
+            QMessageBox.information(self, "Success", f"Trace exported to {path}.\nOpen it in chrome://tracing or ui.perfetto.dev.")
+        except Exception as e:
+            QMessageBox.critical(self, "Export Error", f"Failed to export trace:\n{e}")
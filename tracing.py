@@ -0,0 +1,82 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Set EOD_TRACE=1 to record spans from startup; otherwise they are switched on from the timing panel
+TRACE_ENV = "EOD_TRACE"
+# Oldest spans are dropped past this many
+MAX_SPANS = 50000
+
+class Tracer:
+    def __init__(self, enabled=False, max_spans=MAX_SPANS):
+        self.enabled = enabled
+        self.spans = deque(maxlen=max_spans)
+        self.origin_ns = time.perf_counter_ns()
+
+    def record(self, name, start_ns, end_ns, args=None):
+        # (name, start_us, duration_us, thread id, args) relative to when the tracer was created
+        self.spans.append((name, (start_ns - self.origin_ns) // 1000, (end_ns - start_ns) // 1000, threading.get_ident(), args))
+
+    def clear(self):
+        self.spans.clear()
+
+    def summary(self):
+        # name -> [count, total_us, max_us], slowest total first
+        totals = {}
+        for name, _, duration, _, _ in list(self.spans):
+            entry = totals.setdefault(name, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] = max(entry[2], duration)
+        return sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        events = [{"name": name, "ph": "X", "ts": start, "dur": duration, "pid": pid, "tid": tid, "args": args or {}}
+                  for name, start, duration, tid, args in list(self.spans)]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        # Opens in chrome://tracing or https://ui.perfetto.dev
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+tracer = Tracer(enabled=os.environ.get(TRACE_ENV, "") not in ("", "0"))
+
+class span:
+    __slots__ = ("name", "args", "start_ns")
+
+    def __init__(self, name, **args):
+        self.name = name
+        self.args = args
+        self.start_ns = 0
+
+    def __enter__(self):
+        if tracer.enabled:
+            self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self.start_ns:
+            tracer.record(self.name, self.start_ns, time.perf_counter_ns(), self.args or None)
+        return False
+
+def traced(name=None):
+    # Disabled, the wrapper costs one attribute check on top of the call
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start_ns = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.record(label, start_ns, time.perf_counter_ns())
+        return wrapper
+    return decorate